@@ -19,35 +19,46 @@ Notes
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from math import ceil, floor
 from pathlib import Path
 from typing import TYPE_CHECKING, TypeAlias
 import warnings
 
 import lazy_loader as lazy
 
+from . import cache as gvcache
+from . import common as gvcommon
 from .common import (
+    GV_FIELD_LONLATS,
     GV_FIELD_NAME,
     GV_FIELD_RADIUS,
     GV_FIELD_ZSCALE,
+    GV_LONLATS,
     RADIUS,
     ZLEVEL_SCALE,
     cast_UnstructuredGrid_to_PolyData,
+    geometry_dtype,
     nan_mask,
+    set_lonlats,
     to_cartesian,
     wrap,
 )
-from .crs import WGS84, CRSLike, to_wkt
+from .crs import WGS84, CRSLike, get_crs, to_wkt
 from .transform import transform_points
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     import numpy as np
-    from numpy.typing import ArrayLike
+    from numpy.typing import ArrayLike, DTypeLike
     import pyvista as pv
+    from rasterio.io import DatasetReader
+    from rasterio.windows import Window
 
 # lazy import third-party dependencies
 np = lazy.load("numpy")
 pv = lazy.load("pyvista")
-pyproj = lazy.load("pyproj")
 rio = lazy.load("rasterio")
 
 __all__ = [
@@ -55,12 +66,16 @@ __all__ = [
     "NAME_CELLS",
     "NAME_POINTS",
     "RIO_SIEVE_SIZE",
+    "Bounds",
     "PathLike",
     "Shape",
     "Transform",
 ]
 
 # this is a type alias
+Bounds: TypeAlias = tuple[float, float, float, float]
+"""Type alias for a ``(left, bottom, right, top)`` bounding-box."""
+
 PathLike: TypeAlias = str | Path
 """Type alias for an asset file path."""
 
@@ -324,6 +339,44 @@ class Transform:  # numpydoc ignore=PR01
 
         return np.arange(npts, dtype=np.uint32).reshape(-1, 4)
 
+    @staticmethod
+    def _create_cells(offsets: np.ndarray, connectivity: np.ndarray) -> pv.CellArray:
+        """Create a VTK cell array from face offsets and flat connectivity.
+
+        The arrays are shared with VTK without copying, rather than being
+        serialized into the legacy padded ``(N, V0, V1, ..., VN)`` face format.
+
+        Parameters
+        ----------
+        offsets : ndarray
+            The 1-D ``(M+1,)`` offsets into the `connectivity` of each of the
+            ``M`` faces, where the last offset is the size of the `connectivity`.
+        connectivity : ndarray
+            The 1-D zero-based face-to-node indices for all the faces.
+
+        Returns
+        -------
+        CellArray
+            The cell array referencing the `offsets` and `connectivity`.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        vtk_offsets = pv.numpy_to_idarr(offsets)
+        vtk_connectivity = pv.numpy_to_idarr(connectivity)
+
+        cells = pv.CellArray()
+        cells.SetData(vtk_offsets, vtk_connectivity)
+
+        # the vtk cell array does not take ownership of the shallow arrays,
+        # so retain references to avoid a memory corruption within vtk
+        cells._gv_offsets = vtk_offsets  # noqa: SLF001
+        cells._gv_connectivity = vtk_connectivity  # noqa: SLF001
+
+        return cells
+
     @staticmethod
     def _verify_2d(xs: ArrayLike, ys: ArrayLike) -> None:
         """Ensure compatible quad-mesh dimensionality and shape.
@@ -401,6 +454,35 @@ class Transform:  # numpydoc ignore=PR01
             )
             raise ValueError(emsg)
 
+    @staticmethod
+    def _verify_decimate(decimate: int | None) -> int:
+        """Ensure a valid resolution decimation factor.
+
+        Parameters
+        ----------
+        decimate : int, optional
+            The factor to reduce the resolution of the data. Defaults to ``1``
+            i.e., no decimation.
+
+        Returns
+        -------
+        int
+            The decimation factor.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        if decimate is None:
+            decimate = 1
+
+        if int(decimate) != decimate or decimate < 1:
+            emsg = f"Require a positive integer decimation factor, got '{decimate}'."
+            raise ValueError(emsg)
+
+        return int(decimate)
+
     @classmethod
     def from_1d(
         cls,
@@ -414,6 +496,7 @@ class Transform:  # numpydoc ignore=PR01
         zlevel: int | None = None,
         zscale: float | None = None,
         clean: bool | None = None,
+        dtype: DTypeLike | None = None,
     ) -> pv.PolyData:
         """Build a quad-faced mesh from contiguous 1-D x-values and y-values.
 
@@ -466,6 +549,9 @@ class Transform:  # numpydoc ignore=PR01
             and/or remove degenerate cells in the resultant mesh. See
             :meth:`pyvista.PolyDataFilters.clean`. Defaults to
             :data:`BRIDGE_CLEAN`.
+        dtype : DTypeLike, optional
+            The floating point precision of the mesh points, either ``float32``
+            or ``float64``. Defaults to :data:`~geovista.common.GEOMETRY_DTYPE`.
 
         Returns
         -------
@@ -490,6 +576,7 @@ class Transform:  # numpydoc ignore=PR01
             zscale=zscale,
             clean=clean,
             rgb=rgb,
+            dtype=dtype,
         )
 
     @classmethod
@@ -505,6 +592,7 @@ class Transform:  # numpydoc ignore=PR01
         zlevel: int | None = None,
         zscale: float | None = None,
         clean: bool | None = None,
+        dtype: DTypeLike | None = None,
     ) -> pv.PolyData:
         """Build a quad-faced mesh from 2-D x-values and y-values.
 
@@ -558,6 +646,9 @@ class Transform:  # numpydoc ignore=PR01
             and/or remove degenerate cells in the resultant mesh. See
             :meth:`pyvista.PolyDataFilters.clean`. Defaults to
             :data:`BRIDGE_CLEAN`.
+        dtype : DTypeLike, optional
+            The floating point precision of the mesh points, either ``float32``
+            or ``float64``. Defaults to :data:`~geovista.common.GEOMETRY_DTYPE`.
 
         Returns
         -------
@@ -602,6 +693,7 @@ class Transform:  # numpydoc ignore=PR01
             zscale=zscale,
             clean=clean,
             rgb=rgb,
+            dtype=dtype,
         )
 
     @classmethod
@@ -616,6 +708,7 @@ class Transform:  # numpydoc ignore=PR01
         zlevel: int | ArrayLike | None = None,
         zscale: float | None = None,
         clean: bool | None = None,
+        dtype: DTypeLike | None = None,
     ) -> pv.PolyData:
         """Build a point-cloud mesh from x-values, y-values and z-levels.
 
@@ -655,6 +748,9 @@ class Transform:  # numpydoc ignore=PR01
             Specify whether to merge duplicate points. See
             :meth:`pyvista.PolyDataFilters.clean`. Defaults to
             :data:`BRIDGE_CLEAN`.
+        dtype : DTypeLike, optional
+            The floating point precision of the mesh points, either ``float32``
+            or ``float64``. Defaults to :data:`~geovista.common.GEOMETRY_DTYPE`.
 
         Returns
         -------
@@ -670,7 +766,7 @@ class Transform:  # numpydoc ignore=PR01
         zscale = ZLEVEL_SCALE if zscale is None else float(zscale)
 
         if crs is not None:
-            crs = pyproj.CRS.from_user_input(crs)
+            crs = get_crs(crs)
 
             if crs != WGS84:
                 transformed = transform_points(src_crs=crs, tgt_crs=WGS84, xs=xs, ys=ys)
@@ -685,7 +781,9 @@ class Transform:  # numpydoc ignore=PR01
             xs[poles] = 0
 
         # convert lat/lon to cartesian xyz
-        xyz = to_cartesian(xs, ys, radius=radius, zlevel=zlevel, zscale=zscale)
+        xyz = to_cartesian(
+            xs, ys, radius=radius, zlevel=zlevel, zscale=zscale, dtype=dtype
+        )
 
         # create the point-cloud mesh
         mesh = pv.PolyData(xyz)
@@ -697,6 +795,9 @@ class Transform:  # numpydoc ignore=PR01
         mesh.field_data[GV_FIELD_RADIUS] = np.array([radius])
         mesh.field_data[GV_FIELD_ZSCALE] = np.array([zscale])
 
+        if gvcommon.GEOVISTA_LONLAT_CACHE:
+            set_lonlats(mesh, xs, ys, zlevel=zlevel)
+
         # attach any optional data to the mesh
         if data is not None:
             data = cls._as_compatible_data(data, mesh.n_points, mesh.n_cells)
@@ -714,96 +815,197 @@ class Transform:  # numpydoc ignore=PR01
         return mesh
 
     @classmethod
-    def from_tiff(
+    def from_volume(
         cls,
-        fname: PathLike,
+        xs: ArrayLike,
+        ys: ArrayLike,
+        zlevel: ArrayLike,
+        data: ArrayLike | None = None,
         name: str | None = None,
-        band: int = 1,
-        rgb: bool | None = False,
-        sieve: bool | None = False,
-        size: int | None = None,
-        extract: bool | None = False,
+        crs: CRSLike | None = None,
         radius: float | None = None,
-        zlevel: int | None = None,
         zscale: float | None = None,
+        decimate: int | None = None,
         clean: bool | None = None,
+        dtype: DTypeLike | None = None,
     ) -> pv.PolyData:
-        """Build a quad-faced mesh from the GeoTIFF.
+        """Build a point-cloud mesh from a structured volume of z-levels.
 
-        Note that, the GeoTIFF data will be located on the ``points``
-        of the resultant mesh.
+        The horizontal `xs` and `ys` are shared by each z-level of the volume,
+        and are only converted to cartesian directions once, which are then
+        scaled for each z-level. The points of the mesh are ordered by z-level,
+        then by the horizontal points, i.e., the C-order of a ``(Z, ...)``
+        volume.
 
         Parameters
         ----------
-        fname : PathLike
-            The file path to the GeoTIFF.
+        xs : ArrayLike
+            A 1-D or 2-D array of the horizontal x-values, in canonical `crs`
+            units. Must have the same shape as the `ys`.
+        ys : ArrayLike
+            A 1-D or 2-D array of the horizontal y-values, in canonical `crs`
+            units. Must have the same shape as the `xs`.
+        zlevel : ArrayLike
+            Either a 1-D array of the ``Z`` z-levels shared by each horizontal
+            point, or an array of the z-levels of each point of the volume,
+            with the shape of the `xs` prefixed by ``Z``. Used in combination
+            with the `zscale` to offset the `radius` by a proportional amount
+            i.e., ``radius * zlevel * zscale``.
+        data : ArrayLike, optional
+            Data to be optionally attached to the mesh points of the volume.
+            Either with the shape of the volume, or its flattened equivalent.
         name : str, optional
-            The name of the GeoTIFF data array to be attached to the mesh.
-            Defaults to :data:`NAME_POINTS`. Note that, ``{units}`` may be
-            used as a placeholder for the units of the data array e.g.,
-            ``"Elevation / {units}"``.
-        band : int, default=1
-            The band index to read from the GeoTIFF. Note that, the `band`
-            index is one-based.
-        rgb : bool, default=False
-            Specify whether to read the GeoTIFF as an ``RGB`` or ``RGBA`` image.
-            When ``rgb=True``, the `band` index is ignored.
-        sieve : bool, default=False
-            Specify whether to sieve the GeoTIFF mask to remove small connected
-            regions. See :func:`rasterio.features.sieve` for more information.
-        size : int, optional
-            The size of the `sieve` filter. Defaults to :data:`RIO_SIEVE_SIZE`.
-        extract : bool, default=False
-            Specify whether to extract cells from the mesh with no masked points.
+            The name of the optional data array to be attached to the mesh. If `data`
+            is provided but with no `name`, defaults to :data:`NAME_POINTS`.
+        crs : CRSLike, optional
+            The Coordinate Reference System of the provided `xs` and `ys`. May
+            be anything accepted by :meth:`pyproj.crs.CRS.from_user_input`. Defaults
+            to ``EPSG:4326`` i.e., ``WGS 84``.
         radius : float, optional
-            The radius of the mesh sphere. Defaults to :data:`~geovista.common.RADIUS`.
-        zlevel : int, default=0
-            The z-axis level. Used in combination with the `zscale` to offset the
-            `radius` by a proportional amount i.e., ``radius * zlevel * zscale``.
+            The radius of the mesh point-cloud. Defaults to
+            :data:`~geovista.common.RADIUS`.
         zscale : float, optional
             The proportional multiplier for z-axis `zlevel`. Defaults to
             :data:`~geovista.common.ZLEVEL_SCALE`.
+        decimate : int, optional
+            The stride of the z-levels of the volume i.e., only every
+            `decimate` z-level is included in the mesh. Defaults to ``1``
+            i.e., no decimation.
         clean : bool, optional
-            Specify whether to merge duplicate points, remove unused points,
-            and/or remove degenerate cells in the resultant mesh. See
+            Specify whether to merge duplicate points. See
             :meth:`pyvista.PolyDataFilters.clean`. Defaults to
             :data:`BRIDGE_CLEAN`.
+        dtype : DTypeLike, optional
+            The floating point precision of the mesh points, either ``float32``
+            or ``float64``. Defaults to :data:`~geovista.common.GEOMETRY_DTYPE`.
 
         Returns
         -------
         PolyData
-            The GeoTIFF spherical mesh.
+            The point-cloud spherical mesh.
 
         Notes
         -----
-        .. versionadded:: 0.5.0
+        .. versionadded:: 0.6.0
 
-        .. attention:: Optional package dependency :mod:`rasterio` is required.
+        """
+        xs, ys = np.asanyarray(xs), np.asanyarray(ys)
 
-        Examples
-        --------
-        >>> from geovista import GeoPlotter, Transform
-        >>> from geovista.pantry import fetch_raster
-        >>> from geovista.pantry.textures import natural_earth_1
+        if xs.shape != ys.shape or xs.ndim not in (1, 2):
+            emsg = (
+                "Require 1-D or 2-D horizontal xs and ys with the same shape, "
+                f"got {xs.shape} and {ys.shape} respectively."
+            )
+            raise ValueError(emsg)
 
-        Render the GeoTIFF ``RGB`` image as a geolocated mesh.
+        zlevel = np.asanyarray(zlevel)
 
-        First, :func:`rasterio.features.sieve` the GeoTIFF image to remove several
-        unwanted masked regions within the interior of the image, due to a lack of
-        dynamic range in the ``uint8`` image data. Then, extract the mesh to remove
-        cells with no masked points.
+        if zlevel.ndim <= 1:
+            zlevel = zlevel.reshape(-1, *(1,) * xs.ndim)
+        elif zlevel.shape[1:] != xs.shape:
+            emsg = (
+                f"Require 1-D z-levels or {xs.ndim + 1}-D z-levels with trailing "
+                f"shape {xs.shape}, got {zlevel.shape}."
+            )
+            raise ValueError(emsg)
 
-        >>> fname = fetch_raster("bahamas_rgb.tif")
-        >>> mesh = Transform.from_tiff(fname, rgb=True, sieve=True, extract=True)
+        decimate = cls._verify_decimate(decimate)
+        radius = RADIUS if radius is None else abs(float(radius))
+        zscale = ZLEVEL_SCALE if zscale is None else float(zscale)
+        shape = (zlevel.shape[0], *xs.shape)
 
-        Now render the result:
+        if crs is not None:
+            crs = get_crs(crs)
 
-        >>> p = GeoPlotter()
-        >>> _ = p.add_mesh(mesh, rgb=True)
-        >>> p.view_poi()
-        >>> _ = p.add_base_layer(texture=natural_earth_1(), zlevel=0)
-        >>> _ = p.add_coastlines(color="white")
-        >>> p.show()
+            if crs != WGS84:
+                transformed = transform_points(src_crs=crs, tgt_crs=WGS84, xs=xs, ys=ys)
+                # the transformed points have the shape of the 1-D or 2-D input
+                xs = transformed[..., 0].reshape(ys.shape)
+                ys = transformed[..., 1].reshape(ys.shape)
+
+        # ensure longitudes (degrees) are in half-closed interval [-180, 180)
+        xs = np.asanyarray(wrap(xs)).reshape(ys.shape)
+
+        # reduce any singularity points at the poles to a common longitude
+        poles = np.isclose(np.abs(ys), 90)
+        if np.any(poles):
+            xs[poles] = 0
+
+        # the unit cartesian direction of each horizontal point, with shape (N, 3)
+        directions = to_cartesian(xs, ys, radius=1.0)
+
+        # the radius of each point of the decimated volume, with shape (Z, N)
+        zlevel = np.broadcast_to(zlevel, shape)[::decimate].astype(float)
+        zlevel = zlevel.reshape(zlevel.shape[0], -1)
+        radii = radius + radius * zlevel * zscale
+
+        xyz = np.empty((radii.size, 3), dtype=geometry_dtype(dtype))
+        np.multiply(
+            radii[:, :, np.newaxis],
+            directions[np.newaxis],
+            out=xyz.reshape(*radii.shape, 3),
+            casting="same_kind",
+        )
+
+        # create the point-cloud mesh
+        mesh = pv.PolyData(xyz)
+
+        # attach the pyproj crs serialized as ogc wkt
+        to_wkt(mesh, WGS84)
+
+        # attach the original base radius and zscale
+        mesh.field_data[GV_FIELD_RADIUS] = np.array([radius])
+        mesh.field_data[GV_FIELD_ZSCALE] = np.array([zscale])
+
+        if gvcommon.GEOVISTA_LONLAT_CACHE:
+            n_levels = radii.shape[0]
+            set_lonlats(
+                mesh,
+                np.tile(np.ravel(xs), n_levels),
+                np.tile(np.ravel(ys), n_levels),
+                zlevel=np.ravel(zlevel),
+            )
+
+        # attach any optional data to the mesh
+        if data is not None:
+            data = np.asanyarray(data)
+
+            if data.size == np.prod(shape):
+                data = data.reshape(shape)[::decimate]
+
+            data = cls._as_compatible_data(data, mesh.n_points, mesh.n_cells)
+
+            if not name:
+                name = NAME_POINTS
+
+            mesh.field_data[GV_FIELD_NAME] = np.array([name])
+            mesh[name] = data
+
+        # clean the mesh
+        if clean:
+            mesh.clean(inplace=True)
+
+        return mesh
+
+    @staticmethod
+    def _tiff_open(fname: PathLike) -> DatasetReader:
+        """Open the GeoTIFF for reading.
+
+        Parameters
+        ----------
+        fname : PathLike
+            The file path to the GeoTIFF.
+
+        Returns
+        -------
+        DatasetReader
+            The open :mod:`rasterio` dataset of the GeoTIFF.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        .. attention:: Optional package dependency :mod:`rasterio` is required.
 
         """
         try:
@@ -820,166 +1022,323 @@ class Transform:  # numpydoc ignore=PR01
 
         fname = fname.resolve(strict=True)
 
-        if size is None:
-            size = RIO_SIEVE_SIZE
+        return rio.open(fname, mode="r")
 
-        with rio.open(fname, mode="r") as src:
-            count = src.count
+    @staticmethod
+    def _tiff_snap(offset: int, start: int, stop: int, decimate: int) -> int:
+        """Snap the pixel `offset` to the next decimated pixel of the region.
 
-            if rgb:
-                if count not in [3, 4]:
-                    plural = "s" if count > 1 else ""
-                    emsg = (
-                        f"Require a GeoTIFF with 3 or 4 bands to read as "
-                        f"an RGB or RGBA image, only {count} band{plural} "
-                        "available."
-                    )
-                    raise ValueError(emsg)
-            elif band < 1 or band > count:
-                if count == 1:
-                    emsg = f"Require a band index of 1, got '{band}'."
-                else:
-                    emsg = (
-                        f"Require a band index in the closed interval [1, {count}], "
-                        f"got '{band}'."
-                    )
-                raise ValueError(emsg)
+        The decimated pixels of the ``[start, stop)`` region are every
+        `decimate` pixel from its `start`, as read by :meth:`from_tiff`.
 
-            if name is not None:
-                name = str(name)
-                if "{units}" in name:
-                    units = str(src.units[0] if rgb else src.units[band - 1])
-                    name = name.format(units=units)
+        Parameters
+        ----------
+        offset : int
+            The pixel offset, which is clipped to the region.
+        start : int
+            The first pixel of the region.
+        stop : int
+            The pixel after the last pixel of the region.
+        decimate : int
+            The factor to reduce the resolution of the region.
 
-            data = src.read(masked=extract) if rgb else src.read(band, masked=extract)
+        Returns
+        -------
+        int
+            The first decimated pixel at or after the `offset`.
 
-            if extract:
-                # ignore the mask on the alpha channel, if present
-                mask = data[0].mask & data[1].mask & data[2].mask if rgb else data.mask
-                # ensure there is masked data prior to extracting unmasked points
-                extract = np.sum(mask) > 0
-                data = data.data
+        Notes
+        -----
+        .. versionadded:: 0.6.0
 
-            if rgb:
-                data = np.dstack(data).reshape(-1, count)
+        """
+        offset = min(max(offset, start), stop)
+        return start + ceil((offset - start) / decimate) * decimate
 
-            # transform from pixel offsets to crs coordinates
-            cols, rows = np.meshgrid(
-                np.arange(src.width), np.arange(src.height), indexing="xy"
-            )
-            # rasterio 1.4.0 (regression) expects 1-D arrays, fixed in 1.4.1
-            # see https://github.com/rasterio/rasterio/issues/3191
-            xs, ys = rio.transform.xy(src.transform, rows.flatten(), cols.flatten())
+    @staticmethod
+    def _tiff_verify(
+        src: DatasetReader, name: str | None, band: int, rgb: bool | None
+    ) -> str | None:
+        """Ensure the GeoTIFF band/s are available and format the data array name.
 
-            # ensure we have arrays, rather than a list of arrays
-            xs, ys = np.asanyarray(xs), np.asanyarray(ys)
+        Parameters
+        ----------
+        src : DatasetReader
+            The open :mod:`rasterio` dataset of the GeoTIFF.
+        name : str, optional
+            The name of the GeoTIFF data array, which may contain a ``{units}``
+            placeholder.
+        band : int
+            The one-based band index to read from the GeoTIFF.
+        rgb : bool, optional
+            Whether to read the GeoTIFF as an ``RGB`` or ``RGBA`` image.
 
-            # ensure shape is maintained (rasterio 1.4.1 regression)
-            if xs.shape != src.shape:
-                xs = xs.reshape(src.shape)
+        Returns
+        -------
+        str or None
+            The name of the GeoTIFF data array.
 
-            if ys.shape != src.shape:
-                ys = ys.reshape(src.shape)
+        Notes
+        -----
+        .. versionadded:: 0.6.0
 
-            # create the geotiff mesh
-            mesh = cls.from_2d(
-                xs,
-                ys,
-                data=data,
-                name=name,
-                crs=src.crs,
-                rgb=rgb,
-                radius=radius,
-                zlevel=zlevel,
-                zscale=zscale,
-                clean=clean,
-            )
+        """
+        count = src.count
 
-            if extract:
-                if sieve:
-                    from rasterio.features import sieve as riosieve
+        if rgb:
+            if count not in [3, 4]:
+                plural = "s" if count > 1 else ""
+                emsg = (
+                    f"Require a GeoTIFF with 3 or 4 bands to read as "
+                    f"an RGB or RGBA image, only {count} band{plural} "
+                    "available."
+                )
+                raise ValueError(emsg)
+        elif band < 1 or band > count:
+            if count == 1:
+                emsg = f"Require a band index of 1, got '{band}'."
+            else:
+                emsg = (
+                    f"Require a band index in the closed interval [1, {count}], "
+                    f"got '{band}'."
+                )
+            raise ValueError(emsg)
 
-                    # convert boolean mask to conform to GDAL RFC 15 for sieve
-                    # see https://gdal.org/en/stable/development/rfc/rfc15_nodatabitmask.html
-                    dtype = np.dtype(src.dtypes[0])
-                    muint = 2 ** (dtype.itemsize * 8) - 1
-                    mask = (~mask * muint).astype(dtype)
-                    mask = riosieve(mask, size=size)
-                    # convert back to boolean mask
-                    mask = ~mask.astype(bool)
+        if name is not None:
+            name = str(name)
+            if "{units}" in name:
+                units = str(src.units[0] if rgb else src.units[band - 1])
+                name = name.format(units=units)
 
-                # extract cells with no masked points
-                mesh = mesh.extract_points(~np.ravel(mask), adjacent_cells=False)
-                mesh = cast_UnstructuredGrid_to_PolyData(mesh)
+        return name
 
-            return mesh
+    @staticmethod
+    def _tiff_window(src: DatasetReader, bbox: Bounds) -> Window:
+        """Convert the `bbox` to a whole pixel window of the GeoTIFF.
 
-    @classmethod
-    def from_unstructured(
-        cls,
-        xs: ArrayLike,
-        ys: ArrayLike,
-        connectivity: ArrayLike | Shape | None = None,
-        data: ArrayLike | None = None,
-        start_index: int | None = None,
-        name: str | None = None,
-        crs: CRSLike | None = None,
-        rgb: bool | None = False,
-        radius: float | None = None,
-        zlevel: int | None = None,
-        zscale: float | None = None,
-        clean: bool | None = None,
-    ) -> pv.PolyData:
-        """Build a mesh from unstructured 1-D x-values and y-values.
+        Parameters
+        ----------
+        src : DatasetReader
+            The open :mod:`rasterio` dataset of the GeoTIFF.
+        bbox : Bounds
+            The ``(left, bottom, right, top)`` bounding-box, in canonical GeoTIFF
+            CRS units.
 
-        The `connectivity` defines the topology of faces within the
-        unstructured mesh. This is represented in terms of indices into the
-        provided `xs` and `ys` mesh geometry.
+        Returns
+        -------
+        Window
+            The pixel window covering the `bbox`, clipped to the GeoTIFF extent.
 
-        Note that any optional mesh `data` provided must be in the same order
-        as the mesh face `connectivity`, or in the same order as the points
-        described by `xs` & `ys` (data can be on points or on cells).
+        Notes
+        -----
+        .. versionadded:: 0.6.0
 
-        Parameters
-        ----------
-        xs : ArrayLike
-            A 1-D array of x-values, in canonical `crs` units, defining the
-            vertices of each face in the mesh.
-        ys : ArrayLike
-            A 1-D array of y-values, in canonical `crs` units, defining the
-            vertices of each face in the mesh.
-        connectivity : ArrayLike or Shape, optional
-            Defines the topology of each face in the unstructured mesh in terms
-            of indices into the provided `xs` and `ys` mesh geometry
-            arrays. The `connectivity` is a 2-D ``(M, N)`` array, where ``M`` is
-            the number of mesh faces, and ``N`` is the number of nodes per
-            face. Alternatively, an ``(M, N)`` tuple defining the connectivity
-            shape may be provided instead, given that the `xs` and `ys` define
-            ``M*N`` points (at most) in the mesh geometry. If no connectivity is
-            provided, and the `xs` and `ys` are 2-D, then their shape is used
-            to determine the connectivity. Also, note that masked connectivity
-            may be used to define a mesh consisting of different shaped faces.
-        data : ArrayLike, optional
-            Data to be optionally attached to the mesh face or nodes.
-        start_index : int, default=0
-            Specify the base index of the provided `connectivity` in the
-            closed interval [0, 1]. For example, if `start_index=1`, then
-            the `start_index` will be subtracted from the `connectivity`
-            to result in 0-based indices into the provided mesh geometry.
-            If no `start_index` is provided, then it will be determined
-            from the `connectivity`.
+        """
+        from rasterio.windows import Window, from_bounds
+
+        if len(bbox) != 4:
+            emsg = (
+                f"Require a bounding-box of '(left, bottom, right, top)', got '{bbox}'."
+            )
+            raise ValueError(emsg)
+
+        window = from_bounds(*bbox, transform=src.transform)
+        # NOTE: windows with negative extent occur for inverted axes
+        cols = sorted([window.col_off, window.col_off + window.width])
+        rows = sorted([window.row_off, window.row_off + window.height])
+        col_start, col_stop = max(floor(cols[0]), 0), min(ceil(cols[1]), src.width)
+        row_start, row_stop = max(floor(rows[0]), 0), min(ceil(rows[1]), src.height)
+
+        if col_stop - col_start < 2 or row_stop - row_start < 2:
+            emsg = (
+                f"The bounding-box '{bbox}' requires at least 2x2 pixels of the "
+                "GeoTIFF to create a mesh."
+            )
+            raise ValueError(emsg)
+
+        return Window(col_start, row_start, col_stop - col_start, row_stop - row_start)
+
+    @classmethod
+    def _tiff_mesh(
+        cls,
+        src: DatasetReader,
+        window: Window | None,
+        decimate: int,
+        name: str | None,
+        band: int,
+        rgb: bool | None,
+        sieve: bool | None,
+        size: int,
+        extract: bool | None,
+        radius: float | None,
+        zlevel: int | None,
+        zscale: float | None,
+        clean: bool | None,
+    ) -> pv.PolyData:
+        """Build a quad-faced mesh from a window of the open GeoTIFF.
+
+        Parameters
+        ----------
+        src : DatasetReader
+            The open :mod:`rasterio` dataset of the GeoTIFF.
+        window : Window, optional
+            The pixel window of the GeoTIFF to read. Defaults to the full extent.
+        decimate : int
+            The factor to reduce the resolution of the `window`.
         name : str, optional
-            The name of the optional data array to be attached to the mesh. If
-            `data` is provided but with no `name`, defaults to either
-            :data:`NAME_POINTS` or :data:`NAME_CELLS`.
-        crs : CRSLike, optional
-            The Coordinate Reference System of the provided `xs` and `ys`. May
-            be anything accepted by :meth:`pyproj.crs.CRS.from_user_input`. Defaults
-            to ``EPSG:4326`` i.e., ``WGS 84``.
+            The name of the GeoTIFF data array.
+        band : int
+            The one-based band index to read from the GeoTIFF.
+        rgb : bool, optional
+            Whether to read the GeoTIFF as an ``RGB`` or ``RGBA`` image.
+        sieve : bool, optional
+            Whether to sieve the GeoTIFF mask.
+        size : int
+            The size of the `sieve` filter.
+        extract : bool, optional
+            Whether to extract cells from the mesh with no masked points.
+        radius : float, optional
+            The radius of the mesh sphere.
+        zlevel : int, optional
+            The z-axis level.
+        zscale : float, optional
+            The proportional multiplier for z-axis `zlevel`.
+        clean : bool, optional
+            Whether to clean the resultant mesh.
+
+        Returns
+        -------
+        PolyData
+            The GeoTIFF spherical mesh.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        count = src.count
+        kwargs = {"masked": extract}
+
+        if window is None:
+            transform = src.transform
+            height, width = src.height, src.width
+        else:
+            kwargs["window"] = window
+            transform = src.window_transform(window)
+            height, width = window.height, window.width
+
+        if decimate > 1:
+            # only read the decimated pixels, which leverages any overviews
+            shape = ceil(height / decimate), ceil(width / decimate)
+            kwargs["out_shape"] = (count, *shape) if rgb else shape
+            transform *= transform.scale(width / shape[1], height / shape[0])
+            height, width = shape
+
+        data = src.read(**kwargs) if rgb else src.read(band, **kwargs)
+
+        if extract:
+            # ignore the mask on the alpha channel, if present
+            mask = data[0].mask & data[1].mask & data[2].mask if rgb else data.mask
+            # ensure there is masked data prior to extracting unmasked points
+            extract = np.sum(mask) > 0
+            data = data.data
+
+        if rgb:
+            data = np.dstack(data).reshape(-1, count)
+
+        # transform from pixel offsets to crs coordinates
+        cols, rows = np.meshgrid(np.arange(width), np.arange(height), indexing="xy")
+        # rasterio 1.4.0 (regression) expects 1-D arrays, fixed in 1.4.1
+        # see https://github.com/rasterio/rasterio/issues/3191
+        xs, ys = rio.transform.xy(transform, rows.flatten(), cols.flatten())
+
+        # ensure we have arrays, rather than a list of arrays
+        xs, ys = np.asanyarray(xs), np.asanyarray(ys)
+
+        # ensure shape is maintained (rasterio 1.4.1 regression)
+        if xs.shape != (shape := (height, width)):
+            xs = xs.reshape(shape)
+
+        if ys.shape != shape:
+            ys = ys.reshape(shape)
+
+        # create the geotiff mesh
+        mesh = cls.from_2d(
+            xs,
+            ys,
+            data=data,
+            name=name,
+            crs=src.crs,
+            rgb=rgb,
+            radius=radius,
+            zlevel=zlevel,
+            zscale=zscale,
+            clean=clean,
+        )
+
+        if extract:
+            if sieve:
+                from rasterio.features import sieve as riosieve
+
+                # convert boolean mask to conform to GDAL RFC 15 for sieve
+                # see https://gdal.org/en/stable/development/rfc/rfc15_nodatabitmask.html
+                dtype = np.dtype(src.dtypes[0])
+                muint = 2 ** (dtype.itemsize * 8) - 1
+                mask = (~mask * muint).astype(dtype)
+                mask = riosieve(mask, size=size)
+                # convert back to boolean mask
+                mask = ~mask.astype(bool)
+
+            # extract cells with no masked points
+            mesh = mesh.extract_points(~np.ravel(mask), adjacent_cells=False)
+            mesh = cast_UnstructuredGrid_to_PolyData(mesh)
+
+        return mesh
+
+    @classmethod
+    def from_tiff(
+        cls,
+        fname: PathLike,
+        name: str | None = None,
+        band: int = 1,
+        rgb: bool | None = False,
+        sieve: bool | None = False,
+        size: int | None = None,
+        extract: bool | None = False,
+        radius: float | None = None,
+        zlevel: int | None = None,
+        zscale: float | None = None,
+        clean: bool | None = None,
+        bbox: Bounds | None = None,
+        decimate: int | None = None,
+    ) -> pv.PolyData:
+        """Build a quad-faced mesh from the GeoTIFF.
+
+        Note that, the GeoTIFF data will be located on the ``points``
+        of the resultant mesh.
+
+        Parameters
+        ----------
+        fname : PathLike
+            The file path to the GeoTIFF.
+        name : str, optional
+            The name of the GeoTIFF data array to be attached to the mesh.
+            Defaults to :data:`NAME_POINTS`. Note that, ``{units}`` may be
+            used as a placeholder for the units of the data array e.g.,
+            ``"Elevation / {units}"``.
+        band : int, default=1
+            The band index to read from the GeoTIFF. Note that, the `band`
+            index is one-based.
         rgb : bool, default=False
-            Whether `data` is an ``RGB`` or ``RGBA`` image. When ``rgb=True``,
-            `data` is expected to have an extra dimension for the colour
-            channels (length ``3`` or ``4``).
+            Specify whether to read the GeoTIFF as an ``RGB`` or ``RGBA`` image.
+            When ``rgb=True``, the `band` index is ignored.
+        sieve : bool, default=False
+            Specify whether to sieve the GeoTIFF mask to remove small connected
+            regions. See :func:`rasterio.features.sieve` for more information.
+        size : int, optional
+            The size of the `sieve` filter. Defaults to :data:`RIO_SIEVE_SIZE`.
+        extract : bool, default=False
+            Specify whether to extract cells from the mesh with no masked points.
         radius : float, optional
             The radius of the mesh sphere. Defaults to :data:`~geovista.common.RADIUS`.
         zlevel : int, default=0
@@ -993,20 +1352,273 @@ class Transform:  # numpydoc ignore=PR01
             and/or remove degenerate cells in the resultant mesh. See
             :meth:`pyvista.PolyDataFilters.clean`. Defaults to
             :data:`BRIDGE_CLEAN`.
+        bbox : Bounds, optional
+            The ``(left, bottom, right, top)`` bounding-box, in canonical GeoTIFF
+            CRS units, of the region to read. Only the pixels covering the `bbox`
+            are read and meshed. Defaults to the full extent of the GeoTIFF.
+        decimate : int, optional
+            The factor to reduce the resolution of the GeoTIFF e.g., ``4`` reads
+            every fourth pixel in each axis. Any GeoTIFF overviews will be used.
+            Defaults to ``1`` i.e., full resolution.
 
         Returns
         -------
         PolyData
-            The ``(M*N)``-faced spherical mesh.
+            The GeoTIFF spherical mesh.
 
         Notes
         -----
-        .. versionadded:: 0.1.0
+        .. versionadded:: 0.5.0
+
+        .. attention:: Optional package dependency :mod:`rasterio` is required.
+
+        Examples
+        --------
+        >>> from geovista import GeoPlotter, Transform
+        >>> from geovista.pantry import fetch_raster
+        >>> from geovista.pantry.textures import natural_earth_1
+
+        Render the GeoTIFF ``RGB`` image as a geolocated mesh.
+
+        First, :func:`rasterio.features.sieve` the GeoTIFF image to remove several
+        unwanted masked regions within the interior of the image, due to a lack of
+        dynamic range in the ``uint8`` image data. Then, extract the mesh to remove
+        cells with no masked points.
+
+        >>> fname = fetch_raster("bahamas_rgb.tif")
+        >>> mesh = Transform.from_tiff(fname, rgb=True, sieve=True, extract=True)
+
+        Now render the result:
+
+        >>> p = GeoPlotter()
+        >>> _ = p.add_mesh(mesh, rgb=True)
+        >>> p.view_poi()
+        >>> _ = p.add_base_layer(texture=natural_earth_1(), zlevel=0)
+        >>> _ = p.add_coastlines(color="white")
+        >>> p.show()
 
         """
-        if rgb is None:
-            rgb = False
+        if size is None:
+            size = RIO_SIEVE_SIZE
+
+        decimate = cls._verify_decimate(decimate)
+
+        with cls._tiff_open(fname) as src:
+            name = cls._tiff_verify(src, name, band, rgb)
+            window = None if bbox is None else cls._tiff_window(src, bbox)
+
+            return cls._tiff_mesh(
+                src,
+                window,
+                decimate,
+                name=name,
+                band=band,
+                rgb=rgb,
+                sieve=sieve,
+                size=size,
+                extract=extract,
+                radius=radius,
+                zlevel=zlevel,
+                zscale=zscale,
+                clean=clean,
+            )
+
+    @classmethod
+    def from_tiff_tiles(
+        cls,
+        fname: PathLike,
+        name: str | None = None,
+        band: int = 1,
+        rgb: bool | None = False,
+        sieve: bool | None = False,
+        size: int | None = None,
+        extract: bool | None = False,
+        radius: float | None = None,
+        zlevel: int | None = None,
+        zscale: float | None = None,
+        clean: bool | None = None,
+        bbox: Bounds | None = None,
+        decimate: int | None = None,
+    ) -> Iterator[pv.PolyData]:
+        """Build a quad-faced mesh for each block of the GeoTIFF.
+
+        The GeoTIFF is read and meshed one internal block (tile or strip) at a
+        time, allowing large GeoTIFFs to be processed in constant memory. Each
+        block is snapped to the decimated pixels read by :meth:`from_tiff`, and
+        each mesh overlaps its eastern and southern neighbour by one decimated
+        pixel, so that together they seamlessly cover the GeoTIFF.
+
+        Note that, the GeoTIFF data will be located on the ``points``
+        of each resultant mesh.
+
+        Parameters
+        ----------
+        fname : PathLike
+            The file path to the GeoTIFF.
+        name : str, optional
+            The name of the GeoTIFF data array to be attached to each mesh.
+            Defaults to :data:`NAME_POINTS`. Note that, ``{units}`` may be
+            used as a placeholder for the units of the data array e.g.,
+            ``"Elevation / {units}"``.
+        band : int, default=1
+            The band index to read from the GeoTIFF. Note that, the `band`
+            index is one-based.
+        rgb : bool, default=False
+            Specify whether to read the GeoTIFF as an ``RGB`` or ``RGBA`` image.
+            When ``rgb=True``, the `band` index is ignored.
+        sieve : bool, default=False
+            Specify whether to sieve the mask of each block to remove small
+            connected regions. See :func:`rasterio.features.sieve` for more
+            information.
+        size : int, optional
+            The size of the `sieve` filter. Defaults to :data:`RIO_SIEVE_SIZE`.
+        extract : bool, default=False
+            Specify whether to extract cells from each mesh with no masked points.
+            Blocks with no unmasked cells are skipped.
+        radius : float, optional
+            The radius of the mesh sphere. Defaults to :data:`~geovista.common.RADIUS`.
+        zlevel : int, default=0
+            The z-axis level. Used in combination with the `zscale` to offset the
+            `radius` by a proportional amount i.e., ``radius * zlevel * zscale``.
+        zscale : float, optional
+            The proportional multiplier for z-axis `zlevel`. Defaults to
+            :data:`~geovista.common.ZLEVEL_SCALE`.
+        clean : bool, optional
+            Specify whether to merge duplicate points, remove unused points,
+            and/or remove degenerate cells in each resultant mesh. See
+            :meth:`pyvista.PolyDataFilters.clean`. Defaults to
+            :data:`BRIDGE_CLEAN`.
+        bbox : Bounds, optional
+            The ``(left, bottom, right, top)`` bounding-box, in canonical GeoTIFF
+            CRS units, of the region to read. Only the blocks covering the `bbox`
+            are read and meshed. Defaults to the full extent of the GeoTIFF.
+        decimate : int, optional
+            The factor to reduce the resolution of each block e.g., ``4`` reads
+            every fourth pixel in each axis. Any GeoTIFF overviews will be used.
+            Defaults to ``1`` i.e., full resolution.
+
+        Yields
+        ------
+        PolyData
+            The GeoTIFF spherical mesh of the next block.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        .. attention:: Optional package dependency :mod:`rasterio` is required.
+
+        """
+        from rasterio.windows import Window
+
+        if size is None:
+            size = RIO_SIEVE_SIZE
+
+        decimate = cls._verify_decimate(decimate)
+
+        with cls._tiff_open(fname) as src:
+            name = cls._tiff_verify(src, name, band, rgb)
+
+            if bbox is None:
+                col_start, row_start, col_stop, row_stop = 0, 0, src.width, src.height
+            else:
+                region = cls._tiff_window(src, bbox)
+                col_start, row_start = region.col_off, region.row_off
+                col_stop = col_start + region.width
+                row_stop = row_start + region.height
+
+            for _, block in src.block_windows(1 if rgb else band):
+                # snap the block to the decimated pixels of the region, so that
+                # each mesh samples the same pixels as from_tiff
+                col_off, col_end = (
+                    cls._tiff_snap(offset, col_start, col_stop, decimate)
+                    for offset in (block.col_off, block.col_off + block.width)
+                )
+                row_off, row_end = (
+                    cls._tiff_snap(offset, row_start, row_stop, decimate)
+                    for offset in (block.row_off, block.row_off + block.height)
+                )
+
+                # skip blocks without a decimated pixel of their own
+                if col_off == col_end or row_off == row_end:
+                    continue
+
+                # overlap the next block by one decimated pixel to avoid gaps
+                # between the meshes
+                width = min(col_end + decimate, col_stop) - col_off
+                height = min(row_end + decimate, row_stop) - row_off
+
+                # a mesh requires at least one face i.e., 2x2 decimated pixels
+                if ceil(width / decimate) < 2 or ceil(height / decimate) < 2:
+                    continue
+
+                mesh = cls._tiff_mesh(
+                    src,
+                    Window(col_off, row_off, width, height),
+                    decimate,
+                    name=name,
+                    band=band,
+                    rgb=rgb,
+                    sieve=sieve,
+                    size=size,
+                    extract=extract,
+                    radius=radius,
+                    zlevel=zlevel,
+                    zscale=zscale,
+                    clean=clean,
+                )
+
+                if mesh.n_cells:
+                    yield mesh
+
+    @classmethod
+    def _create_mesh(
+        cls,
+        xs: ArrayLike,
+        ys: ArrayLike,
+        connectivity: ArrayLike | Shape | None = None,
+        start_index: int | None = None,
+        crs: CRSLike | None = None,
+        radius: float | None = None,
+        zlevel: int | None = None,
+        zscale: float | None = None,
+        dtype: DTypeLike | None = None,
+    ) -> pv.PolyData:
+        """Build the geometry and topology of an unstructured mesh.
+
+        See :meth:`from_unstructured` for details of the parameters.
+
+        Parameters
+        ----------
+        xs : ArrayLike
+            A 1-D array of x-values, in canonical `crs` units.
+        ys : ArrayLike
+            A 1-D array of y-values, in canonical `crs` units.
+        connectivity : ArrayLike or Shape, optional
+            The topology of each face in the unstructured mesh.
+        start_index : int, optional
+            The base index of the provided `connectivity`.
+        crs : CRSLike, optional
+            The Coordinate Reference System of the provided `xs` and `ys`.
+        radius : float, optional
+            The radius of the mesh sphere.
+        zlevel : int, optional
+            The z-axis level.
+        zscale : float, optional
+            The proportional multiplier for z-axis `zlevel`.
+        dtype : DTypeLike, optional
+            The floating point precision of the mesh points.
 
+        Returns
+        -------
+        PolyData
+            The spherical mesh, with no data attached.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
         xs, ys = np.asanyarray(xs), np.asanyarray(ys)
         shape = xs.shape
 
@@ -1028,7 +1640,7 @@ class Transform:  # numpydoc ignore=PR01
         xs, ys = xs.ravel(), ys.ravel()
 
         if crs is not None:
-            crs = pyproj.CRS.from_user_input(crs)
+            crs = get_crs(crs)
 
             if crs != WGS84:
                 transformed = transform_points(src_crs=crs, tgt_crs=WGS84, xs=xs, ys=ys)
@@ -1047,9 +1659,9 @@ class Transform:  # numpydoc ignore=PR01
                 and np.ma.is_masked(ys)
                 and np.array_equal(xs.mask, ys.mask)
             ):
-                connectivity = np.ma.arange(np.ma.prod(shape), dtype=np.uint32).reshape(
-                    shape
-                )
+                connectivity = np.ma.arange(
+                    np.ma.prod(shape), dtype=pv.ID_TYPE
+                ).reshape(shape)
                 connectivity.mask = xs.mask
 
         if isinstance(connectivity, tuple):
@@ -1064,16 +1676,18 @@ class Transform:  # numpydoc ignore=PR01
                 )
                 raise ValueError(emsg)
 
-            connectivity = np.arange(npts, dtype=np.uint32).reshape(connectivity)
+            connectivity = np.arange(npts, dtype=pv.ID_TYPE).reshape(connectivity)
             ignore_start_index = True
         else:
-            # require to copy connectivity, otherwise results in a memory
-            # corruption within vtk
-            connectivity = np.asanyarray(connectivity).copy()
+            # no copy here, the connectivity is copied at most once when
+            # the vtk cell array is created
+            connectivity = np.asanyarray(connectivity)
             cls._verify_connectivity(connectivity.shape)
             ignore_start_index = False
 
-        if not ignore_start_index:
+        if ignore_start_index:
+            start_index = 0
+        else:
             if start_index is None:
                 start_index = connectivity.min()
 
@@ -1084,9 +1698,6 @@ class Transform:  # numpydoc ignore=PR01
                 )
                 raise ValueError(emsg)
 
-            if start_index:
-                connectivity -= start_index
-
         # reduce any singularity points at the poles to a common longitude
         poles = np.isclose(np.abs(ys), 90)
         if np.any(poles):
@@ -1098,7 +1709,7 @@ class Transform:  # numpydoc ignore=PR01
         radius += radius * zlevel * zscale
 
         # convert lat/lon to cartesian xyz
-        geometry = to_cartesian(xs, ys, radius=radius)
+        geometry = to_cartesian(xs, ys, radius=radius, dtype=dtype)
 
         if np.ma.is_masked(connectivity):
             # create face connectivity from masked vertex indices, thus
@@ -1122,24 +1733,31 @@ class Transform:  # numpydoc ignore=PR01
                 warnings.warn(wmsg, stacklevel=2)
                 n_vertices = n_vertices[valid_faces_mask]
                 connectivity = connectivity[valid_faces_mask]
-            faces = np.ma.hstack([n_vertices.reshape(-1, 1), connectivity]).ravel()
-            faces = faces[~faces.mask].data
+            # the compressed connectivity (row-major) is the only copy
+            indices = connectivity.compressed().astype(pv.ID_TYPE, copy=False)
+            offsets = np.zeros(n_vertices.size + 1, dtype=pv.ID_TYPE)
+            np.cumsum(n_vertices, out=offsets[1:])
+            if start_index:
+                indices -= start_index
         else:
-            # create face connectivity serialization e.g., for a quad-mesh,
-            # each face we have (4, V0, V1, V2, V3), where "4" is the number
-            # of vertices defining the face, followed by the four indices (Vn)
-            # specifying each of the face vertices in an anti-clockwise order
-            # into the mesh geometry.
+            # create the face offsets and connectivity directly in the vtk cell
+            # array format i.e., for a quad-mesh, the connectivity of each face
+            # is (V0, V1, V2, V3), being the four indices (Vn) specifying each
+            # of the face vertices in an anti-clockwise order into the mesh
+            # geometry, and the offset of each face is a multiple of four.
+            connectivity = np.ma.getdata(connectivity)
             n_faces, n_vertices = connectivity.shape
-            faces = np.hstack(
-                [
-                    np.broadcast_to(
-                        np.array([n_vertices], dtype=np.int8), (n_faces, 1)
-                    ),
-                    connectivity,
-                ]
+            indices = (
+                connectivity
+                if ignore_start_index
+                else np.subtract(connectivity, start_index, dtype=pv.ID_TYPE)
+            ).ravel()
+            offsets = np.arange(
+                0, n_faces * n_vertices + 1, n_vertices, dtype=pv.ID_TYPE
             )
 
+        faces = cls._create_cells(offsets, indices)
+
         # create the mesh
         mesh = pv.PolyData(geometry, faces=faces)
 
@@ -1149,6 +1767,156 @@ class Transform:  # numpydoc ignore=PR01
         # attach the radius
         mesh.field_data[GV_FIELD_RADIUS] = np.array([radius])
 
+        if gvcommon.GEOVISTA_LONLAT_CACHE:
+            set_lonlats(mesh, xs, ys, zlevel=zlevel)
+
+        return mesh
+
+    @classmethod
+    def from_unstructured(
+        cls,
+        xs: ArrayLike,
+        ys: ArrayLike,
+        connectivity: ArrayLike | Shape | None = None,
+        data: ArrayLike | None = None,
+        start_index: int | None = None,
+        name: str | None = None,
+        crs: CRSLike | None = None,
+        rgb: bool | None = False,
+        radius: float | None = None,
+        zlevel: int | None = None,
+        zscale: float | None = None,
+        clean: bool | None = None,
+        cache: bool | None = None,
+        dtype: DTypeLike | None = None,
+    ) -> pv.PolyData:
+        """Build a mesh from unstructured 1-D x-values and y-values.
+
+        The `connectivity` defines the topology of faces within the
+        unstructured mesh. This is represented in terms of indices into the
+        provided `xs` and `ys` mesh geometry.
+
+        Note that any optional mesh `data` provided must be in the same order
+        as the mesh face `connectivity`, or in the same order as the points
+        described by `xs` & `ys` (data can be on points or on cells).
+
+        Parameters
+        ----------
+        xs : ArrayLike
+            A 1-D array of x-values, in canonical `crs` units, defining the
+            vertices of each face in the mesh.
+        ys : ArrayLike
+            A 1-D array of y-values, in canonical `crs` units, defining the
+            vertices of each face in the mesh.
+        connectivity : ArrayLike or Shape, optional
+            Defines the topology of each face in the unstructured mesh in terms
+            of indices into the provided `xs` and `ys` mesh geometry
+            arrays. The `connectivity` is a 2-D ``(M, N)`` array, where ``M`` is
+            the number of mesh faces, and ``N`` is the number of nodes per
+            face. Alternatively, an ``(M, N)`` tuple defining the connectivity
+            shape may be provided instead, given that the `xs` and `ys` define
+            ``M*N`` points (at most) in the mesh geometry. If no connectivity is
+            provided, and the `xs` and `ys` are 2-D, then their shape is used
+            to determine the connectivity. Also, note that masked connectivity
+            may be used to define a mesh consisting of different shaped faces.
+        data : ArrayLike, optional
+            Data to be optionally attached to the mesh face or nodes.
+        start_index : int, default=0
+            Specify the base index of the provided `connectivity` in the
+            closed interval [0, 1]. For example, if `start_index=1`, then
+            the `start_index` will be subtracted from the `connectivity`
+            to result in 0-based indices into the provided mesh geometry.
+            If no `start_index` is provided, then it will be determined
+            from the `connectivity`.
+        name : str, optional
+            The name of the optional data array to be attached to the mesh. If
+            `data` is provided but with no `name`, defaults to either
+            :data:`NAME_POINTS` or :data:`NAME_CELLS`.
+        crs : CRSLike, optional
+            The Coordinate Reference System of the provided `xs` and `ys`. May
+            be anything accepted by :meth:`pyproj.crs.CRS.from_user_input`. Defaults
+            to ``EPSG:4326`` i.e., ``WGS 84``.
+        rgb : bool, default=False
+            Whether `data` is an ``RGB`` or ``RGBA`` image. When ``rgb=True``,
+            `data` is expected to have an extra dimension for the colour
+            channels (length ``3`` or ``4``).
+        radius : float, optional
+            The radius of the mesh sphere. Defaults to :data:`~geovista.common.RADIUS`.
+        zlevel : int, default=0
+            The z-axis level. Used in combination with the `zscale` to offset the
+            `radius` by a proportional amount i.e., ``radius * zlevel * zscale``.
+        zscale : float, optional
+            The proportional multiplier for z-axis `zlevel`. Defaults to
+            :data:`~geovista.common.ZLEVEL_SCALE`.
+        clean : bool, optional
+            Specify whether to merge duplicate points, remove unused points,
+            and/or remove degenerate cells in the resultant mesh. See
+            :meth:`pyvista.PolyDataFilters.clean`. Defaults to
+            :data:`BRIDGE_CLEAN`.
+        cache : bool, optional
+            Specify whether to reuse the geometry and topology of a previously
+            built mesh from the on-disk mesh cache, keyed by a hash of the mesh
+            inputs. Only the `data` is attached to a cached mesh. Defaults to
+            :data:`~geovista.cache.GEOVISTA_MESH_CACHE`. See
+            :func:`~geovista.cache.mesh_cache`.
+        dtype : DTypeLike, optional
+            The floating point precision of the mesh points, either ``float32``
+            or ``float64``. Defaults to :data:`~geovista.common.GEOMETRY_DTYPE`.
+
+        Returns
+        -------
+        PolyData
+            The ``(M*N)``-faced spherical mesh.
+
+        Notes
+        -----
+        .. versionadded:: 0.1.0
+
+        """
+        if rgb is None:
+            rgb = False
+
+        if cache is None:
+            cache = gvcache.GEOVISTA_MESH_CACHE
+
+        mesh = key = None
+
+        if cache:
+            # convert array-likes, as only array content is hashed by the key
+            xs, ys = np.asanyarray(xs), np.asanyarray(ys)
+            if connectivity is not None and not isinstance(connectivity, tuple):
+                connectivity = np.asanyarray(connectivity)
+            if crs is not None:
+                crs = get_crs(crs)
+            key = gvcache.mesh_cache_key(
+                xs,
+                ys,
+                repr(connectivity) if isinstance(connectivity, tuple) else connectivity,
+                start_index,
+                None if crs is None else crs.to_wkt(),
+                radius,
+                zlevel,
+                zscale,
+                geometry_dtype(dtype).str,
+            )
+            mesh = gvcache.mesh_cache_load(key)
+
+        if mesh is None:
+            mesh = cls._create_mesh(
+                xs,
+                ys,
+                connectivity=connectivity,
+                start_index=start_index,
+                crs=crs,
+                radius=radius,
+                zlevel=zlevel,
+                zscale=zscale,
+                dtype=dtype,
+            )
+
+            if key is not None:
+                gvcache.mesh_cache_save(key, mesh)
+
         # attach any optional data to the mesh
         if data is not None:
             data = cls._as_compatible_data(data, mesh.n_points, mesh.n_cells, rgb)
@@ -1301,6 +2069,11 @@ class Transform:  # numpydoc ignore=PR01
         mesh = pv.PolyData()
         mesh.copy_structure(self._mesh)
 
+        if GV_LONLATS in self._mesh.point_data:
+            # share the geographic coordinates of the shared mesh points
+            mesh.point_data.set_array(self._mesh.point_data[GV_LONLATS], GV_LONLATS)
+            mesh.field_data[GV_FIELD_LONLATS] = self._mesh.field_data[GV_FIELD_LONLATS]
+
         if data is not None:
             if not name:
                 name = NAME_POINTS if data.size == self._n_points else NAME_CELLS
@@ -1309,3 +2082,97 @@ class Transform:  # numpydoc ignore=PR01
             mesh[name] = data
 
         return mesh
+
+    def steps(
+        self,
+        data: ArrayLike,
+        name: str | None = None,
+        shared: bool | None = False,
+        prefetch: bool | None = False,
+    ) -> Iterator[pv.PolyData]:
+        """Build the mesh for each step of the time-series `data`.
+
+        The mesh geometry and topology are built once only, and each step of the
+        `data` is read and attached to the faces or nodes on demand. This allows
+        a time-series to be animated or processed in constant memory, regardless
+        of the number of steps.
+
+        Parameters
+        ----------
+        data : ArrayLike
+            The time-series data with shape ``(T, ...)``, where each of the ``T``
+            steps is compatible with the number of mesh faces or nodes. May be any
+            indexable e.g., a :class:`netCDF4.Variable`, which is only read one step
+            at a time.
+        name : str, optional
+            The name of the data array to be attached to the mesh. Defaults to
+            either :data:`NAME_POINTS` or :data:`NAME_CELLS`.
+        shared : bool, default=False
+            Whether to yield the same mesh instance for every step, replacing the
+            data array in-place. Otherwise, a new mesh is yielded for each step.
+        prefetch : bool, default=False
+            Whether to read the data of the next step in a background thread while
+            the current step is being consumed.
+
+        Yields
+        ------
+        PolyData
+            The spherical mesh with the data of the next step attached.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        n_steps = len(data)
+
+        def fetch(step: int) -> np.ndarray:
+            """Read and verify the data of the `step`.
+
+            Parameters
+            ----------
+            step : int
+                The index of the step to read.
+
+            Returns
+            -------
+            ndarray
+                The verified data of the step.
+
+            Notes
+            -----
+            .. versionadded:: 0.6.0
+
+            """
+            return self._as_compatible_data(data[step], self._n_points, self._n_cells)
+
+        mesh = None
+        # a single worker serializes all reads of the data e.g., netCDF4 is
+        # not thread-safe
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+
+        try:
+            if executor is not None and n_steps:
+                future = executor.submit(fetch, 0)
+
+            for step in range(n_steps):
+                if executor is not None:
+                    payload = future.result()
+                    if step + 1 < n_steps:
+                        future = executor.submit(fetch, step + 1)
+                else:
+                    payload = fetch(step)
+
+                if not shared:
+                    yield self(payload, name=name)
+                elif mesh is None:
+                    mesh = self(payload, name=name)
+                    name = str(mesh.field_data[GV_FIELD_NAME][0])
+                    yield mesh
+                else:
+                    # replace the previous step data, releasing it
+                    mesh[name] = payload
+                    yield mesh
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
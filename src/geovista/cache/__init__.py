@@ -14,10 +14,15 @@ Notes
 from __future__ import annotations
 
 from functools import wraps
+import hashlib
 import os
 from pathlib import Path
+import shutil
+import tempfile
 from typing import IO, TYPE_CHECKING, Any, AnyStr, TypeAlias
+import zipfile
 
+import lazy_loader as lazy
 import pooch
 
 from geovista.config import resources
@@ -28,8 +33,18 @@ __all__ = [
     "DATA_VERSION",
     "GEOVISTA_CACHEDIR",
     "GEOVISTA_DATA_VERSION",
+    "GEOVISTA_MESH_CACHE",
+    "GEOVISTA_MESH_CACHE_SIZE",
     "GEOVISTA_POOCH_MUTE",
+    "MESH_CACHE_DIR",
+    "MESH_CACHE_FORMAT",
+    "MESH_CACHE_SIZE",
     "RETRY_ATTEMPTS",
+    "mesh_cache",
+    "mesh_cache_clear",
+    "mesh_cache_key",
+    "mesh_cache_load",
+    "mesh_cache_save",
     "pooch_mute",
     "reload_registry",
 ]
@@ -37,6 +52,13 @@ __all__ = [
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    import numpy as np
+    import pyvista as pv
+
+# lazy import third-party dependencies
+np = lazy.load("numpy")
+pv = lazy.load("pyvista")
+
 # this is a type alias
 FileLike: TypeAlias = str | IO[AnyStr]
 """Type alias for filename or file-like object."""
@@ -80,6 +102,25 @@ GEOVISTA_POOCH_MUTE: bool = (
 )
 """Verbosity status of the :mod:`pooch` cache manager logger."""
 
+MESH_CACHE_SIZE: int = 2 * 1024**3
+"""The default maximum size (bytes) of the on-disk mesh cache."""
+
+GEOVISTA_MESH_CACHE: bool = (
+    os.environ.get("GEOVISTA_MESH_CACHE", "false").lower() == "true"
+)
+"""Whether the bridge persists built meshes in the on-disk mesh cache."""
+
+GEOVISTA_MESH_CACHE_SIZE: int = int(
+    os.environ.get("GEOVISTA_MESH_CACHE_SIZE", str(MESH_CACHE_SIZE))
+)
+"""Environment variable to override default :attr:`MESH_CACHE_SIZE`."""
+
+MESH_CACHE_DIR: str = "meshes"
+"""The :data:`CACHE` sub-directory of the on-disk mesh cache."""
+
+MESH_CACHE_FORMAT: int = 1
+"""The on-disk mesh cache format version, included in each mesh cache key."""
+
 
 # configure the cache with the registry
 CACHE.load_registry(
@@ -184,6 +225,284 @@ def pooch_mute(silent: bool | None = None) -> bool:
     return original
 
 
+def _mesh_cache_path(key: str | None = None) -> Path:
+    """Get the path of the on-disk mesh cache, or a specific entry.
+
+    Parameters
+    ----------
+    key : str, optional
+        The key of the mesh cache entry. Defaults to the root directory
+        of the mesh cache.
+
+    Returns
+    -------
+    Path
+        The path of the mesh cache, or entry.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    path = Path(CACHE.abspath) / MESH_CACHE_DIR
+    return path if key is None else path / key
+
+
+def _mesh_cache_evict(size: int | None = None) -> int:
+    """Remove the least recently used mesh cache entries that exceed the `size`.
+
+    Parameters
+    ----------
+    size : int, optional
+        The maximum size (bytes) of the on-disk mesh cache. Defaults to
+        :data:`GEOVISTA_MESH_CACHE_SIZE`.
+
+    Returns
+    -------
+    int
+        The number of mesh cache entries removed.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    if size is None:
+        size = GEOVISTA_MESH_CACHE_SIZE
+
+    root = _mesh_cache_path()
+    entries = []
+
+    if root.is_dir():
+        for entry in root.iterdir():
+            if entry.is_dir() and not entry.name.startswith("."):
+                nbytes = sum(fname.stat().st_size for fname in entry.iterdir())
+                entries.append((entry.stat().st_mtime, nbytes, entry))
+
+    # the access time of an entry is its modification time, see mesh_cache_load
+    entries.sort(key=lambda item: item[0])
+    total = sum(nbytes for _, nbytes, _ in entries)
+    count = 0
+
+    for _, nbytes, entry in entries:
+        if total <= size:
+            break
+        shutil.rmtree(entry, ignore_errors=True)
+        total -= nbytes
+        count += 1
+
+    return count
+
+
+def mesh_cache(enable: bool | None = None) -> bool:
+    """Control whether the bridge uses the on-disk mesh cache.
+
+    Updates the status variable :data:`GEOVISTA_MESH_CACHE`.
+
+    Parameters
+    ----------
+    enable : bool, optional
+        Whether to enable or disable the on-disk mesh cache. Defaults
+        to ``True``.
+
+    Returns
+    -------
+    bool
+        The previous value of :data:`GEOVISTA_MESH_CACHE`.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    global GEOVISTA_MESH_CACHE  # noqa: PLW0603
+
+    if enable is None:
+        enable = True
+
+    original = GEOVISTA_MESH_CACHE
+    GEOVISTA_MESH_CACHE = bool(enable)
+    return original
+
+
+def mesh_cache_clear(key: str | None = None) -> int:
+    """Invalidate entries of the on-disk mesh cache.
+
+    Parameters
+    ----------
+    key : str, optional
+        The key of the mesh cache entry to remove. Defaults to removing
+        all entries of the mesh cache.
+
+    Returns
+    -------
+    int
+        The number of mesh cache entries removed.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    if key is not None:
+        entry = _mesh_cache_path(key)
+        if not entry.is_dir():
+            return 0
+        shutil.rmtree(entry, ignore_errors=True)
+        return 1
+
+    return _mesh_cache_evict(size=0)
+
+
+def mesh_cache_key(*args: object) -> str:
+    """Generate the on-disk mesh cache key of the bridge inputs.
+
+    The key is a digest of the content, shape, dtype and mask of array
+    inputs, and of the :func:`repr` of scalar inputs. The :mod:`geovista`
+    version and :data:`MESH_CACHE_FORMAT` also contribute to the key.
+
+    Parameters
+    ----------
+    *args : object
+        The inputs that determine the geometry and topology of the mesh. Each
+        input must be an :class:`~numpy.ndarray`, a scalar or ``None``. Other
+        array-like inputs must be converted with :func:`numpy.asanyarray`, as
+        their :func:`repr` may not represent their content.
+
+    Returns
+    -------
+    str
+        The hexadecimal mesh cache key.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    import geovista
+
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(f"{geovista.__version__}:{MESH_CACHE_FORMAT}".encode())
+
+    for arg in args:
+        if isinstance(arg, np.ndarray):
+            data = np.ascontiguousarray(np.ma.getdata(arg))
+            digest.update(f"{data.dtype.str}{data.shape}".encode())
+            digest.update(memoryview(data).cast("B"))
+            if np.ma.is_masked(arg):
+                digest.update(np.packbits(np.ma.getmaskarray(arg)).tobytes())
+        elif arg is None or isinstance(arg, bool | int | float | str | np.generic):
+            digest.update(repr(arg).encode())
+        else:
+            emsg = (
+                "Require a mesh cache key input that is an array, a scalar or "
+                f"None, got {type(arg).__name__!r}."
+            )
+            raise TypeError(emsg)
+        # separate each argument
+        digest.update(b"\x00")
+
+    return digest.hexdigest()
+
+
+def mesh_cache_load(key: str) -> pv.PolyData | None:
+    """Load the mesh from the on-disk mesh cache.
+
+    The geometry and topology of the mesh are memory-mapped, copy-on-write,
+    from the cache entry. A successful load marks the entry as the most
+    recently used.
+
+    Parameters
+    ----------
+    key : str
+        The mesh cache key, see :func:`mesh_cache_key`.
+
+    Returns
+    -------
+    PolyData or None
+        The cached mesh, or ``None`` if there is no valid cache entry.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    from geovista.bridge import Transform
+
+    entry = _mesh_cache_path(key)
+
+    try:
+        points = np.load(entry / "points.npy", mmap_mode="c")
+        offsets = np.load(entry / "offsets.npy", mmap_mode="c")
+        connectivity = np.load(entry / "connectivity.npy", mmap_mode="c")
+        # open the file explicitly, as numpy leaks it for a corrupt archive
+        with (entry / "field.npz").open("rb") as fh, np.load(fh) as field:
+            field_data = dict(field)
+        # mark entry as most recently used
+        os.utime(entry)
+    except (OSError, ValueError, EOFError, zipfile.BadZipFile):
+        # a missing, truncated or corrupt entry is a cache miss
+        return None
+
+    faces = Transform._create_cells(offsets, connectivity)  # noqa: SLF001
+    mesh = pv.PolyData(points, faces=faces)
+
+    for name, value in field_data.items():
+        mesh.field_data[name] = value
+
+    return mesh
+
+
+def mesh_cache_save(key: str, mesh: pv.PolyData) -> Path:
+    """Save the geometry, topology and field data of the mesh to the cache.
+
+    The entry is written atomically, after which the least recently used
+    entries are evicted to honour :data:`GEOVISTA_MESH_CACHE_SIZE`.
+
+    Parameters
+    ----------
+    key : str
+        The mesh cache key, see :func:`mesh_cache_key`.
+    mesh : PolyData
+        The mesh to be cached. Any point or cell data is ignored.
+
+    Returns
+    -------
+    Path
+        The path of the mesh cache entry.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    entry = _mesh_cache_path(key)
+    root = entry.parent
+    root.mkdir(parents=True, exist_ok=True)
+
+    # write to a hidden temporary directory, then atomically rename
+    tmp = Path(tempfile.mkdtemp(prefix=f".{key}.", dir=root))
+    try:
+        np.save(tmp / "points.npy", np.asarray(mesh.points))
+        np.save(tmp / "offsets.npy", np.asarray(mesh._offset_array))  # noqa: SLF001
+        np.save(
+            tmp / "connectivity.npy",
+            np.asarray(mesh._connectivity_array),  # noqa: SLF001
+        )
+        field_data = {
+            name: np.asarray(mesh.field_data[name]) for name in mesh.field_data
+        }
+        np.savez(tmp / "field.npz", **field_data)
+        tmp.rename(entry)
+    except OSError:
+        # the entry may already exist e.g., cached by another process
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    _mesh_cache_evict()
+
+    return entry
+
+
 def reload_registry(fname: str | None = None) -> None:
     """Refresh the registry of the :data:`CACHE`.
 
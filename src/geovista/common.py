@@ -13,18 +13,25 @@ Notes
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from collections.abc import Iterable
+from copy import deepcopy
 from enum import StrEnum
 import importlib
+import os
 import pkgutil
 import sys
-from typing import TYPE_CHECKING
+import threading
+from typing import TYPE_CHECKING, NamedTuple
+import warnings
 
 import lazy_loader as lazy
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     import numpy as np
-    from numpy.typing import ArrayLike
+    from numpy.typing import ArrayLike, DTypeLike
     import pyvista as pv
 
 # lazy import third-party dependencies
@@ -36,12 +43,18 @@ __all__ = [
     "BASE",
     "CENTRAL_MERIDIAN",
     "COASTLINES_RESOLUTION",
+    "GEOMETRY_DTYPE",
+    "GEOVISTA_LONLAT_CACHE",
     "GV_CELL_IDS",
     "GV_FIELD_CRS",
+    "GV_FIELD_LONLATS",
     "GV_FIELD_NAME",
     "GV_FIELD_RADIUS",
+    "GV_FIELD_RADIUS_MTIME",
     "GV_FIELD_RESOLUTION",
+    "GV_FIELD_TEXTURE",
     "GV_FIELD_ZSCALE",
+    "GV_LONLATS",
     "GV_POINT_IDS",
     "GV_REMESH_POINT_IDS",
     "JUPYTER_BACKEND",
@@ -58,15 +71,19 @@ __all__ = [
     "ZTRANSFORM_FACTOR",
     "Preference",
     "StrEnumPlus",
+    "TemplateCacheInfo",
     "active_kernel",
     "cast_UnstructuredGrid_to_PolyData",
     "distance",
     "from_cartesian",
+    "geometry_dtype",
     "get_modules",
+    "lonlat_cache",
     "nan_mask",
     "point_cloud",
     "sanitize_data",
     "set_jupyter_backend",
+    "set_lonlats",
     "to_cartesian",
     "to_lonlat",
     "to_lonlats",
@@ -87,24 +104,44 @@ CENTRAL_MERIDIAN: float = 0.0
 COASTLINES_RESOLUTION: str = "10m"
 """Default Natural Earth coastline resolution."""
 
+GEOMETRY_DTYPE: str = "float64"
+"""Default floating point precision of mesh geometry, ``float32`` or ``float64``."""
+
+GEOVISTA_LONLAT_CACHE: bool = (
+    os.environ.get("GEOVISTA_LONLAT_CACHE", "false").lower() == "true"
+)
+"""Whether the bridge attaches the geographic coordinates of the mesh points."""
+
 GV_CELL_IDS: str = "gvOriginalCellIds"
 """Name of the geovista cell indices array."""
 
 GV_FIELD_CRS: str = "gvCRS"
 """The field array name of the CF serialized pyproj CRS."""
 
+GV_FIELD_LONLATS: str = "gvLonLatsMTime"
+"""The field array name of the mesh points modification time of :data:`GV_LONLATS`."""
+
 GV_FIELD_NAME: str = "gvName"
 """The field array name of the mesh containing field, point and/or cell data."""
 
 GV_FIELD_RADIUS: str = "gvRadius"
 """The field array name of the mesh radius."""
 
+GV_FIELD_RADIUS_MTIME: str = "gvRadiusMTime"
+"""The field array name of the mesh points modification time of a verified radius."""
+
 GV_FIELD_RESOLUTION: str = "gvResolution"
 """The field array name of the mesh resolution e.g., coastlines."""
 
+GV_FIELD_TEXTURE: str = "gvTextureMTime"
+"""The field array name of the points modification time and meridian of the UVs."""
+
 GV_FIELD_ZSCALE: str = "gvZScale"
 """The field array name of the mesh proportional multiplier for z-axis levels."""
 
+GV_LONLATS: str = "gvLonLats"
+"""Name of the geovista point array of geographic (lon, lat, zlevel) coordinates."""
+
 GV_POINT_IDS: str = "gvOriginalPointIds"
 """Name of the geovista point indices array."""
 
@@ -237,6 +274,687 @@ class Preference(StrEnumPlus):
     POINT = "point"
 
 
+class TemplateCacheInfo(NamedTuple):
+    """The statistics of a template cache of derived mesh geometry.
+
+    See :func:`geovista.core.slice_cache_info` and
+    :func:`geovista.transform.projection_cache_info`.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+
+    hits: int
+    """The number of meshes served from the cache."""
+
+    misses: int
+    """The number of meshes computed and offered to the cache."""
+
+    maxsize: int
+    """The maximum number of meshes held by the cache."""
+
+    currsize: int
+    """The current number of meshes held by the cache."""
+
+
+class _Interpolation(NamedTuple):
+    """The interpolation of the points inserted along the seam of a template.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+
+    rows: np.ndarray
+    """The indices of the template points inserted along the seam."""
+
+    ids: np.ndarray
+    """The source mesh point indices of the triangle containing each point."""
+
+    weights: np.ndarray
+    """The barycentric weights of each point within its triangle."""
+
+
+class _TemplateCache:  # numpydoc ignore=PR01
+    """A bounded least recently used cache of derived mesh geometry.
+
+    Each entry is a template of the geometry and index mappings of a mesh
+    derived from a source mesh e.g., by slicing, along with the interpolation
+    of any points inserted along its seam and the warnings issued when it was
+    derived. The current data of the source mesh is remapped onto a copy of
+    the template when served. See :func:`_remap`.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+
+    def __init__(self, mappings: Iterable[str]) -> None:
+        """Create an empty template cache.
+
+        Parameters
+        ----------
+        mappings : iterable of str
+            The names of the template index mapping arrays retained by the
+            cache.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        self.mappings = tuple(mappings)
+        self._entries: OrderedDict[
+            tuple, tuple[pv.PolyData, _Interpolation, tuple[str | Warning, ...]]
+        ] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def __iter__(self) -> Iterator[tuple]:
+        """Iterate over the cache keys, in least recently used order.
+
+        Returns
+        -------
+        Iterator
+            The cache keys.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        with self._lock:
+            return iter(list(self._entries))
+
+    def __len__(self) -> int:
+        """Determine the number of entries in the cache.
+
+        Returns
+        -------
+        int
+            The number of cache entries.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        return len(self._entries)
+
+    def clear(self, mesh: pv.PolyData | None = None) -> int:
+        """Invalidate entries of the cache.
+
+        Parameters
+        ----------
+        mesh : PolyData, optional
+            The source mesh whose entries are to be removed. Defaults to
+            removing all entries of the cache, and resetting its statistics.
+
+        Returns
+        -------
+        int
+            The number of cache entries removed.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        with self._lock:
+            if mesh is None:
+                keys = list(self._entries)
+                self._hits = self._misses = 0
+            else:
+                fingerprint = _fingerprint(mesh)
+                keys = [key for key in self._entries if key[0] == fingerprint]
+
+            for key in keys:
+                del self._entries[key]
+
+        return len(keys)
+
+    def get(self, key: tuple, mesh: pv.PolyData) -> pv.PolyData | None:
+        """Get the cached geometry with the data of the `mesh` attached.
+
+        The warnings issued when the geometry was derived are issued again,
+        on behalf of the caller of the function consulting the cache.
+
+        Parameters
+        ----------
+        key : tuple
+            The cache key, led by the fingerprint of the `mesh`.
+        mesh : PolyData
+            The source mesh providing the data arrays.
+
+        Returns
+        -------
+        PolyData
+            The derived mesh, or ``None`` if the `key` is not cached.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        with self._lock:
+            if (entry := self._entries.get(key)) is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+
+        template, interpolation, wmsgs = entry
+
+        for wmsg in wmsgs:
+            warnings.warn(wmsg, stacklevel=3)
+
+        return _remap(template, mesh, self.mappings, interpolation=interpolation)
+
+    def info(self, maxsize: int) -> TemplateCacheInfo:
+        """Report the statistics of the cache.
+
+        Parameters
+        ----------
+        maxsize : int
+            The maximum number of entries held by the cache.
+
+        Returns
+        -------
+        TemplateCacheInfo
+            The hits, misses, maximum size and current size of the cache.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        with self._lock:
+            return TemplateCacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                maxsize=maxsize,
+                currsize=len(self._entries),
+            )
+
+    def put(
+        self,
+        key: tuple,
+        source: pv.PolyData,
+        mesh: pv.PolyData,
+        interpolation: _Interpolation,
+        maxsize: int,
+        wmsgs: Iterable[str | Warning] = (),
+    ) -> pv.PolyData:
+        """Cache the geometry and index mappings of the derived `mesh`.
+
+        The least recently used entries are evicted to bound the cache.
+
+        Parameters
+        ----------
+        key : tuple
+            The cache key, led by the fingerprint of the `source` mesh.
+        source : PolyData
+            The source mesh providing the data arrays.
+        mesh : PolyData
+            The mesh derived from the `source` mesh.
+        interpolation : _Interpolation
+            The interpolation of the points inserted along the seam of the
+            `mesh`. See :func:`_interpolation`.
+        maxsize : int
+            The maximum number of entries held by the cache.
+        wmsgs : iterable of str or Warning, optional
+            The warnings issued when deriving the `mesh`.
+
+        Returns
+        -------
+        PolyData
+            The cached geometry with the data of the `source` mesh attached,
+            as served by a subsequent cache hit.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        template: pv.PolyData = mesh.copy(deep=True)
+
+        for data in (template.point_data, template.cell_data):
+            for name in data.keys():  # noqa: SIM118
+                if name not in self.mappings:
+                    del data[name]
+
+        template.field_data.clear()
+
+        with self._lock:
+            self._entries[key] = (template, interpolation, tuple(wmsgs))
+            self._entries.move_to_end(key)
+            while len(self._entries) > maxsize:
+                self._entries.popitem(last=False)
+
+        return _remap(template, source, self.mappings, interpolation=interpolation)
+
+
+# the maximum number of mesh points sampled to verify a trusted mesh radius
+_RADIUS_SAMPLE_SIZE: int = 16
+
+# the relative offsets of the polar points and their neighbouring points
+# within a polar quad-cell, keyed by the bit-mask of the polar point offsets
+_POLE_UNFOLD: dict[int, tuple[tuple[int, int], tuple[int, int]]] = {
+    0b0011: ((0, 1), (3, 2)),
+    0b0110: ((1, 2), (0, 3)),
+    0b1100: ((2, 3), (1, 0)),
+    0b1001: ((0, 3), (1, 2)),
+}
+
+
+def _fingerprint(mesh: pv.PolyData) -> tuple[int, ...]:
+    """Generate a cheap fingerprint of the geometry and topology of the mesh.
+
+    The fingerprint is based on the VTK modification time of the mesh points
+    and cells, and therefore does not detect modifications to the underlying
+    memory of the mesh points that bypass VTK. See
+    :func:`geovista.transform.projection_cache_clear`.
+
+    Parameters
+    ----------
+    mesh : PolyData
+        The mesh to fingerprint.
+
+    Returns
+    -------
+    tuple of int
+        The fingerprint of the mesh.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    points = mesh.GetPoints()
+    cells = (mesh.GetVerts(), mesh.GetLines(), mesh.GetPolys(), mesh.GetStrips())
+
+    return (
+        mesh.n_points,
+        mesh.n_cells,
+        0 if points is None else points.GetMTime(),
+        *(0 if cell is None else cell.GetMTime() for cell in cells),
+    )
+
+
+def _interpolation(template: pv.PolyData, mesh: pv.PolyData) -> _Interpolation | None:
+    """Determine the interpolation of the points inserted along the seam.
+
+    Every point of the `template` is either a copy of the point of the `mesh`
+    given by its :data:`GV_POINT_IDS` index mapping, or a point inserted along
+    the seam of a sliced mesh within the cell of the `mesh` given by the
+    :data:`GV_CELL_IDS` index mapping of a `template` cell containing it. The
+    latter are located within a triangle of their triangulated `mesh` cell, and
+    their point data is interpolated from its barycentric weights.
+
+    Parameters
+    ----------
+    template : PolyData
+        The derived geometry and its index mappings.
+    mesh : PolyData
+        The mesh from which the `template` is derived.
+
+    Returns
+    -------
+    _Interpolation
+        The interpolation of the inserted points, or ``None`` if the `template`
+        has no index mappings, or a point cannot be located within the `mesh`.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    if GV_CELL_IDS not in template.cell_data or GV_POINT_IDS not in template.point_data:
+        return None
+
+    point_ids = np.asarray(template.point_data[GV_POINT_IDS])
+    cell_ids = np.asarray(template.cell_data[GV_CELL_IDS])
+
+    ranges = ((point_ids, mesh.n_points), (cell_ids, mesh.n_cells))
+
+    if any(ids.size and (ids.min() < 0 or ids.max() >= n) for ids, n in ranges):
+        return None
+
+    exact = template.points == mesh.points[point_ids]
+    (rows,) = np.nonzero(~np.all(exact, axis=-1))
+
+    if rows.size == 0:
+        empty = np.empty((0, 3), dtype=int)
+        return _Interpolation(rows, empty, empty.astype(float))
+
+    # the first template polygon containing each inserted point
+    polys = template.GetPolys()
+    offsets = pv.convert_array(polys.GetOffsetsArray())
+    connectivity = pv.convert_array(polys.GetConnectivityArray())
+    cells = np.repeat(np.arange(offsets.size - 1), np.diff(offsets))
+    first = np.full(template.n_points, -1)
+    first[connectivity[::-1]] = cells[::-1] + template.n_verts + template.n_lines
+    parents = np.where(first[rows] < 0, -1, cell_ids[first[rows]])
+
+    # the triangles of the parent mesh cells, ordered by parent
+    triangles = cast_UnstructuredGrid_to_PolyData(
+        mesh.extract_cells(np.unique(parents))
+    )
+    triangles = triangles.triangulate()
+    corners = np.asarray(triangles.point_data[VTK_POINT_IDS])[triangles.regular_faces]
+    owners = np.asarray(triangles.cell_data[VTK_CELL_IDS])
+    index = np.argsort(owners, kind="stable")
+    corners, owners = corners[index], owners[index]
+
+    # each inserted point paired with each candidate triangle of its parent,
+    # which is not found for a point outside the template polygons
+    start = np.searchsorted(owners, parents, side="left")
+    counts = np.searchsorted(owners, parents, side="right") - start
+
+    if np.any(counts == 0):
+        return None
+
+    firsts = np.cumsum(counts) - counts
+    candidates = np.arange(counts.sum()) - np.repeat(firsts - start, counts)
+    vertices = corners[candidates]
+    a, b, c = (mesh.points[vertices[:, idx]].astype(np.float64) for idx in range(3))
+    point = template.points[np.repeat(rows, counts)].astype(np.float64)
+
+    # the barycentric weights of each point projected onto each triangle
+    v0, v1, v2 = b - a, c - a, point - a
+    d00, d01, d11 = (np.einsum("ij,ij->i", *v) for v in ((v0, v0), (v0, v1), (v1, v1)))
+    d20, d21 = np.einsum("ij,ij->i", v2, v0), np.einsum("ij,ij->i", v2, v1)
+    denom = d00 * d11 - d01**2
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        v = (d11 * d20 - d01 * d21) / denom
+        w = (d00 * d21 - d01 * d20) / denom
+        weights = np.column_stack([1 - v - w, v, w])
+        residual = np.linalg.norm(a + v[:, None] * v0 + w[:, None] * v1 - point, axis=1)
+        size = np.sqrt(np.maximum(d00, d11))
+        # penalize points beyond the triangle, and degenerate triangles
+        score = residual + size * np.maximum(0, -weights.min(axis=1))
+        score[~np.isfinite(score) | (denom <= 0)] = np.inf
+
+    # the best fitting triangle of each point, tolerating the single precision
+    # of the points inserted by some remesh strategies
+    index = np.lexsort((score, np.repeat(np.arange(rows.size), counts)))[firsts]
+    scale = size[index] + np.linalg.norm(point[index], axis=1)
+
+    if np.any(score[index] > 1e-6 * scale):
+        return None
+
+    weights = weights[index]
+    weights[weights < 1e-9] = 0
+    weights /= weights.sum(axis=1, keepdims=True)
+
+    return _Interpolation(rows, vertices[index], weights)
+
+
+def _remap(
+    template: pv.PolyData,
+    mesh: pv.PolyData,
+    mappings: Iterable[str],
+    interpolation: _Interpolation | None = None,
+) -> pv.PolyData:
+    """Copy the `template` geometry with the data of the `mesh` remapped onto it.
+
+    The `template` is derived from the `mesh` e.g., by slicing, and provides the
+    :data:`GV_CELL_IDS` and :data:`GV_POINT_IDS` index mappings back to the
+    cells and points of the `mesh`. The numeric point data of any points
+    inserted along its seam is interpolated, with integer data being rounded.
+
+    Parameters
+    ----------
+    template : PolyData
+        The derived geometry and its index mappings.
+    mesh : PolyData
+        The mesh providing the data arrays.
+    mappings : iterable of str
+        The names of the `template` index mapping arrays, which are not
+        replaced by the data arrays of the `mesh`.
+    interpolation : _Interpolation, optional
+        The interpolation of the points inserted along the seam of the
+        `template`. See :func:`_interpolation`.
+
+    Returns
+    -------
+    PolyData
+        A deep copy of the `template` with the data of the `mesh` attached.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    mappings = set(mappings)
+    result: pv.PolyData = template.copy(deep=True)
+    point_ids, cell_ids = result[GV_POINT_IDS], result[GV_CELL_IDS]
+
+    for name in mesh.point_data.keys():  # noqa: SIM118
+        if name not in mappings:
+            data = np.asarray(mesh.point_data[name])
+            values = data[point_ids]
+            if (
+                interpolation is not None
+                and interpolation.rows.size
+                and data.dtype.kind in "biuf"
+            ):
+                shape = interpolation.weights.shape + (1,) * (data.ndim - 1)
+                weights = interpolation.weights.reshape(shape)
+                # ignore the data of the triangle vertices without influence
+                with np.errstate(invalid="ignore"):
+                    interpolated = np.where(
+                        weights != 0, data[interpolation.ids] * weights, 0
+                    ).sum(axis=1)
+                if data.dtype.kind != "f":
+                    interpolated = np.floor(interpolated + 0.5)
+                values[interpolation.rows] = interpolated.astype(data.dtype)
+            result.point_data[name] = values
+
+    for name, data in mesh.cell_data.items():
+        if name not in mappings:
+            result.cell_data[name] = np.asarray(data)[cell_ids]
+
+    for field in mesh.field_data:
+        result.field_data[field] = deepcopy(mesh.field_data[field])
+
+    info = mesh.active_scalars_info
+    result.set_active_scalars(name=None)
+    result.set_active_scalars(info.name, preference=info.association.name.lower())
+
+    return result
+
+
+def _get_lonlats(mesh: pv.PolyData) -> np.ndarray | None:
+    """Get the valid geographic coordinates attached to the mesh points.
+
+    The coordinates are only valid if the mesh points have not been modified
+    since they were attached by :func:`set_lonlats`.
+
+    Parameters
+    ----------
+    mesh : PolyData
+        The mesh with the attached geographic coordinates.
+
+    Returns
+    -------
+    ndarray
+        The ``(N, 3)`` longitude, latitude and zlevel of the mesh points, or
+        ``None`` if not attached or no longer valid.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    if GV_LONLATS not in mesh.point_data or GV_FIELD_LONLATS not in mesh.field_data:
+        return None
+
+    points = mesh.GetPoints()
+
+    if points is None or mesh.field_data[GV_FIELD_LONLATS][0] != points.GetMTime():
+        return None
+
+    lonlats = mesh.point_data[GV_LONLATS]
+
+    return lonlats if lonlats.shape == (mesh.n_points, 3) else None
+
+
+def _trusted_radius(mesh: pv.PolyData) -> float | None:
+    """Get the :data:`GV_FIELD_RADIUS` of the mesh, if it can be trusted.
+
+    The radius is trusted if it has been verified by :func:`distance` since the
+    mesh points were last modified, or if a small sample of the mesh points all
+    lie on the radius.
+
+    Parameters
+    ----------
+    mesh : PolyData
+        The mesh with a :data:`GV_FIELD_RADIUS`.
+
+    Returns
+    -------
+    float
+        The radius of the mesh, or ``None`` if it cannot be trusted.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    if (points := mesh.GetPoints()) is None or not mesh.n_points:
+        return None
+
+    radius: float = mesh.field_data[GV_FIELD_RADIUS][0]
+
+    if (
+        GV_FIELD_RADIUS_MTIME in mesh.field_data
+        and mesh.field_data[GV_FIELD_RADIUS_MTIME][0] == points.GetMTime()
+    ):
+        return radius
+
+    size = min(mesh.n_points, _RADIUS_SAMPLE_SIZE)
+    sample = mesh.points[np.linspace(0, mesh.n_points - 1, num=size, dtype=int)]
+    norms = np.sqrt(np.sum(sample * sample, axis=1))
+
+    return radius if np.all(np.isclose(norms, radius)) else None
+
+
+def _unfold_poles(mesh: pv.PolyData, lons: np.ndarray, lats: np.ndarray) -> None:
+    """Unfold the longitudes of the polar points of the mesh in-place.
+
+    Parameters
+    ----------
+    mesh : PolyData
+        The mesh containing the polar points.
+    lons : ndarray
+        The longitudes of the mesh points, which are updated in-place.
+    lats : ndarray
+        The latitudes of the mesh points.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    # TODO @bjlittle: Manage pole longitudes. an alternative future scheme could be
+    #                 more generic and inclusive, but this approach tackles the main
+    #                 use case for now.
+
+    pole_mask = np.isclose(np.abs(lats), 90)
+    pole_pids = np.where(pole_mask)[0]
+    if pole_pids.size:
+        # enforce a common longitude for pole singularities
+        # TODO @bjlittle: Review this strategy.
+        lons[pole_pids] = 0
+
+        if (
+            mesh.n_points
+            and {0, mesh.n_points - 1} == set(pole_pids)
+            and np.unique(lons[1:-1]).size == 1
+        ):
+            # unfold polar end-points of a meridian i.e., a line of constant longitude
+            lons[0] = lons[-1] = lons[1]
+        else:
+            # lookup the relative offsets of the polar points (lhs) and their
+            # neighbouring points (rhs) within a quad-cell, indexed by the bit-mask
+            # of the polar point offsets
+            lookup_lhs = np.zeros((16, 2), dtype=int)
+            lookup_rhs = np.zeros((16, 2), dtype=int)
+            for bits, (lhs_offset, rhs_offset) in _POLE_UNFOLD.items():
+                lookup_lhs[bits], lookup_rhs[bits] = lhs_offset, rhs_offset
+
+            if isinstance(mesh, pv.PolyData):
+                cell_arrays = [
+                    mesh.GetVerts(),
+                    mesh.GetLines(),
+                    mesh.GetPolys(),
+                    mesh.GetStrips(),
+                ]
+            else:
+                cell_arrays = [mesh.GetCells()]
+
+            lhs, rhs = [], []
+
+            # the cell arrays are in cell-index order
+            for cells in cell_arrays:
+                if cells is None or cells.GetNumberOfCells() == 0:
+                    continue
+
+                offsets = pv.convert_array(cells.GetOffsetsArray())
+                connectivity = pv.convert_array(cells.GetConnectivityArray())
+
+                # get the cids (cell-indices) of the cells with polar vertices
+                positions = np.flatnonzero(pole_mask[connectivity])
+                cids = np.unique(np.searchsorted(offsets, positions, side="right") - 1)
+
+                # the pids (point-indices) of the polar quad-cells, with shape (N, 4)
+                cids = cids[offsets[cids + 1] - offsets[cids] == 4]
+                quads = connectivity[offsets[cids][:, np.newaxis] + np.arange(4)]
+
+                # identify the first occurrence of each cell point on the pole
+                polar = pole_mask[quads]
+                for offset in range(1, 4):
+                    polar[:, offset] &= np.all(
+                        quads[:, :offset] != quads[:, offset, np.newaxis], axis=1
+                    )
+
+                # criterion of exactly two points from the quad-cell at the pole
+                # to unfold the polar points longitudes
+                criterion = np.sum(polar, axis=1) == 2
+                quads, polar = quads[criterion], polar[criterion]
+
+                if quads.size:
+                    # compute the bit-mask of the relative offsets of the polar
+                    # points within the polar cell connectivity
+                    bits = polar @ np.array([1, 2, 4, 8])
+
+                    if not np.all(np.isin(bits, list(_POLE_UNFOLD))):
+                        emsg = (
+                            "Failed to unfold a mesh polar quad-cell. Invalid "
+                            "polar points connectivity detected."
+                        )
+                        raise ValueError(emsg)
+
+                    rows = np.arange(quads.shape[0])[:, np.newaxis]
+                    lhs.append(quads[rows, lookup_lhs[bits]].ravel())
+                    rhs.append(quads[rows, lookup_rhs[bits]].ravel())
+
+            if lhs:
+                lhs, rhs = np.concatenate(lhs), np.concatenate(rhs)
+                # a polar point shared by quad-cells is unfolded by the quad-cell
+                # with the highest cell-index
+                _, index = np.unique(lhs[::-1], return_index=True)
+                index = lhs.size - 1 - index
+                lons[lhs[index]] = lons[rhs[index]]
+
+
 def active_kernel() -> bool:
     """Determine whether we are executing within an ``IPython`` kernel.
 
@@ -332,6 +1050,14 @@ def distance(
 
     Notes
     -----
+    The mean distance of a `mesh` with a :data:`GV_FIELD_RADIUS` relative to the
+    default `origin` is trusted to be that radius, without calculating the
+    distance to each point, if either the radius has been verified since the
+    mesh points were last modified, or a small sample of the mesh points lie
+    on the radius. Modifying the memory of the mesh points directly e.g.,
+    in-place arithmetic on a :func:`numpy.asarray` view of the points, is not
+    detected.
+
     .. versionadded:: 0.1.0
 
     """
@@ -347,6 +1073,11 @@ def distance(
         )
         raise ValueError(emsg)
 
+    trusted = mean and not np.any(origin) and GV_FIELD_RADIUS in mesh.field_data
+
+    if trusted and (radius := _trusted_radius(mesh)) is not None:
+        return radius
+
     pts = mesh.points - origin
     result = np.sqrt(np.sum(pts * pts, axis=1))
 
@@ -362,6 +1093,10 @@ def distance(
         if np.isclose(result, given_radius):
             result = given_radius
 
+            if trusted and (points := mesh.GetPoints()) is not None:
+                # record the verification of the radius against the mesh points
+                mesh.field_data[GV_FIELD_RADIUS_MTIME] = np.array([points.GetMTime()])
+
     return result
 
 
@@ -404,89 +1139,34 @@ def from_cartesian(
 
     """
     cloud = point_cloud(mesh)
-    radius = distance(mesh, mean=not cloud)
+    zfields = GV_FIELD_RADIUS in mesh.field_data and GV_FIELD_ZSCALE in mesh.field_data
 
-    lons, lats = to_lonlats(
-        mesh.points, radius=radius, stacked=False, rtol=rtol, atol=atol
-    )
+    if (lonlats := _get_lonlats(mesh)) is not None:
+        # reuse the geographic coordinates attached by geovista.bridge.Transform
+        lons, lats = lonlats[:, 0].copy(), lonlats[:, 1].copy()
 
-    zlevel = np.zeros_like(lons)
+        if rtol is not None or atol is not None:
+            lons = wrap(lons, rtol=rtol, atol=atol)
 
-    if (
-        cloud
-        and GV_FIELD_RADIUS in mesh.field_data
-        and GV_FIELD_ZSCALE in mesh.field_data
-    ):
-        # field data injected by geovista.bridge.Transform.from_points
-        base = mesh[GV_FIELD_RADIUS][0]
-        zscale = mesh[GV_FIELD_ZSCALE][0]
-        zlevel = (radius - base) / (base * zscale)
+        zlevel = lonlats[:, 2].copy() if cloud and zfields else np.zeros_like(lons)
+    else:
+        radius = distance(mesh, mean=not cloud)
 
-    data = [lons, lats, zlevel]
+        lons, lats = to_lonlats(
+            mesh.points, radius=radius, stacked=False, rtol=rtol, atol=atol
+        )
 
-    # TODO @bjlittle: Manage pole longitudes. an alternative future scheme could be
-    #                 more generic and inclusive, but this approach tackles the main
-    #                 use case for now.
+        zlevel = np.zeros_like(lons)
 
-    # TODO @bjlittle: Refactor this into a separate function.
-    pole_pids = np.where(np.isclose(np.abs(lats), 90))[0]
-    if pole_pids.size:
-        # enforce a common longitude for pole singularities
-        # TODO @bjlittle: Review this strategy.
-        lons[pole_pids] = 0
+        if cloud and zfields:
+            # field data injected by geovista.bridge.Transform.from_points
+            base = mesh[GV_FIELD_RADIUS][0]
+            zscale = mesh[GV_FIELD_ZSCALE][0]
+            zlevel = (radius - base) / (base * zscale)
 
-        if (
-            mesh.n_points
-            and {0, mesh.n_points - 1} == set(pole_pids)
-            and np.unique(lons[1:-1]).size == 1
-        ):
-            # unfold polar end-points of a meridian i.e., a line of constant longitude
-            lons[0] = lons[-1] = lons[1]
-        else:
-            pole_submesh = mesh.extract_points(pole_pids)
-            if pole_submesh.n_cells:
-                pole_pids = set(pole_pids)
-                # get the cids (cell-indices) of mesh cells with polar vertices
-                pole_cids = np.unique(pole_submesh[VTK_CELL_IDS])
-                for cid in pole_cids:
-                    # get the pids (point-indices) of the polar cell points
-                    # NOTE:
-                    # pyvista 0.38.0: cell_point_ids(cid) -> get_cell(cid).point_ids
-                    cell_pids = np.array(mesh.get_cell(cid).point_ids)
-                    # unfold polar quad-cells
-                    if len(cell_pids) == 4:
-                        # identify the pids of the cell on the pole
-                        cell_pole_pids = pole_pids.intersection(cell_pids)
-                        # criterion of exactly two points from the quad-cell
-                        # at the pole to unfold the polar points longitudes
-                        if len(cell_pole_pids) == 2:
-                            # compute the relative offset of the polar points
-                            # within the polar cell connectivity
-                            offset = sorted(
-                                [
-                                    np.where(cell_pids == pid)[0][0]
-                                    for pid in cell_pole_pids
-                                ]
-                            )
-                            if offset == [0, 1]:
-                                lhs = cell_pids[offset]
-                                rhs = cell_pids[[3, 2]]
-                            elif offset == [1, 2]:
-                                lhs = cell_pids[offset]
-                                rhs = cell_pids[[0, 3]]
-                            elif offset == [2, 3]:
-                                lhs = cell_pids[offset]
-                                rhs = cell_pids[[1, 0]]
-                            elif offset == [0, 3]:
-                                lhs = cell_pids[offset]
-                                rhs = cell_pids[[1, 2]]
-                            else:
-                                emsg = (
-                                    "Failed to unfold a mesh polar quad-cell. Invalid "
-                                    "polar points connectivity detected."
-                                )
-                                raise ValueError(emsg)
-                            lons[lhs] = lons[rhs]
+        _unfold_poles(mesh, lons, lats)
+
+    data = [lons, lats, zlevel]
 
     if closed_interval:
         if GV_REMESH_POINT_IDS in mesh.point_data:
@@ -517,6 +1197,40 @@ def from_cartesian(
     return np.vstack(data).T if stacked else np.array(data)
 
 
+def geometry_dtype(dtype: DTypeLike | None = None) -> np.dtype:
+    """Determine the floating point precision of mesh geometry.
+
+    Parameters
+    ----------
+    dtype : DTypeLike, optional
+        The requested precision, which must be either ``float32`` or ``float64``.
+        Defaults to :data:`GEOMETRY_DTYPE`.
+
+    Returns
+    -------
+    :class:`~numpy.dtype`
+        The mesh geometry precision.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    if dtype is None:
+        dtype = GEOMETRY_DTYPE
+
+    result = np.dtype(dtype)
+
+    if result not in (np.float32, np.float64):
+        emsg = (
+            "Require a mesh geometry dtype of either 'float32' or 'float64', "
+            f"got '{result}'."
+        )
+        raise ValueError(emsg)
+
+    return result
+
+
 def get_modules(root: str, base: bool | None = True) -> list[str]:
     """Find all submodule names relative to the `root` package.
 
@@ -560,6 +1274,42 @@ def get_modules(root: str, base: bool | None = True) -> list[str]:
     return modules
 
 
+def lonlat_cache(enable: bool | None = None) -> bool:
+    """Control whether the bridge attaches the geographic coordinates of meshes.
+
+    When enabled, the :class:`~geovista.bridge.Transform` attaches the longitude,
+    latitude and zlevel of the mesh points as the :data:`GV_LONLATS` point array,
+    which :func:`from_cartesian` reuses rather than converting the cartesian mesh
+    points. Any subsequent modification of the mesh points invalidates them.
+
+    Updates the status variable :data:`GEOVISTA_LONLAT_CACHE`.
+
+    Parameters
+    ----------
+    enable : bool, optional
+        Whether to enable or disable attaching geographic coordinates. Defaults
+        to ``True``.
+
+    Returns
+    -------
+    bool
+        The previous value of :data:`GEOVISTA_LONLAT_CACHE`.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    global GEOVISTA_LONLAT_CACHE  # noqa: PLW0603
+
+    if enable is None:
+        enable = True
+
+    original = GEOVISTA_LONLAT_CACHE
+    GEOVISTA_LONLAT_CACHE = bool(enable)
+    return original
+
+
 def nan_mask(data: ArrayLike) -> np.ndarray:
     """Replace any masked array values with NaNs.
 
@@ -672,6 +1422,56 @@ def set_jupyter_backend(backend: str | None = None) -> bool:
     return result
 
 
+def set_lonlats(
+    mesh: pv.PolyData,
+    lons: ArrayLike,
+    lats: ArrayLike,
+    zlevel: float | ArrayLike | None = None,
+) -> None:
+    """Attach the geographic coordinates of the mesh points.
+
+    The coordinates are attached as the :data:`GV_LONLATS` point array, and are
+    reused by :func:`from_cartesian` until the mesh points are modified.
+
+    Parameters
+    ----------
+    mesh : PolyData
+        The mesh to attach the geographic coordinates to.
+    lons : ArrayLike
+        The longitudes (degrees) of the mesh points.
+    lats : ArrayLike
+        The latitudes (degrees) of the mesh points.
+    zlevel : float or ArrayLike, default=0
+        The z-axis level of the mesh points.
+
+    Notes
+    -----
+    Modifying the memory of the mesh points directly e.g., in-place arithmetic
+    on a :func:`numpy.asarray` view of the points, is not detected. Either
+    assign ``mesh.points`` or call :func:`set_lonlats` again afterwards.
+
+    .. versionadded:: 0.6.0
+
+    """
+    lons = np.array(wrap(np.ravel(lons)), dtype=np.float64)
+    lats = np.array(lats, dtype=np.float64).ravel()
+    zlevel = np.broadcast_to(0.0 if zlevel is None else zlevel, lons.shape)
+
+    if lons.size != mesh.n_points or lats.size != mesh.n_points:
+        emsg = (
+            f"Require geographic coordinates for '{mesh.n_points:,}' mesh points, "
+            f"got '{lons.size:,}' longitudes and '{lats.size:,}' latitudes."
+        )
+        raise ValueError(emsg)
+
+    # unfold the polar longitudes, as per from_cartesian
+    _unfold_poles(mesh, lons, lats)
+
+    # set_array does not make the array the active scalars of the mesh
+    mesh.point_data.set_array(np.column_stack([lons, lats, zlevel]), GV_LONLATS)
+    mesh.field_data[GV_FIELD_LONLATS] = np.array([mesh.GetPoints().GetMTime()])
+
+
 def to_cartesian(
     lons: ArrayLike,
     lats: ArrayLike,
@@ -679,6 +1479,7 @@ def to_cartesian(
     zlevel: float | ArrayLike | None = None,
     zscale: float | None = None,
     stacked: bool | None = True,
+    dtype: DTypeLike | None = None,
 ) -> np.ndarray:
     """Convert geographic longitudes and latitudes to cartesian ``xyz`` points.
 
@@ -701,6 +1502,11 @@ def to_cartesian(
     stacked : bool, default=True
         Specify whether the resultant xyz points have shape (N, 3).
         Otherwise, they will have shape (3, N).
+    dtype : DTypeLike, optional
+        The floating point precision of the resultant xyz points, either
+        ``float32`` or ``float64``. Note that, the conversion is always
+        performed at double precision, even for single precision `lons` and
+        `lats`. Defaults to :data:`GEOMETRY_DTYPE`.
 
     Returns
     -------
@@ -743,14 +1549,18 @@ def to_cartesian(
 
     radius += radius * zlevel * zscale
 
-    x_rad = np.radians(lons)
-    y_rad = np.radians(90.0 - lats)
-    x = np.ravel(radius * np.sin(y_rad) * np.cos(x_rad))
-    y = np.ravel(radius * np.sin(y_rad) * np.sin(x_rad))
-    z = np.ravel(radius * np.cos(y_rad))
-    xyz = [x, y, z]
+    dtype = geometry_dtype(dtype)
+    # perform the conversion at double precision, regardless of the precision
+    # of the longitudes and latitudes, and round once into the result
+    x_rad = np.radians(lons.astype(np.float64, copy=False))
+    y_rad = np.radians(90.0 - lats.astype(np.float64, copy=False))
+    radius_sin_y = radius * np.sin(y_rad)
+    xyz = np.empty((3, radius_sin_y.size), dtype=dtype)
+    xyz[0] = np.ravel(radius_sin_y * np.cos(x_rad))
+    xyz[1] = np.ravel(radius_sin_y * np.sin(x_rad))
+    xyz[2] = np.ravel(radius * np.cos(y_rad))
 
-    return np.vstack(xyz).T if stacked else np.array(xyz)
+    return xyz.T if stacked else xyz
 
 
 def to_lonlat(
@@ -868,19 +1678,26 @@ def to_lonlats(
 
     base, period = (np.radians(BASE), np.radians(PERIOD)) if radians else (BASE, PERIOD)
 
-    lons = np.arctan2(points[:, 1], points[:, 0])
+    lons = np.arctan2(points[:, 1], points[:, 0], dtype=np.float64)
     if not radians:
         lons = np.degrees(lons)
     lons = wrap(lons, base=base, period=period, rtol=rtol, atol=atol)
 
-    z_radius = points[:, 2] / radius
-    # NOTE: defensive clobber of values outside arcsin domain [-1, 1]
-    #       which is the result of floating point inaccuracies at the extremes
-    if indices := np.where(z_radius > 1):
-        z_radius[indices] = 1.0
-    if indices := np.where(z_radius < -1):
-        z_radius[indices] = -1.0
-    lats = np.arcsin(z_radius)
+    if np.issubdtype(points.dtype, np.floating) and points.dtype.itemsize < 8:
+        # NOTE: arcsin is ill-conditioned near the poles, which at single (or
+        #       lower) precision offsets polar points by ~1e-2 degrees, so use
+        #       the well-conditioned arctan2 at double precision instead
+        xy_radius = np.hypot(points[:, 0], points[:, 1], dtype=np.float64)
+        lats = np.arctan2(points[:, 2], xy_radius, dtype=np.float64)
+    else:
+        z_radius = points[:, 2] / radius
+        # NOTE: defensive clobber of values outside arcsin domain [-1, 1]
+        #       which is the result of floating point inaccuracies at the extremes
+        if indices := np.where(z_radius > 1):
+            z_radius[indices] = 1.0
+        if indices := np.where(z_radius < -1):
+            z_radius[indices] = -1.0
+        lats = np.arcsin(z_radius)
     if not radians:
         lats = np.degrees(lats)
 
@@ -15,6 +15,7 @@ from __future__ import annotations
 
 import copy
 from enum import Enum, auto, unique
+import os
 from typing import TYPE_CHECKING
 import warnings
 
@@ -25,6 +26,7 @@ from .common import (
     CENTRAL_MERIDIAN,
     GV_CELL_IDS,
     GV_FIELD_RADIUS,
+    GV_FIELD_TEXTURE,
     GV_FIELD_ZSCALE,
     GV_POINT_IDS,
     GV_REMESH_POINT_IDS,
@@ -32,8 +34,14 @@ from .common import (
     REMESH_JOIN,
     REMESH_SEAM,
     ZLEVEL_SCALE,
+    StrEnumPlus,
+    TemplateCacheInfo,
+    _fingerprint,
+    _interpolation,
+    _TemplateCache,
     distance,
     from_cartesian,
+    geometry_dtype,
     point_cloud,
     sanitize_data,
     to_cartesian,
@@ -45,7 +53,7 @@ from .filters import remesh
 from .search import find_cell_neighbours
 
 if TYPE_CHECKING:
-    from numpy.typing import ArrayLike
+    from numpy.typing import ArrayLike, DTypeLike
     import pyvista as pv
 
 # lazy import third-party dependencies
@@ -54,12 +62,19 @@ pv = lazy.load("pyvista")
 
 __all__ = [
     "CUT_OFFSET",
+    "GEOVISTA_SLICE_CACHE",
+    "SLICE_CACHE_SIZE",
+    "SLICE_METHOD",
     "SPLINE_N_POINTS",
     "MeridianSlice",
     "SliceBias",
+    "SliceMethod",
     "add_texture_coords",
     "combine",
     "resize",
+    "slice_cache",
+    "slice_cache_clear",
+    "slice_cache_info",
     "slice_cells",
     "slice_lines",
     "slice_mesh",
@@ -68,9 +83,30 @@ __all__ = [
 CUT_OFFSET: float = 1e-5
 """Cartesian west/east bias offset of a slice."""
 
+GEOVISTA_SLICE_CACHE: bool = (
+    os.environ.get("GEOVISTA_SLICE_CACHE", "false").lower() == "true"
+)
+"""Whether :func:`slice_cells` memoizes the sliced mesh geometry."""
+
+SLICE_CACHE_SIZE: int = 8
+"""The maximum number of sliced meshes held by the slice cache."""
+
+SLICE_METHOD: str = "analytic"
+"""The default strategy used to detect the cells of a meridian slice."""
+
 SPLINE_N_POINTS: int = 1
 """The default number of interpolation points along a spline."""
 
+# the sliced mesh index mappings retained by the slice cache
+_SLICE_CACHE_ARRAYS: tuple[str, ...] = (
+    GV_CELL_IDS,
+    GV_POINT_IDS,
+    GV_REMESH_POINT_IDS,
+)
+
+# the sliced mesh geometry and its warnings, in least recently used order
+_SLICE_CACHE = _TemplateCache(_SLICE_CACHE_ARRAYS)
+
 
 @unique
 class SliceBias(Enum):
@@ -86,6 +122,108 @@ class SliceBias(Enum):
     """Preference for a slice to bias cells east of the chosen meridian."""
 
 
+class SliceMethod(StrEnumPlus):
+    """Enumeration of meridian slice cell detection strategies.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+
+    ANALYTIC = "analytic"
+    """Classify the cells from the signed distance of their points to the slice."""
+
+    SPLINE = "spline"
+    """Intersect the mesh with a plane extruded from a spline."""
+
+
+def _slice_method(method: str | SliceMethod | None) -> SliceMethod:
+    """Determine the validated slice method.
+
+    Parameters
+    ----------
+    method : str or SliceMethod, optional
+        The candidate slice method. Defaults to :data:`SLICE_METHOD`.
+
+    Returns
+    -------
+    SliceMethod
+        The slice method enumeration member.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    if method is None:
+        method = SLICE_METHOD
+
+    if not SliceMethod.valid(method):
+        options = " or ".join(f"{item!r}" for item in SliceMethod.values())
+        emsg = f"Expected a slice method of {options}, got '{method}'."
+        raise ValueError(emsg)
+
+    return SliceMethod(method)
+
+
+def _slice_segments(
+    mesh: pv.PolyData,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Find the line segments of the mesh traversing the Antimeridian.
+
+    The signed distance of each segment end-point from the ``z-x`` plane is
+    used to find all traversing segments in bulk, along with their point of
+    intersection with the Antimeridian half of the plane. An end-point on the
+    plane is treated as being on its positive side, consistent with the
+    :attr:`SliceMethod.SPLINE` method. Hence, an end-point on the Antimeridian
+    is detached from each segment that approaches it from the negative side.
+
+    Parameters
+    ----------
+    mesh : :class:`~pyvista.PolyData`
+        The line mesh of 2-point line segments.
+
+    Returns
+    -------
+    tuple of ndarray
+        The cell indices of the segments to be split, the cartesian points of
+        intersection of those segments, the cell indices of the segments to be
+        detached and the point indices of their end-points to be detached.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    lines = mesh.lines.reshape(-1, 3)[:, 1:]
+    points = mesh.points
+    distances = points[:, 1].astype(float)
+    # snap those end-points coincident with the plane
+    distances[np.isclose(distances, 0, rtol=0, atol=distance(mesh) * 1e-8)] = 0
+    distances = distances[lines]
+    positive = distances >= 0
+    (cids,) = np.nonzero(positive[:, 0] != positive[:, 1])
+    distances, pids = distances[cids], lines[cids]
+    weights = distances[:, 0] / (distances[:, 0] - distances[:, 1])
+    start, end = points[pids[:, 0]], points[pids[:, 1]]
+    xyz = start + weights[:, np.newaxis] * (end - start)
+
+    # only those points of intersection on the Antimeridian
+    antimeridian = xyz[:, 0] < 0
+    cids, pids, xyz = cids[antimeridian], pids[antimeridian], xyz[antimeridian]
+    start, end = start[antimeridian], end[antimeridian]
+
+    # detach those segments with an end-point on the Antimeridian, otherwise
+    # split the segment at the point of intersection
+    at_start = np.all(np.isclose(xyz, start), axis=1)
+    at_end = np.all(np.isclose(xyz, end), axis=1)
+    detach = at_start | at_end
+    detach_pids = np.where(at_start, pids[:, 0], pids[:, 1])[detach]
+
+    return cids[~detach], xyz[~detach], cids[detach], detach_pids
+
+
 class MeridianSlice:  # numpydoc ignore=PR01
     """Remesh geolocated mesh along a meridian, from the north-pole to the south-pole.
 
@@ -100,6 +238,7 @@ class MeridianSlice:  # numpydoc ignore=PR01
         mesh: pv.PolyData,
         meridian: float,
         offset: float | None = None,
+        method: str | SliceMethod | None = None,
     ) -> None:
         """Create a `meridian` seam in the `mesh`.
 
@@ -120,6 +259,10 @@ class MeridianSlice:  # numpydoc ignore=PR01
             Offset buffer around the meridian, used to determine those cells west
             and east of that are coincident or bisected by the `meridian`. Defaults
             to :data:`CUT_OFFSET`.
+        method : str or SliceMethod, optional
+            The strategy used to detect the cells coincident or bisected by the
+            `meridian`, either ``analytic`` or ``spline``. Also see
+            :class:`SliceMethod`. Defaults to :data:`SLICE_METHOD`.
 
         Notes
         -----
@@ -130,6 +273,8 @@ class MeridianSlice:  # numpydoc ignore=PR01
             emsg = "Cannot slice a mesh that has been projected."
             raise ValueError(emsg)
 
+        method = _slice_method(method)
+
         self._info = mesh.active_scalars_info
         mesh[GV_CELL_IDS] = np.arange(mesh.n_cells)
         mesh[GV_POINT_IDS] = np.arange(mesh.n_points)
@@ -141,17 +286,116 @@ class MeridianSlice:  # numpydoc ignore=PR01
         self.radius = distance(mesh)
         self.meridian = wrap(meridian)[0]
         self.offset = abs(CUT_OFFSET if offset is None else offset)
-        self.slices = {bias: self._intersection(bias) for bias in SliceBias}
+        self.method = method
+
+        if self.method == SliceMethod.SPLINE:
+            self.slices = {bias: self._intersection(bias) for bias in SliceBias}
+            n_cells = self.slices[SliceBias.EXACT].n_cells
+            self.cell_ids = {
+                bias: set(self.slices[bias][GV_CELL_IDS]) if n_cells else set()
+                for bias in SliceBias
+            }
+        else:
+            self.slices = {}
+            self.cell_ids = self._classify()
 
-        n_cells = self.slices[SliceBias.EXACT].n_cells
-        self.west_ids = (
-            set(self.slices[SliceBias.WEST][GV_CELL_IDS]) if n_cells else set()
-        )
-        self.east_ids = (
-            set(self.slices[SliceBias.EAST][GV_CELL_IDS]) if n_cells else set()
-        )
+        self.west_ids = self.cell_ids[SliceBias.WEST]
+        self.east_ids = self.cell_ids[SliceBias.EAST]
         self.split_ids = self.west_ids.intersection(self.east_ids)
 
+    def _classify(self) -> dict[SliceBias, set[int]]:
+        """Classify the mesh cells coincident or bisected by the meridian.
+
+        Each mesh point is rotated about the z-axis into the frame of the
+        meridian, where its y-coordinate is the signed distance of the point
+        from the plane of the slice. A cell participates in a slice, with or
+        without bias, when the plane crosses the edges of the cell along a
+        segment of non-zero length. This is equivalent to :meth:`_intersection`,
+        but operates directly on the cell connectivity of the mesh.
+
+        Returns
+        -------
+        dict of set
+            The cell indices of the mesh coincident or bisected by the slice,
+            for each :class:`SliceBias`.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        theta = np.radians(self.meridian)
+        points = self.mesh.points
+        distances = -np.sin(theta) * points[:, 0] + np.cos(theta) * points[:, 1]
+        offsets, connectivity = [np.array([0])], []
+        n_connectivity = 0
+
+        # cell indices of a polydata are ordered by verts, lines, polys then strips
+        for cells in (
+            self.mesh.GetVerts(),
+            self.mesh.GetLines(),
+            self.mesh.GetPolys(),
+            self.mesh.GetStrips(),
+        ):
+            if cells.GetNumberOfCells() == 0:
+                continue
+            offsets.append(
+                pv.convert_array(cells.GetOffsetsArray())[1:] + n_connectivity
+            )
+            connectivity.append(pv.convert_array(cells.GetConnectivityArray()))
+            n_connectivity += connectivity[-1].size
+
+        result: dict[SliceBias, set[int]] = {bias: set() for bias in SliceBias}
+
+        if not connectivity:
+            return result
+
+        offsets_array = np.concatenate(offsets)
+        connectivity_array = np.concatenate(connectivity)
+        cell_distances = distances[connectivity_array]
+        lower = np.minimum.reduceat(cell_distances, offsets_array[:-1])
+        upper = np.maximum.reduceat(cell_distances, offsets_array[:-1])
+
+        for bias in SliceBias:
+            y = bias.value * self.offset
+            (cids,) = np.nonzero((lower <= y) & (upper >= y))
+            if cids.size == 0:
+                continue
+            # gather the edges of each candidate cell, from each cell point to
+            # its cyclic neighbour
+            sizes = np.diff(offsets_array)[cids]
+            n_edges = sizes.sum()
+            starts = np.repeat(offsets_array[cids], sizes)
+            edge_cells = np.repeat(np.arange(cids.size), sizes)
+            local = np.arange(n_edges) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+            head = connectivity_array[starts + local]
+            tail = connectivity_array[starts + (local + 1) % np.repeat(sizes, sizes)]
+            # orientate each edge from its lower to upper signed distance, to
+            # ensure that coincident edges yield identical crossing points
+            swap = distances[head] > distances[tail]
+            head, tail = np.where(swap, tail, head), np.where(swap, head, tail)
+            crossing = (distances[head] <= y) & (distances[tail] >= y)
+            head, tail = head[crossing], tail[crossing]
+            edge_cells = edge_cells[crossing]
+            delta = distances[tail] - distances[head]
+            weight = np.divide(
+                y - distances[head],
+                delta,
+                out=np.zeros_like(delta),
+                where=delta != 0,
+            )[:, np.newaxis]
+            xyz = points[head] + weight * (points[tail] - points[head])
+            # discard those cells with a degenerate crossing i.e., a single point
+            splits = np.flatnonzero(np.diff(edge_cells)) + 1
+            indices = np.concatenate([[0], splits])
+            extent = np.maximum.reduceat(xyz, indices) - np.minimum.reduceat(
+                xyz, indices
+            )
+            valid = np.any(extent > 0, axis=1)
+            result[bias] = set(cids[edge_cells[indices][valid]].tolist())
+
+        return result
+
     def _intersection(
         self, bias: SliceBias, n_points: float | None = None
     ) -> pv.PolyData:
@@ -234,15 +478,14 @@ class MeridianSlice:  # numpydoc ignore=PR01
 
         mesh = pv.PolyData()
 
-        # there is no intersection between the spline extruded in the
-        # z-plane and the mesh
-        if self.slices[SliceBias.EXACT].n_cells == 0:
+        # there is no intersection between the slice and the mesh
+        if not self.cell_ids[SliceBias.EXACT]:
             return mesh
 
         if split_cells:
             extract_ids = self.split_ids
         else:
-            whole_ids = set(self.slices[bias][GV_CELL_IDS]).difference(self.split_ids)
+            whole_ids = self.cell_ids[bias].difference(self.split_ids)
             extract_ids = whole_ids
 
         if extract_ids:
@@ -264,6 +507,7 @@ def add_texture_coords(
     mesh: pv.PolyData,
     meridian: float | None = None,
     antimeridian: bool | None = False,
+    inplace: bool | None = False,
 ) -> pv.PolyData:
     """Compute and attach texture coordinates, in UV space, to the mesh.
 
@@ -279,14 +523,21 @@ def add_texture_coords(
         :data:`geovista.common.CENTRAL_MERIDIAN`.
     antimeridian : bool, default=False
         Whether to flip the given `meridian` to use its anti-meridian instead.
+    inplace : bool, default=False
+        Attach the texture coordinates to an already sliced `mesh` in-place.
+        Otherwise, attach them to a shallow copy of the sliced `mesh`, which
+        shares all other data arrays with the `mesh`.
 
     Returns
     -------
     :class:`~pyvista.PolyData`
-        The original mesh with inplace texture coordinates attached.
+        The sliced mesh with texture coordinates attached.
 
     Notes
     -----
+    The texture coordinates of a mesh are reused by subsequent calls with the
+    same `meridian`, providing that the mesh points have not been modified.
+
     .. versionadded:: 0.1.0
 
     """
@@ -304,17 +555,30 @@ def add_texture_coords(
 
     if GV_REMESH_POINT_IDS not in mesh.point_data:
         mesh = slice_cells(mesh, meridian=meridian)
-    else:
-        mesh = mesh.copy(deep=True)
+    elif not inplace:
+        mesh = mesh.copy(deep=False)
+
+    points = mesh.GetPoints()
+    stamp = np.array([points.GetMTime(), meridian], dtype=np.float64)
+    t_coord = mesh.active_texture_coordinates
+
+    if (
+        t_coord is not None
+        and t_coord.shape == (mesh.n_points, 2)
+        and GV_FIELD_TEXTURE in mesh.field_data
+        and np.array_equal(mesh.field_data[GV_FIELD_TEXTURE], stamp)
+    ):
+        # reuse the texture coordinates of the unmodified mesh points
+        return mesh
 
     # convert from cartesian xyz to spherical lat/lons
     lonlat = from_cartesian(mesh, closed_interval=True)
-    lons, lats = lonlat[:, 0], lonlat[:, 1]
     # convert to normalised UV space
-    u_coord = (lons + 180) / 360
-    v_coord = (lats + 90) / 180
-    t_coord = np.vstack([u_coord, v_coord]).T
+    t_coord = np.empty((mesh.n_points, 2), dtype=np.float64)
+    t_coord[:, 0] = (lonlat[:, 0] + 180) / 360
+    t_coord[:, 1] = (lonlat[:, 1] + 90) / 180
     mesh.active_texture_coordinates = t_coord
+    mesh.field_data[GV_FIELD_TEXTURE] = stamp
 
     return mesh
 
@@ -326,8 +590,10 @@ def combine(
 ) -> pv.PolyData:
     """Combine two or more meshes into one mesh.
 
-    Only meshes with cells will be combined. Support is not yet provided for combining
-    meshes that consist of only points or lines.
+    The meshes may consist of any mixture of points, vertices, lines, polygons
+    and triangle strips. The size of the resultant mesh is determined up front,
+    and the points, cells and data of each input mesh are written directly into
+    preallocated arrays.
 
     Note that, no check is performed to ensure that mesh cells do not overlap.
     However, meshes may share coincident points. Coincident point data from the
@@ -360,12 +626,95 @@ def combine(
         emsg = "Expected one or more meshes to combine."
         raise ValueError(emsg)
 
+    for i, mesh in enumerate(meshes):
+        if not isinstance(mesh, pv.PolyData):
+            emsg = (
+                f"Can only combine 'pyvista.PolyData' meshes, input mesh "
+                f"#{i + 1} has type '{mesh.__class__.__name__}'."
+            )
+            raise TypeError(emsg)
+
     if len(meshes) == 1:
         return meshes[0]
 
     first: pv.PolyData = meshes[0]
-    combined_points, combined_faces = [], []
-    n_points = 0
+
+    # the offsets and connectivity of the verts, lines, polys and strips of each
+    # mesh, which is the order of the cell indices within a polydata
+    cell_arrays = [
+        [
+            (
+                pv.convert_array(cells.GetOffsetsArray()),
+                pv.convert_array(cells.GetConnectivityArray()),
+            )
+            for cells in (
+                mesh.GetVerts(),
+                mesh.GetLines(),
+                mesh.GetPolys(),
+                mesh.GetStrips(),
+            )
+        ]
+        for mesh in meshes
+    ]
+
+    # the number of points, and the number of cells and connectivity of each
+    # cell type per mesh, with shape (M,) and (M, 4) respectively
+    n_points = np.array([mesh.n_points for mesh in meshes])
+    n_cells = np.array(
+        [[offsets.size - 1 for offsets, _ in arrays] for arrays in cell_arrays]
+    )
+    n_connectivity = np.array(
+        [[connectivity.size for _, connectivity in arrays] for arrays in cell_arrays]
+    )
+
+    # the start of each mesh within the combined points, and within the
+    # combined cells and connectivity of each cell type
+    point_starts = np.concatenate([[0], np.cumsum(n_points)])
+    cell_starts = np.vstack([np.zeros(4, dtype=int), np.cumsum(n_cells, axis=0)])
+    connectivity_starts = np.vstack(
+        [np.zeros(4, dtype=int), np.cumsum(n_connectivity, axis=0)]
+    )
+
+    points = np.empty(
+        (point_starts[-1], 3), dtype=np.result_type(*[mesh.points for mesh in meshes])
+    )
+    for mesh, start in zip(meshes, point_starts, strict=False):
+        points[start : start + mesh.n_points] = mesh.points
+
+    # avoid the implicit vertex cells of a polydata constructed from points
+    combined = pv.PolyData()
+    combined.points = points
+    setters = (
+        combined.SetVerts,
+        combined.SetLines,
+        combined.SetPolys,
+        combined.SetStrips,
+    )
+
+    for kind, setter in enumerate(setters):
+        if not (total := cell_starts[-1, kind]):
+            continue
+
+        offsets = np.empty(total + 1, dtype=pv.ID_TYPE)
+        connectivity = np.empty(connectivity_starts[-1, kind], dtype=pv.ID_TYPE)
+
+        for m, arrays in enumerate(cell_arrays):
+            mesh_offsets, mesh_connectivity = arrays[kind]
+            cstart, kstart = cell_starts[m, kind], connectivity_starts[m, kind]
+            # offset the mesh cells by the cumulative connectivity count, and the
+            # mesh connectivity by the cumulative points count
+            np.add(
+                mesh_offsets,
+                kstart,
+                out=offsets[cstart : cstart + mesh_offsets.size],
+            )
+            np.add(
+                mesh_connectivity,
+                point_starts[m],
+                out=connectivity[kstart : kstart + mesh_connectivity.size],
+            )
+
+        setter(pv.CellArray.from_arrays(offsets, connectivity))
 
     if data:
         # determine the common point, cell and field array names
@@ -378,48 +727,7 @@ def combine(
             pv.core.dataset.ActiveArrayInfoTuple(*first.active_scalars_info)
         }
 
-    for i, mesh in enumerate(meshes):
-        if not isinstance(mesh, pv.PolyData):
-            emsg = (
-                f"Can only combine 'pyvista.PolyData' meshes, input mesh "
-                f"#{i + 1} has type '{mesh.__class__.__name__}'."
-            )
-            raise TypeError(emsg)
-
-        if mesh.n_lines:
-            emsg = (
-                f"Can only combine meshes with cells, input mesh #{i + 1} "
-                "contains lines."
-            )
-            raise TypeError(emsg)
-
-        if mesh.n_cells == 0:
-            emsg = (
-                f"Can only combine meshes with cells, input mesh #{i + 1} has no cells."
-            )
-            raise TypeError(emsg)
-
-        combined_points.append(mesh.points.copy())
-        faces = mesh.faces.copy()
-
-        if n_points:
-            # compute the number of vertices (N) for each face of the mesh
-            faces_n = np.diff(mesh._offset_array)  # noqa: SLF001
-            # determine the N offset for each face within the faces array
-            # a face entry consists of (N, v1, v2, ..., vN), where vN is the Nth
-            # vertex offset (connectivity) for that face into the associated mesh
-            # points array
-            faces_n_offset = mesh._offset_array + np.arange(mesh._offset_array.size)  # noqa: SLF001
-            # offset the current mesh connectivity by the cumulative mesh points count
-            faces += n_points
-            # reinstate N for each face entry
-            faces[faces_n_offset[:-1]] = faces_n
-
-        combined_faces.append(faces)
-        # accumulate running totals of combined mesh points and cells
-        n_points += mesh.n_points
-
-        if data:
+        for mesh in meshes[1:]:
             # perform intersection to determine common names
             common_point_data &= set(mesh.point_data.keys())
             common_cell_data &= set(mesh.cell_data.keys())
@@ -429,35 +737,41 @@ def combine(
                     pv.core.dataset.ActiveArrayInfoTuple(*mesh.active_scalars_info)
                 }
 
-    points = np.vstack(combined_points)
-    faces = np.hstack(combined_faces)
-    combined = pv.PolyData(points, faces=faces)
-
-    def combine_data(names: set[str], field: bool | None = False) -> None:
-        """Combine point, cell or field data from the meshes onto a single mesh.
+        # the combined cell indices are ordered by cell type, then by mesh,
+        # hence the start of each mesh cell type within the combined cells,
+        # and within the cells of the mesh
+        type_starts = np.concatenate([[0], np.cumsum(cell_starts[-1])])
+        dst_starts = type_starts[:-1] + cell_starts[:-1]
+        src_starts = np.hstack(
+            [np.zeros((len(meshes), 1), dtype=int), np.cumsum(n_cells, axis=1)]
+        )
 
-        Parameters
-        ----------
-        names : set of str
-            The names of the point, cell or field data to be combined.
-        field : bool, optional
-            Whether the data is field data. Defaults to False.
+        for name in common_point_data:
+            arrays = [np.asarray(mesh.point_data[name]) for mesh in meshes]
+            values = np.empty(
+                (point_starts[-1], *arrays[0].shape[1:]),
+                dtype=np.result_type(*arrays),
+            )
+            for array, start in zip(arrays, point_starts, strict=False):
+                values[start : start + array.shape[0]] = array
+            combined.point_data[name] = values
+
+        for name in common_cell_data:
+            arrays = [np.asarray(mesh.cell_data[name]) for mesh in meshes]
+            values = np.empty(
+                (type_starts[-1], *arrays[0].shape[1:]),
+                dtype=np.result_type(*arrays),
+            )
+            for m, array in enumerate(arrays):
+                for kind in np.flatnonzero(n_cells[m]):
+                    dst, src = dst_starts[m, kind], src_starts[m, kind]
+                    count = n_cells[m, kind]
+                    values[dst : dst + count] = array[src : src + count]
+            combined.cell_data[name] = values
 
-        """
-        for name in names:
-            if field:
-                combined.field_data[name] = first[name]
-            else:
-                data = [mesh[name] for mesh in meshes]
-                combined[name] = (
-                    np.vstack(data) if data[0].ndim > 1 else np.hstack(data)
-                )
+        for name in common_field_data:
+            combined.field_data[name] = first[name]
 
-    if data:
-        # attach any common combined data
-        combine_data(common_point_data)
-        combine_data(common_cell_data)
-        combine_data(common_field_data, field=True)
         # determine a sensible active scalar array, by opting for the first
         # common active scalar array from the input meshes
         combined.active_scalars_name = None
@@ -483,6 +797,7 @@ def resize(
     zlevel: int | None = None,
     zscale: float | None = None,
     inplace: bool | None = False,
+    dtype: DTypeLike | None = None,
 ) -> pv.PolyData:
     """Change the radius of the spherical mesh.
 
@@ -500,6 +815,10 @@ def resize(
         :data:`geovista.common.ZLEVEL_SCALE`.
     inplace : bool, default=False
         Update `mesh` in-place.
+    dtype : DTypeLike, optional
+        The floating point precision of the resized mesh points, either
+        ``float32`` or ``float64``. Defaults to the precision of the `mesh`
+        points.
 
     Returns
     -------
@@ -535,6 +854,11 @@ def resize(
 
     zlevel = 0 if zlevel is None else int(zlevel)
 
+    if dtype is None:
+        dtype = np.float32 if mesh.points.dtype == np.float32 else np.float64
+
+    dtype = geometry_dtype(dtype)
+
     if cloud:
         update = bool(zlevel)
         if not update:
@@ -547,15 +871,27 @@ def resize(
             )
     else:
         new_radius = radius + radius * zlevel * zscale
-        update = bool(new_radius) and not np.isclose(distance(mesh), new_radius)
+        norms = distance(mesh, mean=False)
+        update = bool(new_radius) and not np.isclose(np.mean(norms), new_radius)
 
     if update:
-        lonlat = from_cartesian(mesh)
-        if cloud:
-            zlevel += lonlat[:, 2]
-        xyz = to_cartesian(
-            lonlat[:, 0], lonlat[:, 1], radius=radius, zlevel=zlevel, zscale=zscale
-        )
+        if not cloud and np.all(norms):
+            # the radial scaling of each point is equivalent to converting the
+            # points to lon/lat and back to cartesian at the new radius
+            scale = new_radius / norms
+            xyz = (mesh.points * scale[:, np.newaxis]).astype(dtype, copy=False)
+        else:
+            lonlat = from_cartesian(mesh)
+            if cloud:
+                zlevel += lonlat[:, 2]
+            xyz = to_cartesian(
+                lonlat[:, 0],
+                lonlat[:, 1],
+                radius=radius,
+                zlevel=zlevel,
+                zscale=zscale,
+                dtype=dtype,
+            )
         if not inplace:
             mesh = mesh.copy()
         mesh.points = xyz
@@ -564,16 +900,105 @@ def resize(
         else:
             radius = new_radius
         mesh.field_data[GV_FIELD_RADIUS] = np.array([radius])
+    elif mesh.points.dtype != dtype:
+        if not inplace:
+            mesh = mesh.copy()
+        mesh.points = mesh.points.astype(dtype)
 
     return mesh
 
 
+def slice_cache(enable: bool | None = None) -> bool:
+    """Control whether :func:`slice_cells` uses the slice cache.
+
+    The slice cache memoizes the sliced geometry of a mesh, keyed by a
+    fingerprint of the mesh geometry and the slice `meridian`, tolerances
+    and method. Subsequent slices of the same mesh geometry reuse the cached
+    geometry, with the current data arrays of the mesh remapped onto it
+    through its :data:`~geovista.common.GV_CELL_IDS` and
+    :data:`~geovista.common.GV_POINT_IDS` index mappings.
+
+    Updates the status variable :data:`GEOVISTA_SLICE_CACHE`.
+
+    Parameters
+    ----------
+    enable : bool, optional
+        Whether to enable or disable the slice cache. Defaults to ``True``.
+
+    Returns
+    -------
+    bool
+        The previous value of :data:`GEOVISTA_SLICE_CACHE`.
+
+    Notes
+    -----
+    The point data of a mesh bisected by the slice `meridian` is interpolated
+    onto the points inserted along its seam from the cached barycentric weights
+    of each point within its original cell.
+
+    .. versionadded:: 0.6.0
+
+    """
+    global GEOVISTA_SLICE_CACHE  # noqa: PLW0603
+
+    if enable is None:
+        enable = True
+
+    original = GEOVISTA_SLICE_CACHE
+    GEOVISTA_SLICE_CACHE = bool(enable)
+    return original
+
+
+def slice_cache_clear(mesh: pv.PolyData | None = None) -> int:
+    """Invalidate entries of the slice cache.
+
+    Modifying the points of a mesh through ``mesh.points`` invalidates its
+    cached slices automatically. However, modifications that bypass VTK,
+    such as in-place arithmetic on a :func:`numpy.asarray` view of the mesh
+    points, must be followed by an explicit invalidation.
+
+    Parameters
+    ----------
+    mesh : PolyData, optional
+        The mesh whose cached slices are to be removed. Defaults to removing
+        all entries of the slice cache, and resetting its statistics.
+
+    Returns
+    -------
+    int
+        The number of slice cache entries removed.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    return _SLICE_CACHE.clear(mesh=mesh)
+
+
+def slice_cache_info() -> TemplateCacheInfo:
+    """Report the statistics of the slice cache.
+
+    Returns
+    -------
+    TemplateCacheInfo
+        The hits, misses, maximum size and current size of the slice cache.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    return _SLICE_CACHE.info(SLICE_CACHE_SIZE)
+
+
 def slice_cells(
     mesh: pv.PolyData,
     meridian: float | None = None,
     antimeridian: bool | None = False,
     rtol: float | None = None,
     atol: float | None = None,
+    method: str | SliceMethod | None = None,
 ) -> pv.PolyData:
     """Cut a cell-based mesh along a `meridian`, breaking cell connectivity.
 
@@ -599,6 +1024,10 @@ def slice_cells(
     atol : float, optional
         The absolute tolerance for longitudes close to the 'wrap meridian' -
         see :func:`geovista.common.wrap` for more.
+    method : str or SliceMethod, optional
+        The strategy used to detect the cells coincident or bisected by the
+        meridian, either ``analytic`` or ``spline``. Also see
+        :class:`SliceMethod`. Defaults to :data:`SLICE_METHOD`.
 
     Returns
     -------
@@ -628,14 +1057,24 @@ def slice_cells(
     meridian = wrap(meridian)[0]
     assert isinstance(meridian, float)
 
+    method = _slice_method(method)
+    key = None
+
+    if GEOVISTA_SLICE_CACHE and not projected(mesh):
+        key = (_fingerprint(mesh), meridian, rtol, atol, method.value)
+
+        if (cached := _SLICE_CACHE.get(key, mesh)) is not None:
+            return cached
+
     info = mesh.active_scalars_info
-    slicer = MeridianSlice(mesh, meridian)
+    slicer = MeridianSlice(mesh, meridian, method=method)
     mesh_whole = slicer.extract(split_cells=False)
     mesh_split = slicer.extract(split_cells=True)
     result: pv.PolyData = mesh.copy(deep=True)
 
     meshes = []
     remeshed_ids = np.array([], dtype=int)
+    wmsgs = []
 
     if mesh_whole.n_cells:
         lonlat = from_cartesian(mesh_whole, rtol=rtol, atol=atol)
@@ -660,20 +1099,19 @@ def slice_cells(
         # TODO @bjlittle: Investigate defensive removal of cells that span the meridian
         #                 and should have been remeshed, but haven't due to their
         #                 geometry ?
-        cids = set(find_cell_neighbours(result, remeshed[GV_CELL_IDS]))
+        cids = set(find_cell_neighbours(mesh, remeshed[GV_CELL_IDS]))
         cids = cids.difference(set(remeshed_ids))
         if cids:
             neighbours = cast(result.extract_cells(list(cids)))
-            xy0 = from_cartesian(neighbours)
-            neighbours.points = xy0
-            xdelta = []
-            for cid in range(neighbours.n_cells):
-                # NOTE: pyvista 0.38.0: cell_points(cid) -> get_cell(cid).points
-                cxpts = neighbours.get_cell(cid).points[:, 0]
-                cxmin, cxmax = cxpts.min(), cxpts.max()
-                xdelta.append(cxmax - cxmin)
-            xdelta_array = np.array(xdelta)
-            bad = np.where(xdelta_array > 270)[0]
+            lons = from_cartesian(neighbours)[:, 0]
+            # calculate the longitude span of each cell in bulk from the
+            # connectivity of the neighbours
+            offsets = neighbours._offset_array[:-1]  # noqa: SLF001
+            cxpts = lons[neighbours._connectivity_array]  # noqa: SLF001
+            xdelta = np.maximum.reduceat(cxpts, offsets) - np.minimum.reduceat(
+                cxpts, offsets
+            )
+            bad = np.where(xdelta > 270)[0]
             if bad.size:
                 bad_cids = np.unique(neighbours[GV_CELL_IDS][bad])
                 plural = "s" if (n_cells := bad_cids.size) > 1 else ""
@@ -683,6 +1121,7 @@ def slice_cells(
                     f"following mesh cell-id{plural} [{naughty}]."
                 )
                 warnings.warn(wmsg, stacklevel=2)
+                wmsgs.append(wmsg)
                 remeshed_ids = np.hstack([remeshed_ids, bad_cids])
 
     if meshes:
@@ -695,11 +1134,106 @@ def slice_cells(
     result.set_active_scalars(name=None)
     result.set_active_scalars(info.name, preference=info.association.name.lower())
 
+    if key is not None and (interpolation := _interpolation(result, mesh)) is not None:
+        # serve the sliced mesh as it would be served by a subsequent cache hit
+        result = _SLICE_CACHE.put(
+            key, mesh, result, interpolation, SLICE_CACHE_SIZE, wmsgs=wmsgs
+        )
+
     return result
 
 
+def _slice_segments_spline(
+    mesh: pv.PolyData, n_points: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Find the line segments of the mesh traversing the Antimeridian.
+
+    The mesh is sliced with a ``z-x`` plane formed by extruding a spline on
+    the x-axis along the z-axis, and each point of intersection is matched to
+    its closest line segment.
+
+    Parameters
+    ----------
+    mesh : :class:`~pyvista.PolyData`
+        The line mesh of 2-point line segments.
+    n_points : int
+        The number of intermediate points for the spline.
+
+    Returns
+    -------
+    tuple of ndarray
+        The cell indices of the segments to be split, the cartesian points of
+        intersection of those segments, the cell indices of the segments to be
+        detached and the point indices of their end-points to be detached.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    radius = distance(mesh)
+    line = pv.Line(pointa=(radius, 0, 0), pointb=(-radius, 0, 0))
+    spline = pv.Spline(line.points, n_points=n_points + 2)
+    intersection = mesh.slice_along_line(spline)
+    lonlat = from_cartesian(intersection)
+    antimeridian = np.isclose(np.abs(lonlat[:, 0]), 180)
+
+    # nop - there are no points of intersection
+    if antimeridian.sum() == 0:
+        empty = np.array([], dtype=int)
+        return empty, np.empty((0, 3)), empty, empty
+
+    # antimeridian points-of-interest (N, 3)
+    poi_xyz = intersection.points[antimeridian]
+
+    # there is 1 cid per intersection poi (N,)
+    poi_cids = mesh.find_closest_cell(poi_xyz)
+    # there are 2 pids per cid i.e., by defn, each line has 2 end-points
+    cid_pids = [mesh.get_cell(cid).point_ids for cid in poi_cids]
+    # flatten the pids (2N,)
+    cid_pids_1d = np.concatenate(cid_pids)
+    # flatten the cartesian points (2N, 3)
+    cid_xyz_1d = np.concatenate([mesh.points[pids] for pids in cid_pids])
+
+    # use explicit typing for clarity ...
+    split_cids: list[int] = []
+    split_xyz: list[ArrayLike] = []
+    detach_cids: list[int] = []
+    detach_pids: list[int] = []
+
+    for xyz, cid in zip(poi_xyz, poi_cids, strict=True):
+        mask = np.all(np.isclose(cid_xyz_1d, xyz), axis=1)
+        if np.any(mask):
+            # we want to detach the connectivity of a single line segment at the pid
+            # i.e., replace the pid with a new co-located xyz point
+            intersection_pid = np.unique(cid_pids_1d[mask])
+            if (count := intersection_pid.size) > 1:
+                # detected a loop containing different line segments with
+                # coincident end-points at the intersection poi
+                emsg = f"Expected only 1 line segment end-point, got {count} instead."
+                raise ValueError(emsg)
+
+            detach_cids.append(cid)
+            detach_pids.append(intersection_pid[0])
+        else:
+            # we want to break the connectivity of the line segment @ xyz
+            # i.e., split the segment into two new segments about xyz
+            split_cids.append(cid)
+            split_xyz.append(xyz)
+
+    return (
+        np.array(split_cids, dtype=int),
+        np.array(split_xyz).reshape(-1, 3),
+        np.array(detach_cids, dtype=int),
+        np.array(detach_pids, dtype=int),
+    )
+
+
 def slice_lines(
-    mesh: pv.PolyData, n_points: int | None = None, copy: bool | None = False
+    mesh: pv.PolyData,
+    n_points: int | None = None,
+    copy: bool | None = False,
+    method: str | SliceMethod | None = None,
 ) -> pv.PolyData:
     """Cut a line-based mesh along the Antimeridian, breaking line connectivity.
 
@@ -724,10 +1258,17 @@ def slice_lines(
         The number of intermediate points for the line that will be extruded to form a
         plane which will slice the `mesh` e.g., with ``n_points=1``, a mid-point will be
         calculated for the line, which will then consist of 2 line segments i.e., the 2
-        end-points and 1 mid-point. Defaults to :data:`SPLINE_N_POINTS`.
+        end-points and 1 mid-point. Defaults to :data:`SPLINE_N_POINTS`. Only
+        applies to the ``spline`` `method`.
     copy : bool, default=False
         Return a deepcopy of the ``mesh`` when there are no points of intersection with
         the Antimeridian. Otherwise, the original ``mesh`` is returned.
+    method : str or SliceMethod, optional
+        The strategy used to find the line segments traversing the Antimeridian,
+        either ``analytic`` or ``spline``. The ``analytic`` method finds and
+        splits all traversing segments in bulk, directly from the segment
+        end-points. Also see :class:`SliceMethod`. Defaults to
+        :data:`SLICE_METHOD`.
 
     Returns
     -------
@@ -747,6 +1288,8 @@ def slice_lines(
         # there are no lines to slice
         return mesh
 
+    method = _slice_method(method)
+
     if n_points is None:
         n_points = SPLINE_N_POINTS
 
@@ -765,62 +1308,24 @@ def slice_lines(
             mesh = mesh.copy(deep=True)
         return mesh
 
-    radius = distance(mesh)
-    line = pv.Line(pointa=(radius, 0, 0), pointb=(-radius, 0, 0))
-    spline = pv.Spline(line.points, n_points=n_points + 2)
-    intersection = mesh.slice_along_line(spline)
-    lonlat = from_cartesian(intersection)
-    antimeridian = np.isclose(np.abs(lonlat[:, 0]), 180)
+    if method == SliceMethod.ANALYTIC:
+        segments = _slice_segments(mesh)
+    else:
+        segments = _slice_segments_spline(mesh, n_points)
+
+    split_cids, split_xyz, detach_cids, detach_pids = segments
 
     # nop - there are no points of intersection
-    if antimeridian.sum() == 0:
+    if split_cids.size == 0 and detach_cids.size == 0:
         if copy:
             mesh = mesh.copy(deep=True)
         return mesh
 
-    # antimeridian points-of-interest (N, 3)
-    poi_xyz = intersection.points[antimeridian]
-
-    # there is 1 cid per intersection poi (N,)
-    poi_cids = mesh.find_closest_cell(poi_xyz)
-    # there are 2 pids per cid i.e., by defn, each line has 2 end-points
-    cid_pids = [mesh.get_cell(cid).point_ids for cid in poi_cids]
-    # flatten the pids (2N,)
-    cid_pids_1d = np.concatenate(cid_pids)
-    # flatten the cartesian points (2N, 3)
-    cid_xyz_1d = np.concatenate([mesh.points[pids] for pids in cid_pids])
-
-    # use explicit typing for clarity ...
-    split_cids: list[int] = []
-    split_xyz: list[ArrayLike] = []
-    detach_cids: list[int] = []
-    detach_pids: list[int] = []
-
-    for xyz, cid in zip(poi_xyz, poi_cids, strict=True):
-        mask = np.all(np.isclose(cid_xyz_1d, xyz), axis=1)
-        if np.any(mask):
-            # we want to detach the connectivity of a single line segment at the pid
-            # i.e., replace the pid with a new co-located xyz point
-            intersection_pid = np.unique(cid_pids_1d[mask])
-            if (count := intersection_pid.size) > 1:
-                # detected a loop containing different line segments with
-                # coincident end-points at the intersection poi
-                emsg = f"Expected only 1 line segment end-point, got {count} instead."
-                raise ValueError(emsg)
-
-            detach_cids.append(cid)
-            detach_pids.append(intersection_pid[0])
-        else:
-            # we want to break the connectivity of the line segment @ xyz
-            # i.e., split the segment into two new segments about xyz
-            split_cids.append(cid)
-            split_xyz.append(xyz)
-
     result = pv.PolyData()
     points = mesh.points.copy()
     lines = mesh.lines.copy().reshape(-1, 3)
 
-    if split_cids:
+    if split_cids.size:
         # for M points of intersection, introduce 2xM new xyz cartesian intersection
         # points and M cells i.e.,
         #        cid                    cid                       cid(new)
@@ -843,7 +1348,7 @@ def slice_lines(
         split_lines[:, 1] = new_pids
         lines = np.vstack([lines, split_lines])  # append M new cells
 
-    if detach_cids:
+    if detach_cids.size:
         # for M points of intersection, introduce M new xyz cartesian intersection
         # points i.e.,
         #        cid0        cid1                    cid0                   cid1
@@ -881,6 +1386,7 @@ def slice_mesh(
     mesh: pv.PolyData,
     rtol: float | None = None,
     atol: float | None = None,
+    method: str | SliceMethod | None = None,
 ) -> pv.PolyData:
     """Cut a mesh along the Antimeridian, breaking connectivities.
 
@@ -901,6 +1407,10 @@ def slice_mesh(
     atol : float, optional
         The absolute tolerance for longitudes close to the 'wrap meridian' -
         see :func:`geovista.common.wrap` for more.
+    method : str or SliceMethod, optional
+        The strategy used to detect the cells or line segments coincident or
+        bisected by the Antimeridian, either ``analytic`` or ``spline``. Also
+        see :class:`SliceMethod`. Defaults to :data:`SLICE_METHOD`.
 
     Returns
     -------
@@ -917,8 +1427,10 @@ def slice_mesh(
         raise ValueError(emsg)
 
     if mesh.n_lines:
-        result = slice_lines(mesh, copy=True)
+        result = slice_lines(mesh, copy=True, method=method)
     else:
-        result = slice_cells(mesh, antimeridian=True, rtol=rtol, atol=atol)
+        result = slice_cells(
+            mesh, antimeridian=True, rtol=rtol, atol=atol, method=method
+        )
 
     return result
@@ -13,10 +13,12 @@ Notes
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, TypeAlias
+from functools import lru_cache
+import threading
+from typing import TYPE_CHECKING, Any, NamedTuple, TypeAlias
 
 import lazy_loader as lazy
-from pyproj import CRS
+from pyproj import CRS, Transformer
 
 from .common import GV_FIELD_CRS
 
@@ -27,11 +29,17 @@ if TYPE_CHECKING:
 np = lazy.load("numpy")
 
 __all__ = [
+    "CRS_CACHE_SIZE",
     "WGS84",
+    "CRSCacheInfo",
     "CRSLike",
     "PlateCarree",
+    "crs_cache_clear",
+    "crs_cache_info",
     "from_wkt",
     "get_central_meridian",
+    "get_crs",
+    "get_transformer",
     "has_wkt",
     "projected",
     "set_central_meridian",
@@ -43,6 +51,9 @@ CRSLike: TypeAlias = int | str | dict[str, Any] | CRS
 """Type alias for a Coordinate Reference System."""
 
 # constants
+CRS_CACHE_SIZE: int = 256
+"""The maximum number of cached CRSs, and separately of cached CRS transformers."""
+
 EPSG_CENTRAL_MERIDIAN: str = "8802"
 """EPSG projection parameter for longitude of natural origin/central meridian."""
 
@@ -53,6 +64,112 @@ WGS84 = CRS.from_user_input("epsg:4326")
 """Geographic WGS84."""
 
 
+# serialize cache access, so that each CRS or transformer is created only once
+_CRS_CACHE_LOCK = threading.Lock()
+
+
+class CRSCacheInfo(NamedTuple):
+    """Statistics of the CRS and CRS transformer caches.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+
+    crs: Any
+    """The :func:`functools.lru_cache` statistics of the CRS cache."""
+
+    transformer: Any
+    """The :func:`functools.lru_cache` statistics of the transformer cache."""
+
+
+@lru_cache(maxsize=CRS_CACHE_SIZE)
+def _cached_crs(crs: Any) -> CRS:  # noqa: ANN401
+    """Create the CRS from the hashable user input.
+
+    Parameters
+    ----------
+    crs : Any
+        The hashable CRS user input. A ``dict`` is provided as a sorted
+        ``tuple`` of its items.
+
+    Returns
+    -------
+    :class:`~pyproj.crs.CRS`
+        The Coordinate Reference System.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    if isinstance(crs, tuple):
+        crs = dict(crs)
+
+    return CRS.from_user_input(crs)
+
+
+@lru_cache(maxsize=CRS_CACHE_SIZE)
+def _cached_transformer(src_crs: CRS, tgt_crs: CRS) -> Transformer:
+    """Create the transformer between the CRSs.
+
+    Note that, a :class:`~pyproj.crs.CRS` is hashed and compared by its
+    canonical WKT representation.
+
+    Parameters
+    ----------
+    src_crs : :class:`~pyproj.crs.CRS`
+        The source Coordinate Reference System.
+    tgt_crs : :class:`~pyproj.crs.CRS`
+        The target Coordinate Reference System.
+
+    Returns
+    -------
+    :class:`~pyproj.transformer.Transformer`
+        The transformer with traditional GIS axis order i.e., longitude and
+        latitude, or easting and northing.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    return Transformer.from_crs(src_crs, tgt_crs, always_xy=True)
+
+
+def crs_cache_clear() -> None:
+    """Clear the process-wide CRS and CRS transformer caches.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    with _CRS_CACHE_LOCK:
+        _cached_crs.cache_clear()
+        _cached_transformer.cache_clear()
+
+
+def crs_cache_info() -> CRSCacheInfo:
+    """Report the hit and miss statistics of the CRS and CRS transformer caches.
+
+    Returns
+    -------
+    CRSCacheInfo
+        The ``hits``, ``misses``, ``maxsize`` and ``currsize`` of the CRS
+        cache, and of the transformer cache.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    return CRSCacheInfo(
+        crs=_cached_crs.cache_info(), transformer=_cached_transformer.cache_info()
+    )
+
+
 def from_wkt(mesh: pv.PolyData) -> CRS:
     """Get the :class:`~pyproj.crs.CRS` associated with the mesh.
 
@@ -76,11 +193,83 @@ def from_wkt(mesh: pv.PolyData) -> CRS:
 
     if has_wkt(mesh):
         wkt = str(mesh.field_data[GV_FIELD_CRS][0])
-        crs = CRS.from_wkt(wkt)
+        crs = get_crs(wkt)
 
     return crs
 
 
+def get_crs(crs: CRSLike) -> CRS:
+    """Get the :class:`~pyproj.crs.CRS` of the user input.
+
+    The CRS created from hashable user input, such as an EPSG code, PROJ string,
+    WKT or a ``dict`` of PROJ parameters, is served from a process-wide,
+    thread-safe and bounded cache. See :func:`crs_cache_info`.
+
+    Parameters
+    ----------
+    crs : CRSLike
+        The Coordinate Reference System. May be anything accepted by
+        :meth:`pyproj.crs.CRS.from_user_input`.
+
+    Returns
+    -------
+    :class:`~pyproj.crs.CRS`
+        The Coordinate Reference System.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    if isinstance(crs, CRS):
+        return crs
+
+    key = crs
+    if isinstance(crs, dict):
+        key = tuple(sorted(crs.items()))
+
+    try:
+        with _CRS_CACHE_LOCK:
+            result = _cached_crs(key)
+    except TypeError:
+        # unhashable user input
+        result = CRS.from_user_input(crs)
+
+    return result
+
+
+def get_transformer(src_crs: CRSLike, tgt_crs: CRSLike) -> Transformer:
+    """Get the :class:`~pyproj.transformer.Transformer` between the CRSs.
+
+    The transformer is served from a process-wide, thread-safe and bounded
+    cache keyed by the canonical WKT of each CRS. See :func:`crs_cache_info`.
+
+    Parameters
+    ----------
+    src_crs : CRSLike
+        The source Coordinate Reference System. May be anything accepted by
+        :meth:`pyproj.crs.CRS.from_user_input`.
+    tgt_crs : CRSLike
+        The target Coordinate Reference System. May be anything accepted by
+        :meth:`pyproj.crs.CRS.from_user_input`.
+
+    Returns
+    -------
+    :class:`~pyproj.transformer.Transformer`
+        The transformer with traditional GIS axis order i.e., longitude and
+        latitude, or easting and northing.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    src_crs, tgt_crs = get_crs(src_crs), get_crs(tgt_crs)
+
+    with _CRS_CACHE_LOCK:
+        return _cached_transformer(src_crs, tgt_crs)
+
+
 def get_central_meridian(crs: CRS) -> float | None:
     """Retrieve the longitude of natural origin of the `CRS`.
 
@@ -26,6 +26,7 @@ from .common import (
     GV_REMESH_POINT_IDS,
     REMESH_JOIN,
     REMESH_SEAM,
+    StrEnumPlus,
     distance,
     from_cartesian,
     sanitize_data,
@@ -45,13 +46,18 @@ np = lazy.load("numpy")
 pv = lazy.load("pyvista")
 
 __all__ = [
+    "REMESH_METHOD",
     "REMESH_SEAM_EAST",
     "VTK_BAD_TRIANGLE_MASK",
     "VTK_BOUNDARY_MASK",
     "VTK_FREE_EDGE_MASK",
+    "RemeshMethod",
     "remesh",
 ]
 
+REMESH_METHOD: str = "vtk"
+"""The default engine used to remesh a mesh along a meridian."""
+
 REMESH_SEAM_EAST: int = REMESH_SEAM - 1
 """Marker for remesh filter eastern cell boundary point."""
 
@@ -65,6 +71,252 @@ VTK_FREE_EDGE_MASK: str = "FreeEdge"
 """``vtkIntersectionPolyDataFilter`` free edge cell array name."""
 
 
+class RemeshMethod(StrEnumPlus):
+    """Enumeration of meridian remeshing engines.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+
+    NUMPY = "numpy"
+    """Batched analytic splitting of the triangles bisected by the meridian."""
+
+    VTK = "vtk"
+    """Intersection with a half-plane by ``vtkIntersectionPolyDataFilter``."""
+
+
+def _remesh_numpy(mesh: pv.PolyData, meridian: float) -> pv.PolyData:
+    """Split the triangles of the mesh bisected by the `meridian` half-plane.
+
+    The half-plane extends from the z-axis through the `meridian`. Each
+    triangle with points strictly either side of the half-plane is split
+    analytically, with a new point introduced at each bisected edge. A
+    triangle with one point on the half-plane is split into two triangles,
+    otherwise it is split into three triangles. Bisected edges shared by
+    neighbouring triangles share the same new point.
+
+    New points are linearly interpolated along their edge, as are their point
+    data, with integer data being rounded. Split triangles inherit the cell
+    data of their parent triangle, and are ordered in place of their parent.
+
+    Parameters
+    ----------
+    mesh : PolyData
+        The triangulated surface to be remeshed.
+    meridian : float
+        The meridian along which to remesh, in degrees longitude.
+
+    Returns
+    -------
+    PolyData
+        The remeshed surface, with a :data:`VTK_BOUNDARY_MASK` point array
+        marking the new points. The surface has no cells if the `meridian`
+        does not bisect any triangles.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    theta = np.radians(meridian)
+    points = mesh.points
+    # signed distance of each point from the plane of the meridian,
+    # and distance along the plane from the z-axis
+    distances = -np.sin(theta) * points[:, 0] + np.cos(theta) * points[:, 1]
+    along = np.cos(theta) * points[:, 0] + np.sin(theta) * points[:, 1]
+    # snap those points coincident with the plane e.g., polar points
+    atol = distance(mesh) * 1e-8
+    distances[np.isclose(distances, 0, rtol=0, atol=atol)] = 0
+    triangles = mesh.faces.reshape(-1, 4)[:, 1:]
+    signs = np.sign(distances)[triangles]
+    (bisected,) = np.nonzero((signs.min(axis=1) < 0) & (signs.max(axis=1) > 0))
+
+    # rotate each bisected triangle so that its first point is either the
+    # point on the plane, or the point alone on its side of the plane
+    zero = signs[bisected] == 0
+    apex = np.where(
+        zero.any(axis=1),
+        np.argmax(zero, axis=1),
+        np.argmax(signs[bisected] == -signs[bisected].sum(axis=1)[:, None], axis=1),
+    )
+    order = (apex[:, None] + np.arange(3)) % 3
+    a, b, c = np.take_along_axis(triangles[bisected], order, axis=1).T
+    pair = zero.any(axis=1)
+
+    # the edges bisected by the plane i.e., the edge opposite the first point
+    # for a triangle split in two, otherwise both edges of the first point
+    edges = np.stack(
+        [np.where(pair, b, a), np.where(pair, c, b), a, c], axis=1
+    ).reshape(-1, 2, 2)
+    edges = np.sort(edges, axis=2)
+
+    def cross(lower: np.ndarray, upper: np.ndarray) -> np.ndarray:
+        """Calculate the interpolation weight of the plane crossing each edge.
+
+        Parameters
+        ----------
+        lower : ndarray
+            The point-ids of the first point of each edge.
+        upper : ndarray
+            The point-ids of the second point of each edge.
+
+        Returns
+        -------
+        ndarray
+            The fractional distance along each edge, from the `lower` point
+            towards the `upper` point, at which the plane crosses the edge.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        return distances[lower] / (distances[lower] - distances[upper])
+
+    # only split those triangles bisected by the half-plane
+    weights = cross(edges[:, 0, 0], edges[:, 0, 1])
+    first = along[edges[:, 0, 0]] + weights * (
+        along[edges[:, 0, 1]] - along[edges[:, 0, 0]]
+    )
+    weights = cross(edges[:, 1, 0], edges[:, 1, 1])
+    second = np.where(
+        pair,
+        along[a],
+        along[edges[:, 1, 0]]
+        + weights * (along[edges[:, 1, 1]] - along[edges[:, 1, 0]]),
+    )
+    keep = (first + second) > 0
+
+    if not np.any(keep):
+        return pv.PolyData()
+
+    bisected, pair = bisected[keep], pair[keep]
+    a, b, c, edges = a[keep], b[keep], c[keep], edges[keep]
+
+    # create a new point for each unique bisected edge
+    edges = np.vstack([edges[:, 0], edges[~pair, 1]])
+    unique, inverse = np.unique(edges, axis=0, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    lower, upper = unique.T
+    weights = cross(lower, upper)
+    new_points = points[lower] + weights[:, None] * (points[upper] - points[lower])
+    new_ids = inverse + mesh.n_points
+    p = new_ids[: pair.size]
+    q = np.empty_like(p)
+    q[~pair] = new_ids[pair.size :]
+
+    # a triangle with its first point on the plane is split in two at the new
+    # point "p", otherwise it is split in three at the new points "p" and "q",
+    # preserving the winding order of the triangle
+    split = [
+        (pair, np.stack([a, b, p], axis=1)),
+        (pair, np.stack([a, p, c], axis=1)),
+        (~pair, np.stack([a, p, q], axis=1)),
+        (~pair, np.stack([p, b, c], axis=1)),
+        (~pair, np.stack([p, c, q], axis=1)),
+    ]
+    whole = np.ones(triangles.shape[0], dtype=bool)
+    whole[bisected] = False
+    (parents,) = np.nonzero(whole)
+    parents = [parents] + [bisected[mask] for mask, _ in split]
+    cells = [triangles[whole]] + [pieces[mask] for mask, pieces in split]
+    parents_array = np.concatenate(parents)
+    # stable sort ensures split triangles are ordered in place of their parent
+    index = np.argsort(parents_array, kind="stable")
+    parents_array = parents_array[index]
+    cells_array = np.concatenate(cells)[index]
+
+    faces = np.hstack(
+        [np.full((cells_array.shape[0], 1), 3, dtype=cells_array.dtype), cells_array]
+    )
+    points = np.vstack([points, new_points.astype(points.dtype)])
+    result = pv.PolyData(points, faces=faces.ravel())
+
+    for name in mesh.point_data.keys():  # noqa: SIM118
+        data = mesh.point_data[name]
+        shape = (-1,) + (1,) * (data.ndim - 1)
+        interpolated = data[lower] + weights.reshape(shape) * (
+            data[upper].astype(float) - data[lower]
+        )
+        if not np.issubdtype(data.dtype, np.floating):
+            interpolated = np.floor(interpolated + 0.5)
+        result.point_data[name] = np.concatenate(
+            [data, interpolated.astype(data.dtype)]
+        )
+
+    for name in mesh.cell_data.keys():  # noqa: SIM118
+        result.cell_data[name] = mesh.cell_data[name][parents_array]
+
+    for name in mesh.field_data.keys():  # noqa: SIM118
+        result.field_data[name] = mesh.field_data[name]
+
+    # the new points and those points on the half-plane are boundary points
+    boundary_mask = np.ones(result.n_points, dtype=np.int32)
+    boundary_mask[: mesh.n_points] = (distances == 0) & (along >= -atol)
+    result.point_data[VTK_BOUNDARY_MASK] = boundary_mask
+
+    return result
+
+
+def _remesh_vtk(mesh: pv.PolyData, meridian: float, *, check: bool) -> pv.PolyData:
+    """Intersect the mesh with the `meridian` half-plane.
+
+    Parameters
+    ----------
+    mesh : PolyData
+        The triangulated surface to be remeshed.
+    meridian : float
+        The meridian along which to remesh, in degrees longitude.
+    check : bool
+        Whether to check the remeshed surface for bad cells and
+        free edges.
+
+    Returns
+    -------
+    PolyData
+        The remeshed surface, with a :data:`VTK_BOUNDARY_MASK` point array
+        marking the intersection points. The surface has no cells if the
+        `meridian` does not intersect the mesh.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    radius = distance(mesh)
+
+    # Ensure to explicitly use default direction=(0, 0, 1) for
+    # the plane with a post x-axis rotation of 90 degrees.
+    # See https://github.com/bjlittle/geovista/issues/447
+    poly1 = pv.Plane(
+        center=(radius / 2, 0, 0),
+        i_resolution=1,
+        j_resolution=1,
+        i_size=radius,
+        j_size=radius * 2,
+        direction=(0, 0, 1),
+    )
+    poly1.rotate_x(90, inplace=True)
+    poly1.rotate_z(meridian, inplace=True)
+    poly1.triangulate(inplace=True)
+
+    # https://vtk.org/doc/nightly/html/classvtkIntersectionPolyDataFilter.html
+    alg = pv._vtk.vtkIntersectionPolyDataFilter()  # noqa: SLF001
+    alg.SetInputDataObject(0, mesh)
+    alg.SetInputDataObject(1, poly1)
+    # BoundaryPoints (points) mask array
+    alg.SetComputeIntersectionPointArray(True)  # noqa: FBT003
+    # BadTriangle and FreeEdge (cells) mask arrays
+    alg.SetCheckMesh(check)
+    alg.SetSplitFirstOutput(True)  # noqa: FBT003
+    alg.SetSplitSecondOutput(False)  # noqa: FBT003
+    alg.Update()
+
+    return pv.core.filters._get_output(alg, oport=1)  # noqa: SLF001
+
+
 def remesh(
     mesh: pv.PolyData,
     meridian: float,
@@ -72,6 +324,7 @@ def remesh(
     check: bool | None = False,
     rtol: float | None = None,
     atol: float | None = None,
+    method: str | RemeshMethod | None = None,
 ) -> Remesh:
     """Slice `mesh` along `meridian` and triangulate any sliced cells.
 
@@ -79,6 +332,10 @@ def remesh(
     `vtkIntersectionPolyDataFilter <https://vtk.org/doc/nightly/html/classvtkIntersectionPolyDataFilter.html>`_
     documentation for more.
 
+    Alternatively, the ``numpy`` `method` splits the triangles bisected by the
+    `meridian` analytically, in a batched manner, without performing a general
+    surface intersection.
+
     Parameters
     ----------
     mesh : PolyData
@@ -90,13 +347,16 @@ def remesh(
         resultant mesh.
     check : bool, default=False
         Whether to check the remeshed surface for bad cells and
-        free edges.
+        free edges. Only supported by the ``vtk`` `method`.
     rtol : float, optional
         The relative tolerance for longitudes close to the 'wrap meridian' -
         see :func:`geovista.common.wrap` for more.
     atol : float, optional
         The absolute tolerance for longitudes close to the 'wrap meridian' -
         see :func:`geovista.common.wrap` for more.
+    method : str or RemeshMethod, optional
+        The remeshing engine, either ``numpy`` or ``vtk``. Also see
+        :class:`RemeshMethod`. Defaults to :data:`REMESH_METHOD`.
 
     Returns
     -------
@@ -113,8 +373,21 @@ def remesh(
         emsg = "Cannot remesh an empty mesh"
         raise ValueError(emsg)
 
+    if method is None:
+        method = REMESH_METHOD
+
+    if not RemeshMethod.valid(method):
+        options = " or ".join(f"{item!r}" for item in RemeshMethod.values())
+        emsg = f"Expected a remesh method of {options}, got '{method}'."
+        raise ValueError(emsg)
+
+    method = RemeshMethod(method)
+
+    if check and method != RemeshMethod.VTK:
+        emsg = f"Cannot check the remeshed surface with the '{method}' remesh method."
+        raise ValueError(emsg)
+
     meridian = wrap(meridian)[0]
-    radius = distance(mesh)
 
     poly0: pv.PolyData = mesh.copy(deep=True)
 
@@ -127,34 +400,10 @@ def remesh(
     if not triangulated(poly0):
         poly0.triangulate(inplace=True)
 
-    # Ensure to explicitly use default direction=(0, 0, 1) for
-    # the plane with a post x-axis rotation of 90 degrees.
-    # See https://github.com/bjlittle/geovista/issues/447
-    poly1 = pv.Plane(
-        center=(radius / 2, 0, 0),
-        i_resolution=1,
-        j_resolution=1,
-        i_size=radius,
-        j_size=radius * 2,
-        direction=(0, 0, 1),
-    )
-    poly1.rotate_x(90, inplace=True)
-    poly1.rotate_z(meridian, inplace=True)
-    poly1.triangulate(inplace=True)
-
-    # https://vtk.org/doc/nightly/html/classvtkIntersectionPolyDataFilter.html
-    alg = pv._vtk.vtkIntersectionPolyDataFilter()  # noqa: SLF001
-    alg.SetInputDataObject(0, poly0)
-    alg.SetInputDataObject(1, poly1)
-    # BoundaryPoints (points) mask array
-    alg.SetComputeIntersectionPointArray(True)  # noqa: FBT003
-    # BadTriangle and FreeEdge (cells) mask arrays
-    alg.SetCheckMesh(check)
-    alg.SetSplitFirstOutput(True)  # noqa: FBT003
-    alg.SetSplitSecondOutput(False)  # noqa: FBT003
-    alg.Update()
-
-    remeshed: pv.PolyData = pv.core.filters._get_output(alg, oport=1)  # noqa: SLF001
+    if method == RemeshMethod.NUMPY:
+        remeshed = _remesh_numpy(poly0, meridian)
+    else:
+        remeshed = _remesh_vtk(poly0, meridian, check=check)
 
     if remeshed.n_cells == 0:
         # no remeshing has been performed as the meridian does not intersect the mesh
@@ -169,9 +418,9 @@ def remesh(
         west_mask = lower_mask | upper_mask
         east_mask = ~west_mask
 
-        # the vtkIntersectionPolyDataFilter is configured to *always* generate
-        # the boundary mask point array as we require it internally, regardless
-        # of whether the caller wants it or not afterwards
+        # the remesh engines *always* generate the boundary mask point array
+        # as we require it internally, regardless of whether the caller wants
+        # it or not afterwards
         boundary_mask = np.asarray(remeshed.point_data[VTK_BOUNDARY_MASK], dtype=bool)
         if not boundary:
             del remeshed.point_data[VTK_BOUNDARY_MASK]
@@ -44,6 +44,7 @@ from .crs import (
     CRSLike,
     from_wkt,
     get_central_meridian,
+    get_crs,
     has_wkt,
     projected,
     set_central_meridian,
@@ -75,7 +76,6 @@ if TYPE_CHECKING:
 
 # lazy import third-party dependencies
 np = lazy.load("numpy")
-pyproj = lazy.load("pyproj")
 pv = lazy.load("pyvista")
 
 __all__ = [
@@ -196,7 +196,7 @@ class GeoPlotterBase:  # numpydoc ignore=PR01
                 )
                 raise ValueError(emsg)
 
-        self.crs = pyproj.CRS.from_user_input(crs) if crs is not None else WGS84
+        self.crs = get_crs(crs) if crs is not None else WGS84
 
         # status of gpu opacity support
         self._missing_opacity = False
@@ -637,8 +637,15 @@ class GeoPlotterBase:  # numpydoc ignore=PR01
             tgt_crs = self.crs
             transform_required = src_crs and src_crs != tgt_crs
             central_meridian = get_central_meridian(tgt_crs) or 0
+            textured = "texture" in kwargs and kwargs["texture"] is not None
 
-            if transform_required and not cloud:
+            # defer slicing to the transform, unless texture coordinates are
+            # required for the sliced mesh, as the transform may reuse the
+            # projected geometry from its projection cache
+            slice_connectivity = bool(transform_required) and not (cloud or textured)
+            sliced = False
+
+            if transform_required and not cloud and textured:
                 if central_meridian:
                     mesh.rotate_z(-central_meridian, inplace=True)
                     tgt_crs = set_central_meridian(tgt_crs, 0)
@@ -652,9 +659,12 @@ class GeoPlotterBase:  # numpydoc ignore=PR01
                     mesh.rotate_z(central_meridian, inplace=True)
 
                 mesh = sliced_mesh
+                sliced = True
 
-            if "texture" in kwargs and kwargs["texture"] is not None:
-                mesh = add_texture_coords(mesh, antimeridian=True)
+            if textured:
+                # the texture coordinates may be attached in-place to a mesh
+                # sliced above, as it is not the mesh of the caller
+                mesh = add_texture_coords(mesh, antimeridian=True, inplace=sliced)
                 texture = wrap_texture(
                     kwargs["texture"], central_meridian=central_meridian
                 )
@@ -664,7 +674,7 @@ class GeoPlotterBase:  # numpydoc ignore=PR01
                 mesh = transform_mesh(
                     mesh,
                     tgt_crs,
-                    slice_connectivity=False,
+                    slice_connectivity=slice_connectivity,
                     rtol=rtol,
                     atol=atol,
                     zlevel=zlevel,
@@ -1147,7 +1157,7 @@ class GeoPlotterBase:  # numpydoc ignore=PR01
         """
         if crs is not None:
             # sanity check the source crs
-            crs = pyproj.CRS.from_user_input(crs)
+            crs = get_crs(crs)
 
         if style is None:
             style = "points"
@@ -13,12 +13,19 @@ Notes
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from collections.abc import Iterable
+import hashlib
+import os
+from pathlib import Path
+import tempfile
+import threading
 from typing import TYPE_CHECKING
+import zipfile
 
 import lazy_loader as lazy
 
-from .common import VTK_CELL_IDS, StrEnumPlus, to_cartesian
+from .common import RADIUS, StrEnumPlus, to_cartesian
 from .crs import WGS84, from_wkt
 from .transform import transform_points
 
@@ -27,6 +34,8 @@ if TYPE_CHECKING:
     from numpy.typing import ArrayLike
     import pyvista as pv
 
+    from .bridge import PathLike
+
     # Type aliases
     NearestNeighbours = tuple[ArrayLike, ArrayLike]
     """Type alias for a tuple of nearest neighbour distances and indices.""" ""
@@ -37,22 +46,48 @@ if TYPE_CHECKING:
 
 # lazy import third-party dependencies
 np = lazy.load("numpy")
+pv = lazy.load("pyvista")
 
 __all__ = [
+    "ADJACENCY_CACHE_SIZE",
+    "CELL_CANDIDATES",
+    "EARTH_RADIUS",
+    "KDTREE_BALL_K",
     "KDTREE_EPSILON",
+    "KDTREE_FORMAT",
     "KDTREE_K",
     "KDTREE_LEAF_SIZE",
     "KDTREE_PREFERENCE",
+    "Adjacency",
     "KDTree",
     "NearestNeighbours",
     "SearchPreference",
+    "adjacency_cache_clear",
+    "cell_adjacency",
     "find_cell_neighbours",
+    "find_containing_cells",
     "find_nearest_cell",
+    "find_nearest_cells",
 ]
 
+ADJACENCY_CACHE_SIZE: int = 8
+"""The maximum number of mesh adjacencies held by the adjacency cache."""
+
+CELL_CANDIDATES: int = 8
+"""The initial number of candidate cells per point-of-interest of a batched search."""
+
+EARTH_RADIUS: float = 6_371_008.8
+"""The mean radius (metres) of the Earth used for great-circle distances."""
+
+KDTREE_BALL_K: int = 16
+"""The minimum initial number of nearest neighbours of a kd-tree ball query."""
+
 KDTREE_EPSILON: float = 0.0
 """The default kd-tree nearest neighbour epsilon."""
 
+KDTREE_FORMAT: int = 1
+"""The on-disk kd-tree format version, see :meth:`KDTree.save`."""
+
 KDTREE_K: int = 1
 """The default kd-tree number of nearest neighbours."""
 
@@ -63,6 +98,291 @@ KDTREE_PREFERENCE: str = "point"
 """The default search preference."""
 
 
+# the relative tolerance of a point-of-interest on the boundary of a cell
+_CONTAINS_TOLERANCE: float = 1e-10
+
+# the number of points-of-interest processed per chunk of a batched search
+_SEARCH_CHUNK_SIZE: int = 2**15
+
+# the mesh adjacencies, in least recently used order
+_ADJACENCY_CACHE: OrderedDict[tuple[int, ...], Adjacency] = OrderedDict()
+_ADJACENCY_CACHE_LOCK = threading.Lock()
+
+
+def _cell_arrays(mesh: pv.PolyData) -> tuple[np.ndarray, np.ndarray]:
+    """Get the offsets and connectivity of all the cells of the mesh.
+
+    The cells are in cell-id order i.e., vertices, lines, polygons and then
+    triangle strips.
+
+    Parameters
+    ----------
+    mesh : PolyData
+        The mesh providing the cells.
+
+    Returns
+    -------
+    tuple of ndarray
+        The cell offsets, of shape (n_cells + 1,), and the cell connectivity.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    sizes, connectivity = [], []
+    for cells in (mesh.GetVerts(), mesh.GetLines(), mesh.GetPolys(), mesh.GetStrips()):
+        sizes.append(np.diff(pv.convert_array(cells.GetOffsetsArray())))
+        connectivity.append(pv.convert_array(cells.GetConnectivityArray()))
+
+    offsets = np.zeros(mesh.n_cells + 1, dtype=pv.ID_TYPE)
+    np.cumsum(np.concatenate(sizes), out=offsets[1:])
+
+    return offsets, np.concatenate(connectivity).astype(pv.ID_TYPE, copy=False)
+
+
+def _gather(offsets: np.ndarray, values: np.ndarray, rows: np.ndarray) -> np.ndarray:
+    """Gather the values of the rows of a compressed sparse row (CSR) structure.
+
+    Parameters
+    ----------
+    offsets : ndarray
+        The CSR row offsets.
+    values : ndarray
+        The CSR values.
+    rows : ndarray
+        The rows to gather.
+
+    Returns
+    -------
+    ndarray
+        The concatenated values of the `rows`.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    starts = offsets[rows]
+    counts = offsets[rows + 1] - starts
+    shift = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+    return values[shift + np.arange(shift.size)]
+
+
+def _great_circle(xyz: np.ndarray, points: np.ndarray) -> np.ndarray:
+    """Calculate the great-circle distance between cartesian points.
+
+    The central angle between the points is calculated independently of their
+    radial distance from the origin, and is scaled by :data:`EARTH_RADIUS`.
+
+    Parameters
+    ----------
+    xyz : ndarray
+        The cartesian points of shape (..., 3).
+    points : ndarray
+        The other cartesian points of shape (..., 3), which must broadcast
+        with `xyz`.
+
+    Returns
+    -------
+    ndarray
+        The great-circle distances (metres).
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    cross = np.linalg.norm(np.cross(xyz, points), axis=-1)
+    dot = np.einsum("...i,...i", xyz, points)
+    return np.arctan2(cross, dot) * EARTH_RADIUS
+
+
+def _cell_distance(points: np.ndarray, poi: np.ndarray) -> np.ndarray:
+    """Calculate the squared distance from each point-of-interest to its cell.
+
+    The distance is to the closest point on the plane of a polygon when the
+    projection of the point-of-interest falls within the polygon, otherwise to
+    the closest point on the boundary of the cell.
+
+    Parameters
+    ----------
+    points : ndarray
+        The vertices of the cells of shape (N, M, 3), where each cell with less
+        than M vertices is padded by repeating its last vertex.
+    poi : ndarray
+        The points-of-interest of shape (N, 3).
+
+    Returns
+    -------
+    ndarray
+        The squared distances of shape (N,).
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    xs, ys, zs = points[..., 0], points[..., 1], points[..., 2]
+    fxs, fys, fzs = (np.roll(axis, -1, axis=1) for axis in (xs, ys, zs))
+    exs, eys, ezs = fxs - xs, fys - ys, fzs - zs
+    oxs, oys, ozs = poi[:, :1] - xs, poi[:, 1:2] - ys, poi[:, 2:] - zs
+
+    # distance to the closest point on each edge of the cell boundary
+    length = exs * exs + eys * eys + ezs * ezs
+    t = (oxs * exs + oys * eys + ozs * ezs) / np.where(length, length, 1)
+    np.clip(t, 0, 1, out=t)
+    cxs, cys, czs = oxs - t * exs, oys - t * eys, ozs - t * ezs
+    result = (cxs * cxs + cys * cys + czs * czs).min(axis=1)
+
+    # distance to the plane of the cell, given the newell normal of the polygon
+    nx = (ys * fzs - zs * fys).sum(axis=1)[:, np.newaxis]
+    ny = (zs * fxs - xs * fzs).sum(axis=1)[:, np.newaxis]
+    nz = (xs * fys - ys * fxs).sum(axis=1)[:, np.newaxis]
+    norm = (nx * nx + ny * ny + nz * nz)[:, 0]
+    side = (
+        (eys * ozs - ezs * oys) * nx
+        + (ezs * oxs - exs * ozs) * ny
+        + (exs * oys - eys * oxs) * nz
+    )
+    inside = np.all(side >= 0, axis=1) & (norm > 0)
+    if np.any(inside):
+        plane = oxs[:, :1] * nx + oys[:, :1] * ny + ozs[:, :1] * nz
+        result[inside] = plane[inside, 0] ** 2 / norm[inside]
+
+    return result
+
+
+def _cell_contains(points: np.ndarray, poi: np.ndarray) -> np.ndarray:
+    """Determine whether each point-of-interest is within its spherical cell.
+
+    Each edge of a convex spherical polygon is a great-circle arc, and the
+    point-of-interest is within the polygon when it is on the same side of the
+    great-circle plane of every edge. The test is independent of the winding
+    order of the polygon and of the radial distance of the points.
+
+    Parameters
+    ----------
+    points : ndarray
+        The cartesian vertices of the cells of shape (N, M, 3), where each cell
+        with less than M vertices is padded by repeating its last vertex.
+    poi : ndarray
+        The cartesian points-of-interest of shape (N, 3).
+
+    Returns
+    -------
+    ndarray
+        The boolean containment of shape (N,).
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    xs, ys, zs = points[..., 0], points[..., 1], points[..., 2]
+    fxs, fys, fzs = (np.roll(axis, -1, axis=1) for axis in (xs, ys, zs))
+    pxs, pys, pzs = poi[:, :1], poi[:, 1:2], poi[:, 2:]
+
+    # the side of the great-circle plane of each edge, given its normal
+    nxs, nys, nzs = ys * fzs - zs * fys, zs * fxs - xs * fzs, xs * fys - ys * fxs
+    side = nxs * pxs + nys * pys + nzs * pzs
+    scale = np.sqrt(nxs * nxs + nys * nys + nzs * nzs)
+    scale *= np.linalg.norm(poi, axis=1)[:, np.newaxis]
+    tolerance = _CONTAINS_TOLERANCE * scale
+    inside = np.all(side >= -tolerance, axis=1) | np.all(side <= tolerance, axis=1)
+
+    # exclude degenerate cells and the antipodal polygon
+    front = (xs * pxs + ys * pys + zs * pzs).sum(axis=1) > 0
+
+    return inside & front & np.any(scale > 0, axis=1)
+
+
+def _is_kdtree(fname: Path) -> bool:
+    """Determine whether the path is empty or a persisted kd-tree directory.
+
+    Parameters
+    ----------
+    fname : Path
+        The candidate directory of a persisted kd-tree.
+
+    Returns
+    -------
+    bool
+        Whether `fname` is an empty directory or contains the metadata of a
+        persisted kd-tree.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    if not fname.is_dir():
+        return False
+
+    if not any(fname.iterdir()):
+        return True
+
+    try:
+        with np.load(fname / "meta.npz") as meta:
+            result = "format" in meta.files
+    except (OSError, ValueError, EOFError, zipfile.BadZipFile):
+        result = False
+
+    return result
+
+
+def _fingerprint(mesh: pv.PolyData, preference: SearchPreference) -> str:
+    """Generate a persistent fingerprint of the geometry and topology of the mesh.
+
+    The fingerprint is a digest of the size and CRS of the `mesh`, and of the
+    full content of its points and, for cell centers, its cell offsets and
+    connectivity.
+
+    Parameters
+    ----------
+    mesh : PolyData
+        The mesh to fingerprint.
+    preference : SearchPreference
+        The mesh geometry registered with the kd-tree.
+
+    Returns
+    -------
+    str
+        The hexadecimal fingerprint of the mesh.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    crs = from_wkt(mesh)
+    digest.update(
+        f"{KDTREE_FORMAT}:{preference}:{mesh.n_points}:{mesh.n_cells}:"
+        f"{None if crs is None else crs.to_wkt()}".encode()
+    )
+
+    arrays = [np.asarray(mesh.points)]
+    if preference == SearchPreference.CENTER:
+        for cells in (
+            mesh.GetVerts(),
+            mesh.GetLines(),
+            mesh.GetPolys(),
+            mesh.GetStrips(),
+        ):
+            arrays.append(pv.convert_array(cells.GetOffsetsArray()))
+            arrays.append(pv.convert_array(cells.GetConnectivityArray()))
+
+    for array in arrays:
+        data = np.ascontiguousarray(array)
+        digest.update(f"{data.dtype.str}{data.shape}".encode())
+        digest.update(memoryview(data).cast("B"))
+        # separate each array
+        digest.update(b"\x00")
+
+    return digest.hexdigest()
+
+
 class SearchPreference(StrEnumPlus):
     """Enumeration of mesh geometry search preferences.
 
@@ -76,6 +396,343 @@ class SearchPreference(StrEnumPlus):
     POINT = "point"
 
 
+class Adjacency:  # numpydoc ignore=PR01
+    """Compressed sparse row (CSR) adjacency of the points and cells of a mesh.
+
+    Provides vectorized point-to-cell, cell-to-point and cell-to-cell lookups.
+    Also see :func:`cell_adjacency`.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+
+    def __init__(self, mesh: pv.PolyData) -> None:
+        """Construct the point-to-cell and cell-to-point adjacency of the mesh.
+
+        The cell-to-cell edge adjacency is constructed on demand.
+
+        Parameters
+        ----------
+        mesh : PolyData
+            The mesh used to construct the adjacency.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        self._n_points: int = mesh.n_points
+        self._n_cells: int = mesh.n_cells
+        # the range of cell-ids of the closed polygons
+        lower = mesh.GetNumberOfVerts() + mesh.GetNumberOfLines()
+        self._n_closed = (lower, lower + mesh.GetNumberOfPolys())
+        self._cell_offsets, self._cell_points = _cell_arrays(mesh)
+
+        # invert the cell connectivity, preserving the order of the cells
+        sizes = np.diff(self._cell_offsets)
+        order = np.argsort(self._cell_points, kind="stable")
+        counts = np.bincount(self._cell_points, minlength=self._n_points)
+        self._point_offsets = np.zeros(self._n_points + 1, dtype=pv.ID_TYPE)
+        np.cumsum(counts, out=self._point_offsets[1:])
+        self._point_cells = np.repeat(np.arange(self._n_cells), sizes)[order]
+
+        self._edge_offsets: np.ndarray | None = None
+        self._edge_cells: np.ndarray | None = None
+
+    def __repr__(self) -> str:
+        """Serialize adjacency representation.
+
+        Returns
+        -------
+        str
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        klass = f"{self.__class__.__name__}"
+        return f"{klass}(n_points={self._n_points}, n_cells={self._n_cells})"
+
+    def _edges(self) -> tuple[np.ndarray, np.ndarray]:
+        """Get the cell-to-cell edge adjacency.
+
+        Cells are edge neighbours when they share an edge between two
+        consecutive vertices. Polygons are closed, whereas vertices and lines
+        are open. Triangle strips are expanded into the edges of their
+        triangles i.e., each vertex is also joined to the vertex two after it.
+
+        Returns
+        -------
+        tuple of ndarray
+            The CSR row offsets and edge neighbouring cell-ids of each cell.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        if self._edge_offsets is not None and self._edge_cells is not None:
+            return self._edge_offsets, self._edge_cells
+
+        offsets, connectivity = self._cell_offsets, self._cell_points
+        sizes = np.diff(offsets)
+        cells = np.repeat(np.arange(self._n_cells), sizes)
+
+        # the following vertex of each vertex, wrapping the last polygon vertex
+        following = np.arange(1, connectivity.size + 1)
+        ends = offsets[1:][sizes > 0] - 1
+        lower, upper = self._n_closed
+        cids = np.arange(self._n_cells)[sizes > 0]
+        closed = (cids >= lower) & (cids < upper)
+        following[ends[closed]] = offsets[:-1][sizes > 0][closed]
+        valid = np.ones(connectivity.size, dtype=bool)
+        valid[ends[~closed]] = False
+
+        # the edge of each triangle strip vertex to the vertex two after it
+        position = np.arange(connectivity.size) - np.repeat(offsets[:-1], sizes)
+        strip = (cells >= upper) & (position < np.repeat(sizes, sizes) - 2)
+        (strip,) = np.nonzero(strip)
+
+        first = np.concatenate([connectivity[valid], connectivity[strip]])
+        second = np.concatenate(
+            [connectivity[following[valid]], connectivity[strip + 2]]
+        )
+        cells = np.concatenate([cells[valid], cells[strip]])
+        mask = first != second
+        first, second, cells = first[mask], second[mask], cells[mask]
+
+        # group the cells sharing each undirected edge
+        keys = np.minimum(first, second) * self._n_points + np.maximum(first, second)
+        order = np.argsort(keys, kind="stable")
+        keys, cells = keys[order], cells[order]
+        starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+        groups = np.diff(np.r_[starts, keys.size])
+
+        # pair the cells of each manifold edge
+        pairs = starts[groups == 2]
+        source = [cells[pairs], cells[pairs + 1]]
+        target = [cells[pairs + 1], cells[pairs]]
+
+        # pair each cell with every other cell of each non-manifold edge
+        if np.any(mask := groups > 2):
+            starts, groups = starts[mask], groups[mask]
+            entries = np.arange(groups.sum())
+            entries += np.repeat(starts - (np.cumsum(groups) - groups), groups)
+            group = np.repeat(groups, groups)
+            position = np.arange(group.sum())
+            position -= np.repeat(np.cumsum(group) - group, group)
+            source.append(cells[np.repeat(entries, group)])
+            target.append(cells[np.repeat(np.repeat(starts, groups), group) + position])
+
+        source, target = np.concatenate(source), np.concatenate(target)
+        mask = source != target
+        pairs = np.unique(source[mask] * self._n_cells + target[mask])
+        source, target = np.divmod(pairs, self._n_cells)
+
+        self._edge_offsets = np.zeros(self._n_cells + 1, dtype=pv.ID_TYPE)
+        counts = np.bincount(source, minlength=self._n_cells)
+        np.cumsum(counts, out=self._edge_offsets[1:])
+        self._edge_cells = target.astype(pv.ID_TYPE, copy=False)
+
+        return self._edge_offsets, self._edge_cells
+
+    def _ids(self, ids: int | ArrayLike, size: int, kind: str) -> np.ndarray:
+        """Verify the point-ids or cell-ids are within range.
+
+        Parameters
+        ----------
+        ids : int or ArrayLike
+            The point-ids or cell-ids.
+        size : int
+            The number of points or cells.
+        kind : str
+            The kind of ids, either ``point`` or ``cell``.
+
+        Returns
+        -------
+        ndarray
+            The sorted unique ids.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        result = np.unique(np.asarray(ids, dtype=pv.ID_TYPE))
+
+        if result.size and (result[0] < 0 or result[-1] >= size):
+            emsg = (
+                f"Require {kind}-ids in the range [0, {size}), got "
+                f"[{result[0]}, {result[-1]}]."
+            )
+            raise ValueError(emsg)
+
+        return result
+
+    @property
+    def n_cells(self) -> int:
+        """The number of mesh cells.
+
+        Returns
+        -------
+        int
+            The number of cells of the adjacency.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        return self._n_cells
+
+    @property
+    def n_points(self) -> int:
+        """The number of mesh points.
+
+        Returns
+        -------
+        int
+            The number of points of the adjacency.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        return self._n_points
+
+    def cell_points(self, cid: int | ArrayLike) -> np.ndarray:
+        """Find the points of the given cells.
+
+        Parameters
+        ----------
+        cid : int or ArrayLike
+            The cell-ids.
+
+        Returns
+        -------
+        ndarray
+            The sorted unique point-ids of the cells.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        cids = self._ids(cid, self._n_cells, "cell")
+        return np.unique(_gather(self._cell_offsets, self._cell_points, cids))
+
+    def neighbours(
+        self,
+        cid: int | ArrayLike,
+        edge: bool | None = False,
+        rings: int | None = None,
+    ) -> np.ndarray:
+        """Find the cells neighbouring the given cells.
+
+        Parameters
+        ----------
+        cid : int or ArrayLike
+            The cell-ids that are the focus of the neighbourhood.
+        edge : bool, default=False
+            Neighbouring cells share at least one edge, otherwise at least one
+            vertex.
+        rings : int, optional
+            The number of rings of neighbouring cells to expand the neighbourhood
+            by. Defaults to ``1``.
+
+        Returns
+        -------
+        ndarray
+            The sorted unique neighbouring cell-ids, excluding the given cells.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        if rings is None:
+            rings = 1
+
+        if (rings := int(rings)) < 1:
+            emsg = f"Require a positive number of neighbourhood rings, got '{rings}'."
+            raise ValueError(emsg)
+
+        cids = self._ids(cid, self._n_cells, "cell")
+        visited = frontier = cids
+
+        for _ in range(rings):
+            if edge:
+                candidates = _gather(*self._edges(), frontier)
+            else:
+                pids = np.unique(
+                    _gather(self._cell_offsets, self._cell_points, frontier)
+                )
+                candidates = _gather(self._point_offsets, self._point_cells, pids)
+            frontier = np.setdiff1d(np.unique(candidates), visited, assume_unique=True)
+            if not frontier.size:
+                break
+            visited = np.union1d(visited, frontier)
+
+        return np.setdiff1d(visited, cids, assume_unique=True)
+
+    def point_cells(self, pid: int | ArrayLike) -> np.ndarray:
+        """Find the cells containing the given points.
+
+        Parameters
+        ----------
+        pid : int or ArrayLike
+            The point-ids.
+
+        Returns
+        -------
+        ndarray
+            The sorted unique cell-ids of the cells containing the points.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        pids = self._ids(pid, self._n_points, "point")
+        return np.unique(_gather(self._point_offsets, self._point_cells, pids))
+
+    def _point_rows(self, pids: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Find the cells containing each of the given points.
+
+        Parameters
+        ----------
+        pids : ndarray
+            The valid point-ids.
+
+        Returns
+        -------
+        tuple of ndarray
+            The compressed sparse row (CSR) offsets, of shape (N + 1,), and the
+            sorted unique cell-ids of the cells containing each point.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        counts = self._point_offsets[pids + 1] - self._point_offsets[pids]
+        cells = _gather(self._point_offsets, self._point_cells, pids)
+        rows = np.repeat(np.arange(pids.size), counts)
+
+        # the cells of each point are sorted, hence remove adjacent duplicates
+        # e.g., of a degenerate cell referencing the same point more than once
+        keep = np.ones(cells.size, dtype=bool)
+        keep[1:] = (cells[1:] != cells[:-1]) | (rows[1:] != rows[:-1])
+        offsets = np.zeros(pids.size + 1, dtype=pv.ID_TYPE)
+        np.cumsum(np.bincount(rows[keep], minlength=pids.size), out=offsets[1:])
+
+        return offsets, cells[keep]
+
+
 class KDTree:  # numpydoc ignore=PR01
     """Construct a kd-tree for fast nearest neighbour search of a mesh.
 
@@ -124,13 +781,6 @@ class KDTree:  # numpydoc ignore=PR01
         .. versionadded:: 0.3.0
 
         """
-        from pykdtree.kdtree import KDTree as pyKDTree
-
-        if leaf_size is None:
-            leaf_size = KDTREE_LEAF_SIZE
-
-        leaf_size = int(leaf_size)
-
         if preference is None:
             preference = KDTREE_PREFERENCE
 
@@ -157,9 +807,12 @@ class KDTree:  # numpydoc ignore=PR01
             # TODO @bjlittle: Clarify zlevel preservation for non-WGS84 point-clouds.
             xyz = to_cartesian(transformed[:, 0], transformed[:, 1])
 
-        self._n_points: int = xyz.shape[0]
-        self._mesh_type = mesh.__class__.__name__
-        self._kdtree = pyKDTree(xyz, leafsize=leaf_size)
+        self._build(
+            xyz,
+            leaf_size=leaf_size,
+            mesh_type=mesh.__class__.__name__,
+            fingerprint=_fingerprint(mesh, self._preference),
+        )
 
     def __repr__(self) -> str:
         """Serialize kd-tree representation.
@@ -179,6 +832,247 @@ class KDTree:  # numpydoc ignore=PR01
         preference = f"preference='{self.preference}'"
         return f"{klass}({mesh}, {leaf_size}, {preference})"
 
+    def _build(
+        self,
+        xyz: np.ndarray,
+        leaf_size: int | None,
+        mesh_type: str,
+        fingerprint: str,
+    ) -> None:
+        """Construct the kd-tree from the cartesian data points.
+
+        Parameters
+        ----------
+        xyz : ndarray
+            The cartesian data points of shape (N, 3) to register with the kd-tree.
+        leaf_size : int, optional
+            The number of data points per tree leaf. Defaults to
+            :data:`KDTREE_LEAF_SIZE`.
+        mesh_type : str
+            The class name of the mesh used to construct the kd-tree.
+        fingerprint : str
+            The geometry fingerprint of the mesh used to construct the kd-tree.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        from pykdtree.kdtree import KDTree as pyKDTree
+
+        if leaf_size is None:
+            leaf_size = KDTREE_LEAF_SIZE
+
+        leaf_size = int(leaf_size)
+
+        self._n_points: int = xyz.shape[0]
+        self._mesh_type = mesh_type
+        self._fingerprint = fingerprint
+        self._kdtree = pyKDTree(xyz, leafsize=leaf_size)
+        # the lazy (min, max) radial extent of the data points
+        self._extent: tuple[float, float] | None = None
+
+    def _bound(self, xyz: np.ndarray, angle: float) -> float:
+        """Calculate the kd-tree distance upper bound of a great-circle angle.
+
+        The bound is the longest chord subtending the great-circle `angle`
+        between the points-of-interest and the kd-tree data points, which need
+        not be on the same sphere e.g., cell centers lie within it.
+
+        Parameters
+        ----------
+        xyz : ndarray
+            The cartesian points-of-interest of shape (N, 3).
+        angle : float
+            The great-circle angle (radians).
+
+        Returns
+        -------
+        float
+            The Euclidean distance upper bound, which is relaxed as the kd-tree
+            excludes neighbours at exactly the upper bound.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        if self._extent is None:
+            norms = np.linalg.norm(self._kdtree.data.reshape(-1, 3), axis=-1)
+            self._extent = (float(norms.min()), float(norms.max()))
+
+        angle = min(angle, np.pi)
+        norms = np.linalg.norm(xyz, axis=-1)
+        chord = max(
+            np.sqrt(max(lhs**2 + rhs**2 - 2 * lhs * rhs * np.cos(angle), 0))
+            for lhs in (norms.min(), norms.max())
+            for rhs in self._extent
+        )
+
+        return chord * (1 + 1e-6) + 1e-12
+
+    @classmethod
+    def load(
+        cls,
+        fname: PathLike,
+        mesh: pv.PolyData | None = None,
+        mmap: bool | None = True,
+    ) -> KDTree:
+        """Load a kd-tree previously persisted with :meth:`KDTree.save`.
+
+        The cartesian data points of the kd-tree are memory-mapped read-only by
+        default, allowing multiple processes to share the same index without
+        each holding a private copy. The kd-tree is then rebuilt over these
+        points, which avoids recalculating the mesh cell centers and any CRS
+        transformation of the original construction.
+
+        Parameters
+        ----------
+        fname : PathLike
+            The directory of the persisted kd-tree.
+        mesh : PolyData, optional
+            The mesh to be searched. If provided, then the `mesh` geometry
+            fingerprint must match that of the mesh used to construct the
+            persisted kd-tree.
+        mmap : bool, default=True
+            Memory-map the persisted cartesian data points read-only, otherwise
+            load them into memory.
+
+        Returns
+        -------
+        KDTree
+            The loaded kd-tree.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        fname = Path(fname)
+
+        # a concurrent save may replace the data points after reading the
+        # metadata, in which case the metadata is read again
+        for attempt in range(2):
+            with np.load(fname / "meta.npz") as meta:
+                version = int(meta["format"])
+                leaf_size = int(meta["leaf_size"])
+                preference = SearchPreference(str(meta["preference"]))
+                mesh_type = str(meta["mesh_type"])
+                fingerprint = str(meta["fingerprint"])
+                points = str(meta["points"])
+
+            if version != KDTREE_FORMAT:
+                emsg = (
+                    f"Cannot load kd-tree '{fname}', expected format version "
+                    f"{KDTREE_FORMAT}, got {version}."
+                )
+                raise ValueError(emsg)
+
+            if mesh is not None and _fingerprint(mesh, preference) != fingerprint:
+                emsg = (
+                    f"Cannot load kd-tree '{fname}', the mesh geometry does not "
+                    "match the geometry of the persisted kd-tree."
+                )
+                raise ValueError(emsg)
+
+            try:
+                xyz = np.load(fname / points, mmap_mode="r" if mmap else None)
+                break
+            except FileNotFoundError:
+                if attempt:
+                    raise
+
+        result = cls.__new__(cls)
+        result._preference = preference  # noqa: SLF001
+        result._build(  # noqa: SLF001
+            xyz, leaf_size=leaf_size, mesh_type=mesh_type, fingerprint=fingerprint
+        )
+
+        return result
+
+    def save(self, fname: PathLike) -> Path:
+        """Persist the kd-tree to disk.
+
+        The cartesian data points and configuration of the kd-tree are written
+        to the `fname` directory, along with the geometry fingerprint of the
+        mesh used to construct the kd-tree. Any existing kd-tree within the
+        `fname` directory is atomically replaced, such that a concurrent
+        :meth:`KDTree.load` always reads a complete kd-tree. A `fname` that is
+        neither an empty directory nor a persisted kd-tree is not replaced.
+
+        Parameters
+        ----------
+        fname : PathLike
+            The directory of the persisted kd-tree.
+
+        Returns
+        -------
+        Path
+            The directory of the persisted kd-tree.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        fname = Path(fname).absolute()
+
+        if fname.exists() and not _is_kdtree(fname):
+            emsg = (
+                f"Cannot save kd-tree '{fname}', as it is not an empty directory "
+                "or a persisted kd-tree."
+            )
+            raise ValueError(emsg)
+
+        fname.mkdir(parents=True, exist_ok=True)
+
+        # write the data points to a unique file, then atomically replace the
+        # metadata that refers to them, before removing any stale data points
+        fd, tmp = tempfile.mkstemp(prefix="points.", suffix=".npy", dir=fname)
+        os.close(fd)
+        points = Path(tmp)
+        fd, tmp = tempfile.mkstemp(prefix=".meta.", suffix=".npz", dir=fname)
+        os.close(fd)
+        meta = Path(tmp)
+        try:
+            np.save(points, np.asarray(self._kdtree.data).reshape(-1, 3))
+            np.savez(
+                meta,
+                format=KDTREE_FORMAT,
+                leaf_size=self.leaf_size,
+                preference=str(self.preference),
+                mesh_type=self._mesh_type,
+                fingerprint=self._fingerprint,
+                points=points.name,
+            )
+            meta.replace(fname / "meta.npz")
+        except OSError:
+            points.unlink(missing_ok=True)
+            meta.unlink(missing_ok=True)
+            raise
+
+        for stale in fname.glob("points.*.npy"):
+            if stale != points:
+                stale.unlink(missing_ok=True)
+
+        return fname
+
+    @property
+    def fingerprint(self) -> str:
+        """The geometry fingerprint of the mesh registered with the kd-tree.
+
+        Returns
+        -------
+        str
+            The hexadecimal fingerprint of the mesh geometry and topology.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        return self._fingerprint
+
     @property
     def leaf_size(self) -> int:
         """The number of data points per tree leaf.
@@ -262,6 +1156,7 @@ class KDTree:  # numpydoc ignore=PR01
         radius: float | None = None,
         zlevel: float | ArrayLike | None = None,
         zscale: float | None = None,
+        haversine: bool | None = False,
     ) -> NearestNeighbours:
         """Query the kd-tree for `k` nearest neighbours per point-of-interest.
 
@@ -291,6 +1186,12 @@ class KDTree:  # numpydoc ignore=PR01
         zscale : float, optional
             The proportional multiplier for z-axis `zlevel`. Defaults to
             :data:`geovista.common.ZLEVEL_SCALE`.
+        haversine : bool, default=False
+            Return the great-circle distance (metres) on a sphere of
+            :data:`EARTH_RADIUS`, rather than the Euclidean distance, of each
+            nearest neighbour.
+
+            .. versionadded:: 0.6.0
 
         Returns
         -------
@@ -316,14 +1217,210 @@ class KDTree:  # numpydoc ignore=PR01
         )
         assert isinstance(result, tuple)
         assert len(result) == 2
+
+        if haversine:
+            distances, indices = result
+            found = indices < self._n_points
+            points = self._kdtree.data.reshape(-1, 3)
+            if k > 1:
+                xyz = xyz[:, np.newaxis]
+            distances = distances.copy()
+            distances[found] = _great_circle(
+                np.broadcast_to(xyz, (*indices.shape, 3))[found],
+                points[indices[found]],
+            )
+            result = (distances, indices)
+
         return result
 
+    def query_ball(
+        self,
+        lons: float | ArrayLike,
+        lats: float | ArrayLike,
+        distance: float,
+        radius: float | None = None,
+        zlevel: float | ArrayLike | None = None,
+        zscale: float | None = None,
+        haversine: bool | None = False,
+    ) -> tuple[list[np.ndarray], list[np.ndarray]]:
+        """Query the kd-tree for all neighbours within a great-circle `distance`.
+
+        The great-circle `distance` is converted to the longest equivalent
+        Euclidean chord between the points-of-interest and the kd-tree data
+        points, which bounds the kd-tree search. The neighbours are then
+        filtered by their exact great-circle distance.
+
+        Parameters
+        ----------
+        lons : float or ArrayLike
+            One or more longitude values for the query points-of-interest.
+        lats : float or ArrayLike
+            One or more latitude values for the query points-of-interest.
+        distance : float
+            The great-circle distance (metres) on a sphere of
+            :data:`EARTH_RADIUS` of the search ball about each
+            point-of-interest.
+        radius : float, optional
+            The radius of the sphere of the kd-tree data points. Defaults to
+            :data:`geovista.common.RADIUS`.
+        zlevel : float or ArrayLike, default=0.0
+            The z-axis level. Used in combination with the `zscale` to offset the
+            `radius` by a proportional amount i.e., ``radius * zlevel * zscale``.
+            If `zlevel` is not a scalar, then its shape must match or broadcast
+            with the shape of `lons` and `lats`.
+        zscale : float, optional
+            The proportional multiplier for z-axis `zlevel`. Defaults to
+            :data:`geovista.common.ZLEVEL_SCALE`.
+        haversine : bool, default=False
+            Return the great-circle distance (metres) on a sphere of
+            :data:`EARTH_RADIUS`, rather than the Euclidean distance, of each
+            neighbour.
+
+        Returns
+        -------
+        tuple of list of ndarray
+            The distances and indices of the neighbours of each query
+            point-of-interest, in order of increasing distance.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        if distance < 0:
+            emsg = f"Require a non-negative great-circle distance, got '{distance}'."
+            raise ValueError(emsg)
+
+        if radius is None:
+            radius = RADIUS
+
+        xyz = to_cartesian(lons, lats, radius=radius, zlevel=zlevel, zscale=zscale)
+        n_poi = xyz.shape[0]
+        angle = min(distance / EARTH_RADIUS, np.pi)
+        points = self._kdtree.data.reshape(-1, 3)
+        bound = self._bound(xyz, angle)
+
+        # anticipate twice the neighbours of uniformly distributed points
+        expected = self._n_points * (1 - np.cos(angle)) / 2
+        k = max(KDTREE_BALL_K, 2 ** int(np.ceil(np.log2(2 * expected + 1))))
+        k = min(k, self._n_points)
+        pending = np.arange(n_poi)
+        found: list[tuple[np.ndarray, ...]] = []
+
+        # expand the number of nearest neighbours until each ball is exhausted
+        while pending.size:
+            distances, indices = self._kdtree.query(
+                xyz[pending], k=k, distance_upper_bound=bound
+            )
+            distances = distances.reshape(-1, k)
+            indices = indices.reshape(-1, k).astype(np.int64)
+            done = pending
+            if k < self._n_points:
+                full = indices[:, -1] < self._n_points
+                distances, indices = distances[~full], indices[~full]
+                done, pending = pending[~full], pending[full]
+            else:
+                pending = pending[:0]
+            valid = indices < self._n_points
+            rows = done[np.nonzero(valid)[0]]
+            found.append((rows, distances[valid], indices[valid]))
+            k = min(2 * k, self._n_points)
+
+        rows, distances, indices = (
+            np.concatenate(arrays) for arrays in zip(*found, strict=True)
+        )
+
+        # filter the neighbours by their exact great-circle distance
+        metres = _great_circle(xyz[rows], points[indices])
+        mask = metres <= distance * (1 + 1e-12)
+        rows, indices = rows[mask], indices[mask]
+        distances = metres[mask] if haversine else distances[mask]
+        order = (
+            np.lexsort((distances, rows))
+            if haversine
+            else np.argsort(rows, kind="stable")
+        )
+        rows, distances, indices = rows[order], distances[order], indices[order]
+
+        splits = np.cumsum(np.bincount(rows, minlength=n_poi))[:-1]
+        return np.split(distances, splits), np.split(indices, splits)
+
+
+def adjacency_cache_clear() -> int:
+    """Clear the adjacency cache.
+
+    Returns
+    -------
+    int
+        The number of adjacency cache entries removed.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    with _ADJACENCY_CACHE_LOCK:
+        result = len(_ADJACENCY_CACHE)
+        _ADJACENCY_CACHE.clear()
+
+    return result
 
-def find_cell_neighbours(mesh: pv.PolyData, cid: CellIDLike) -> CellIDs:
+
+def cell_adjacency(mesh: pv.PolyData) -> Adjacency:
+    """Get the cached compressed sparse row (CSR) adjacency of the mesh.
+
+    The adjacency is cached against the VTK modification time of the `mesh`
+    cells, such that it is reused until the topology of the `mesh` changes.
+    At most :data:`ADJACENCY_CACHE_SIZE` adjacencies are cached.
+
+    Parameters
+    ----------
+    mesh : PolyData
+        The mesh providing the points and cells.
+
+    Returns
+    -------
+    Adjacency
+        The adjacency of the `mesh`.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    cells = (mesh.GetVerts(), mesh.GetLines(), mesh.GetPolys(), mesh.GetStrips())
+    key = (
+        mesh.n_points,
+        mesh.n_cells,
+        *(0 if cell is None else cell.GetMTime() for cell in cells),
+    )
+
+    with _ADJACENCY_CACHE_LOCK:
+        if (result := _ADJACENCY_CACHE.get(key)) is not None:
+            _ADJACENCY_CACHE.move_to_end(key)
+            return result
+
+    result = Adjacency(mesh)
+
+    with _ADJACENCY_CACHE_LOCK:
+        _ADJACENCY_CACHE[key] = result
+        _ADJACENCY_CACHE.move_to_end(key)
+        while len(_ADJACENCY_CACHE) > ADJACENCY_CACHE_SIZE:
+            _ADJACENCY_CACHE.popitem(last=False)
+
+    return result
+
+
+def find_cell_neighbours(
+    mesh: pv.PolyData,
+    cid: CellIDLike,
+    edge: bool | None = False,
+    rings: int | None = None,
+) -> CellIDs:
     """Find all the cells neighbouring the given `cid` cell/s of the `mesh`.
 
     A cell is deemed to neighbour a `cid` cell if it shares at least one
-    vertex.
+    vertex, or at least one edge.
 
     Parameters
     ----------
@@ -332,6 +1429,16 @@ def find_cell_neighbours(mesh: pv.PolyData, cid: CellIDLike) -> CellIDs:
     cid : int or list of int
         The offset of the cell/s in the `mesh` that is/are the focus of the
         neighbourhood.
+    edge : bool, default=False
+        Neighbouring cells share at least one edge, otherwise at least one
+        vertex.
+
+        .. versionadded:: 0.6.0
+    rings : int, optional
+        The number of rings of neighbouring cells to expand the neighbourhood
+        by. Defaults to ``1``.
+
+        .. versionadded:: 0.6.0
 
     Returns
     -------
@@ -346,19 +1453,145 @@ def find_cell_neighbours(mesh: pv.PolyData, cid: CellIDLike) -> CellIDs:
     if not isinstance(cid, Iterable):
         cid = [cid]
 
-    pids = []
-    for idx in cid:
-        # NOTE: pyvista 0.38.0: cell_point_ids(idx) -> get_cell(idx).point_ids
-        pids.extend(mesh.get_cell(idx).point_ids)
+    adjacency = cell_adjacency(mesh)
+    result = adjacency.neighbours(list(cid), edge=edge, rings=rings)
 
-    # determine the unique points
-    pids = np.unique(list(pids))
-    # get the cell-ids of cells containing at least one common point
-    result = set(mesh.extract_points(pids)[VTK_CELL_IDS])
-    # remove the original cell/s
-    result -= set(cid)
+    return result.tolist()
 
-    return sorted(result)
+
+def find_containing_cells(
+    mesh: pv.PolyData,
+    lons: ArrayLike,
+    lats: ArrayLike,
+    kdtree: KDTree | None = None,
+    candidates: int | None = None,
+) -> np.ndarray:
+    """Find the cells in the `mesh` that contain many points-of-interest (POIs).
+
+    The cell centers of the `mesh` nearest to each POI are found with a
+    kd-tree, and each of these `candidates` cells is then tested for
+    containment of the POI on the sphere. The number of candidates is expanded
+    until either a containing cell is found, or no other cell center is within
+    the great-circle radius of the largest cell. The result is therefore
+    independent of the size and anisotropy of the cells.
+
+    The containment test is performed with cartesian geometry, and so is
+    robust to cells that straddle the anti-meridian or contain a pole. The
+    edges of each cell are assumed to be great-circle arcs, and each polygonal
+    cell is assumed to be convex.
+
+    Parameters
+    ----------
+    mesh : PolyData
+        The mesh defining the points, cells and CRS.
+    lons : ArrayLike
+        The POI longitudes.
+    lats : ArrayLike
+        The POI latitudes.
+    kdtree : KDTree, optional
+        The kd-tree of the `mesh` cell centers e.g., as loaded with
+        :meth:`KDTree.load`. Defaults to constructing a kd-tree with the
+        ``center`` search preference.
+    candidates : int, optional
+        The initial number of cells, with the nearest cell centers, to consider
+        for each POI. Defaults to :data:`CELL_CANDIDATES`.
+
+    Returns
+    -------
+    ndarray
+        The cellID of the cell containing each POI, or ``-1`` for a POI that is
+        outside the `mesh` e.g., beyond the domain of a limited area model. A POI
+        on the boundary of cells is located in the cell with the nearest center.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    if candidates is None:
+        candidates = CELL_CANDIDATES
+
+    if (candidates := int(candidates)) < 1:
+        emsg = f"Require a positive number of candidate cells, got '{candidates}'."
+        raise ValueError(emsg)
+
+    if not mesh.n_cells:
+        emsg = "Cannot find the containing cells of a mesh with no cells."
+        raise ValueError(emsg)
+
+    lons, lats = np.ravel(lons), np.ravel(lats)
+
+    if lons.shape != lats.shape:
+        emsg = (
+            "Require the same number of longitude and latitude points-of-interest, "
+            f"got {lons.size} and {lats.size}."
+        )
+        raise ValueError(emsg)
+
+    if kdtree is None:
+        kdtree = KDTree(mesh, preference=SearchPreference.CENTER)
+    elif kdtree.fingerprint != _fingerprint(mesh, SearchPreference.CENTER):
+        emsg = "Require a kd-tree of the cell centers of the mesh."
+        raise ValueError(emsg)
+
+    points = np.asarray(mesh.points, dtype=np.float64)
+    crs = from_wkt(mesh)
+
+    if crs not in [WGS84, None]:
+        transformed = transform_points(
+            src_crs=crs, tgt_crs=WGS84, xs=points[:, 0], ys=points[:, 1]
+        )
+        points = to_cartesian(transformed[:, 0], transformed[:, 1])
+
+    poi = to_cartesian(lons, lats).astype(np.float64, copy=False)
+    centers = np.asarray(kdtree.points, dtype=np.float64)
+
+    # the vertices of each cell, padded by repeating the last vertex
+    offsets, connectivity = _cell_arrays(mesh)
+    sizes = np.diff(offsets)
+    padding = np.minimum(np.arange(sizes.max()), np.maximum(sizes - 1, 0)[:, None])
+    vertices = connectivity[offsets[:-1, np.newaxis] + padding]
+    polygon = sizes >= 3
+
+    # the great-circle radius of the largest cap bounding a cell about its
+    # center, given the longest chord between the unit center and vertices
+    units = points / np.linalg.norm(points, axis=1)[:, np.newaxis]
+    centers = centers[polygon] / np.linalg.norm(centers[polygon], axis=1)[:, None]
+    chord = 0.0
+    for column in vertices[polygon].T:
+        chord = max(chord, np.max(np.sum((units[column] - centers) ** 2, axis=1)))
+    angle = 2 * np.arcsin(min(np.sqrt(chord) / 2, 1))
+    bound = kdtree._bound(poi, angle)  # noqa: SLF001
+    n_cells = mesh.n_cells
+
+    result = np.full(poi.shape[0], -1, dtype=pv.ID_TYPE)
+
+    for start in range(0, poi.shape[0], _SEARCH_CHUNK_SIZE):
+        pending = np.arange(start, min(start + _SEARCH_CHUNK_SIZE, poi.shape[0]))
+        k, first = min(candidates, n_cells), 0
+
+        # expand the candidate cells until each poi is located or exhausted
+        while pending.size:
+            _, cids = kdtree._kdtree.query(  # noqa: SLF001
+                poi[pending], k=k, distance_upper_bound=bound
+            )
+            cids = cids.reshape(-1, k).astype(pv.ID_TYPE)
+            located = np.zeros(pending.size, dtype=bool)
+            for col in range(first, k):
+                rows = np.flatnonzero(~located & (cids[:, col] < n_cells))
+                rows = rows[polygon[cids[rows, col]]]
+                if rows.size:
+                    ccids = cids[rows, col]
+                    inside = _cell_contains(points[vertices[ccids]], poi[pending[rows]])
+                    result[pending[rows[inside]]] = ccids[inside]
+                    located[rows[inside]] = True
+            exhausted = cids[:, -1] >= n_cells
+            if k == n_cells:
+                break
+            pending = pending[~located & ~exhausted]
+            k, first = min(2 * k, n_cells), k
+
+    return result
 
 
 def find_nearest_cell(
@@ -416,7 +1649,7 @@ def find_nearest_cell(
 
     if poi_is_vertex:
         pid = pids[mask][0]
-        result = sorted(mesh.extract_points(pid)[VTK_CELL_IDS])
+        result = cell_adjacency(mesh).point_cells(pid).tolist()
     else:
         result = [cid]
 
@@ -427,3 +1660,190 @@ def find_nearest_cell(
         (result,) = result
 
     return result
+
+
+def find_nearest_cells(
+    mesh: pv.PolyData,
+    xs: ArrayLike,
+    ys: ArrayLike,
+    zs: ArrayLike | None = None,
+    candidates: int | None = None,
+    single: bool | None = False,
+) -> list[CellIDs] | np.ndarray:
+    """Find the cells in the `mesh` that are closest to many points-of-interest (POIs).
+
+    The batched equivalent of :func:`find_nearest_cell`. The cell centers of
+    the `mesh` nearest to each POI are found with a kd-tree, and the closest of
+    these `candidates` cells is then determined from the vectorized distance
+    between the POI and the geometry of each candidate cell. The `candidates`
+    are expanded until no other cell may be closer to the POI, given the
+    sphere bounding each cell about its center.
+
+    Assumes that the POIs are in the canonical units of the `gvCRS`
+    associated with the `mesh`, otherwise assumes geographic longitude
+    and latitude.
+
+    If a POI is coincident with a vertex of its closest cell, then the
+    ``cellID`` of each cell which shares that vertex is returned.
+
+    Parameters
+    ----------
+    mesh : PolyData
+        The mesh defining the points, cells and CRS.
+    xs : ArrayLike
+        The POI x-coordinates. Defaults to ``longitude`` if no `mesh` CRS is
+        available.
+    ys : ArrayLike
+        The POI y-coordinates. Defaults to ``latitude`` if no `mesh` CRS is
+        available.
+    zs : ArrayLike, optional
+        The POI z-coordinates, if applicable. Defaults to zero.
+    candidates : int, optional
+        The initial number of cells, with the nearest cell centers, to consider
+        for each POI. Defaults to :data:`CELL_CANDIDATES`.
+    single : bool, default=False
+        Enforce expectation of only one nearest ``cellID`` result per POI, which
+        are returned as an array. Otherwise, a sorted list of ``cellIDs`` is
+        returned for each POI.
+
+    Returns
+    -------
+    list of list of int or ndarray
+        The cellIDs of the closest mesh cell, or the cellIDs that share the
+        coincident point-of-interest as a node, for each POI.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    The distance to a cell is the exact distance to a planar polygon. A
+    non-planar quadrilateral is measured against its mean plane within its
+    boundary, otherwise against its boundary. :func:`find_nearest_cell` uses
+    the VTK cell locator instead, which accepts a point slightly beyond a
+    quadrilateral, and measures to its extrapolated bilinear surface. It also
+    ignores degenerate triangles, such as polar triangles with a repeated
+    vertex. Hence, the two may disagree for a POI close to the edge shared by
+    two non-planar cells, or close to a degenerate cell.
+
+    """
+    from pykdtree.kdtree import KDTree as pyKDTree
+
+    if candidates is None:
+        candidates = CELL_CANDIDATES
+
+    if (candidates := int(candidates)) < 1:
+        emsg = f"Require a positive number of candidate cells, got '{candidates}'."
+        raise ValueError(emsg)
+
+    if not mesh.n_cells:
+        emsg = "Cannot find the nearest cells of a mesh with no cells."
+        raise ValueError(emsg)
+
+    xs, ys = np.ravel(xs), np.ravel(ys)
+
+    if xs.shape != ys.shape:
+        emsg = (
+            "Require the same number of x and y points-of-interest, got "
+            f"{xs.size} and {ys.size}."
+        )
+        raise ValueError(emsg)
+
+    crs = from_wkt(mesh)
+
+    if crs in [WGS84, None]:
+        poi = to_cartesian(xs, ys)
+    else:
+        zs = 0 if zs is None else np.ravel(zs)
+        poi = np.column_stack(np.broadcast_arrays(xs, ys, zs))
+
+    poi = poi.astype(np.float64, copy=False)
+    points = np.asarray(mesh.points, dtype=np.float64)
+    centers = np.asarray(mesh.cell_centers().points, dtype=np.float64)
+
+    # the vertices of each cell, padded by repeating the last vertex
+    offsets, connectivity = _cell_arrays(mesh)
+    sizes = np.diff(offsets)
+    padding = np.minimum(np.arange(sizes.max()), np.maximum(sizes - 1, 0)[:, None])
+    vertices = connectivity[offsets[:-1, np.newaxis] + padding]
+
+    # the radius of the sphere bounding each cell about its center
+    radii = np.linalg.norm(points[vertices] - centers[:, np.newaxis], axis=2)
+    radii = radii.max(axis=1)
+    # any cell beyond the candidates is no closer than this to the poi
+    radius = radii.max()
+    kdtree = pyKDTree(centers)
+    n_cells = mesh.n_cells
+
+    result = np.empty(poi.shape[0], dtype=pv.ID_TYPE)
+    pids = np.full(poi.shape[0], -1, dtype=pv.ID_TYPE)
+    best = np.full(poi.shape[0], np.inf)
+
+    for start in range(0, poi.shape[0], _SEARCH_CHUNK_SIZE):
+        chunk = slice(start, min(start + _SEARCH_CHUNK_SIZE, poi.shape[0]))
+        pending = np.arange(chunk.start, chunk.stop)
+        k, first = min(candidates, n_cells), 0
+
+        # expand the candidate cells until no other cell may be closer
+        while pending.size:
+            bounds, cids = kdtree.query(poi[pending], k=k)
+            bounds, cids = bounds.reshape(-1, k), cids.reshape(-1, k)
+            cids = cids.astype(pv.ID_TYPE)
+            if not first:
+                distance = _cell_distance(points[vertices[cids[:, 0]]], poi[pending])
+                best[pending], result[pending] = distance, cids[:, 0]
+                first = 1
+            # only consider candidates that may be closer than the closest cell,
+            # given the lower bound of the distance to each candidate cell
+            lower = np.maximum(bounds[:, first:] - radii[cids[:, first:]], 0) ** 2
+            rows, cols = np.nonzero(lower < best[pending][:, np.newaxis])
+            if rows.size:
+                cols += first
+                distance = np.full(cids.shape, np.inf)
+                distance[rows, cols] = _cell_distance(
+                    points[vertices[cids[rows, cols]]], poi[pending[rows]]
+                )
+                # the earliest candidate wins a tie, as the nearest cell center
+                cols = distance.argmin(axis=1)
+                distance = distance[np.arange(cids.shape[0]), cols]
+                closer = distance < best[pending]
+                best[pending[closer]] = distance[closer]
+                result[pending[closer]] = cids[closer, cols[closer]]
+            if k == n_cells:
+                break
+            lower = np.maximum(bounds[:, -1] - radius, 0) ** 2
+            pending = pending[lower < best[pending]]
+            k, first = min(2 * k, n_cells), k
+
+        # determine whether the poi is coincident with a vertex of the closest cell
+        cpoi, cpids = poi[chunk], vertices[result[chunk]]
+        mask = np.all(np.isclose(points[cpids], cpoi[:, np.newaxis]), axis=2)
+        coincident = np.any(mask, axis=1)
+        pids[chunk][coincident] = cpids[coincident, mask[coincident].argmax(axis=1)]
+
+    coincident = np.flatnonzero(pids >= 0)
+    shared: dict[int, CellIDs] = {}
+
+    if coincident.size:
+        # get the cell-ids of the cells containing each coincident point
+        offsets, cells = cell_adjacency(mesh)._point_rows(pids[coincident])  # noqa: SLF001
+        offsets, cells = offsets.tolist(), cells.tolist()
+        for idx, lower, upper in zip(
+            coincident.tolist(), offsets[:-1], offsets[1:], strict=True
+        ):
+            shared[idx] = cells[lower:upper]
+
+    if single:
+        if counts := {idx: len(cids) for idx, cids in shared.items() if len(cids) > 1}:
+            idx, count = next(iter(counts.items()))
+            emsg = (
+                f"Expected to find 1 cell per point-of-interest but found {count} "
+                f"for point-of-interest {idx}, got CellIDs {shared[idx]}."
+            )
+            raise ValueError(emsg)
+        return result
+
+    result = [[cid] for cid in result.tolist()]
+    for idx, cids in shared.items():
+        result[idx] = cids
+
+    return result
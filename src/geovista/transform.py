@@ -13,35 +13,195 @@ Notes
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
+import os
 from typing import TYPE_CHECKING
+import warnings
 
 import lazy_loader as lazy
 
-from .common import GV_FIELD_ZSCALE, ZLEVEL_SCALE, from_cartesian, point_cloud
+from .common import (
+    GV_CELL_IDS,
+    GV_FIELD_ZSCALE,
+    GV_POINT_IDS,
+    GV_REMESH_POINT_IDS,
+    ZLEVEL_SCALE,
+    TemplateCacheInfo,
+    _fingerprint,
+    _interpolation,
+    _TemplateCache,
+    from_cartesian,
+    geometry_dtype,
+    point_cloud,
+)
 from .crs import (
     WGS84,
     CRSLike,
     from_wkt,
     get_central_meridian,
+    get_crs,
+    get_transformer,
     set_central_meridian,
     to_wkt,
 )
 
 if TYPE_CHECKING:
-    from numpy.typing import ArrayLike
+    from numpy.typing import ArrayLike, DTypeLike
     import pyvista as pv
 
 # lazy import third-party dependencies
 np = lazy.load("numpy")
-pyproj = lazy.load("pyproj")
 
 __all__ = [
+    "GEOVISTA_PROJECTION_CACHE",
+    "PROJECTION_CACHE_SIZE",
+    "TRANSFORM_CHUNK_SIZE",
+    "projection_cache",
+    "projection_cache_clear",
+    "projection_cache_info",
     "transform_mesh",
     "transform_point",
     "transform_points",
 ]
 
+GEOVISTA_PROJECTION_CACHE: bool = (
+    os.environ.get("GEOVISTA_PROJECTION_CACHE", "false").lower() == "true"
+)
+"""Whether :func:`transform_mesh` memoizes sliced and projected mesh geometry."""
+
+PROJECTION_CACHE_SIZE: int = 8
+"""The maximum number of projected meshes held by the projection cache."""
+
+TRANSFORM_CHUNK_SIZE: int = 1_000_000
+"""The default maximum number of spatial points transformed in each chunk."""
+
+# the sliced mesh index mappings retained by the projection cache
+_PROJECTION_CACHE_ARRAYS: tuple[str, ...] = (
+    GV_CELL_IDS,
+    GV_POINT_IDS,
+    GV_REMESH_POINT_IDS,
+)
+
+# the projected mesh geometry and its warnings, in least recently used order
+_PROJECTION_CACHE = _TemplateCache(_PROJECTION_CACHE_ARRAYS)
+
+
+def _verify_positive(name: str, value: int) -> int:
+    """Ensure that the provided transform chunking value is a positive integer.
+
+    Parameters
+    ----------
+    name : str
+        The name of the parameter being verified.
+    value : int
+        The value of the parameter being verified.
+
+    Returns
+    -------
+    int
+        The verified value.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    if isinstance(value, bool) or not isinstance(value, int | np.integer) or value < 1:
+        emsg = (
+            f"Cannot transform points, '{name}' requires a positive integer, "
+            f"got {value!r}."
+        )
+        raise ValueError(emsg)
+
+    return int(value)
+
+
+def projection_cache(enable: bool | None = None) -> bool:
+    """Control whether :func:`transform_mesh` uses the projection cache.
+
+    The projection cache memoizes the sliced and projected geometry of a
+    mesh for a target CRS, keyed by a fingerprint of the mesh geometry and
+    the source and target CRS. Subsequent transformations of the same mesh
+    geometry to the same target CRS reuse the cached geometry, with the
+    current data arrays of the mesh remapped onto it.
+
+    Updates the status variable :data:`GEOVISTA_PROJECTION_CACHE`.
+
+    Parameters
+    ----------
+    enable : bool, optional
+        Whether to enable or disable the projection cache. Defaults
+        to ``True``.
+
+    Returns
+    -------
+    bool
+        The previous value of :data:`GEOVISTA_PROJECTION_CACHE`.
+
+    Notes
+    -----
+    The point data of a mesh bisected by the slice along the central meridian
+    of the target CRS is interpolated onto the points inserted along its seam
+    from the cached barycentric weights of each point within its original cell.
+
+    .. versionadded:: 0.6.0
+
+    """
+    global GEOVISTA_PROJECTION_CACHE  # noqa: PLW0603
+
+    if enable is None:
+        enable = True
+
+    original = GEOVISTA_PROJECTION_CACHE
+    GEOVISTA_PROJECTION_CACHE = bool(enable)
+    return original
+
+
+def projection_cache_clear(mesh: pv.PolyData | None = None) -> int:
+    """Invalidate entries of the projection cache.
+
+    Modifying the points of a mesh through ``mesh.points`` invalidates its
+    cached projections automatically. However, modifications that bypass
+    VTK, such as in-place arithmetic on a :func:`numpy.asarray` view of the
+    mesh points, must be followed by an explicit invalidation.
+
+    Parameters
+    ----------
+    mesh : PolyData, optional
+        The mesh whose cached projections are to be removed. Defaults to
+        removing all entries of the projection cache, and resetting its
+        statistics.
+
+    Returns
+    -------
+    int
+        The number of projection cache entries removed.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    return _PROJECTION_CACHE.clear(mesh=mesh)
+
+
+def projection_cache_info() -> TemplateCacheInfo:
+    """Report the statistics of the projection cache.
+
+    Returns
+    -------
+    TemplateCacheInfo
+        The hits, misses, maximum size and current size of the projection
+        cache.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    return _PROJECTION_CACHE.info(PROJECTION_CACHE_SIZE)
+
 
 def transform_mesh(
     mesh: pv.PolyData,
@@ -52,6 +212,7 @@ def transform_mesh(
     zlevel: float | ArrayLike | None = None,
     zscale: float | None = None,
     inplace: bool | None = False,
+    dtype: DTypeLike | None = None,
 ) -> pv.PolyData:
     """Transform the mesh from its source CRS to the target CRS.
 
@@ -83,6 +244,10 @@ def transform_mesh(
     inplace : bool, default=False
         Update the `mesh` in-place. Can only perform an in-place operation when
         ``slice_connectivity=False``.
+    dtype : DTypeLike, optional
+        The floating point precision of the transformed mesh points, either
+        ``float32`` or ``float64``. Defaults to the precision of the `mesh`
+        points.
 
     Returns
     -------
@@ -103,7 +268,7 @@ def transform_mesh(
         raise ValueError(emsg)
 
     # sanity check the target crs
-    tgt_crs = pyproj.CRS.from_user_input(tgt_crs)
+    tgt_crs = get_crs(tgt_crs)
 
     original_tgt_crs = deepcopy(tgt_crs)
     transform_required = src_crs != tgt_crs
@@ -113,6 +278,9 @@ def transform_mesh(
     if zlevel is None:
         zlevel = 0
 
+    if dtype is not None:
+        dtype = geometry_dtype(dtype)
+
     if zscale is None:
         if cloud and GV_FIELD_ZSCALE in mesh.field_data:
             zscale = mesh[GV_FIELD_ZSCALE]
@@ -120,23 +288,57 @@ def transform_mesh(
             zscale = ZLEVEL_SCALE
 
     if transform_required:
+        key = None
+
+        if (
+            GEOVISTA_PROJECTION_CACHE
+            and slice_connectivity
+            and not cloud
+            and np.ndim(zlevel) == 0
+            and np.ndim(zscale) == 0
+        ):
+            settings = (
+                src_crs.to_wkt(),
+                original_tgt_crs.to_wkt(),
+                rtol,
+                atol,
+                float(zlevel),
+                float(zscale),
+                None if dtype is None else np.dtype(dtype).name,
+            )
+            key = (_fingerprint(mesh), *settings)
+
+            if (result := _PROJECTION_CACHE.get(key, mesh)) is not None:
+                to_wkt(result, original_tgt_crs)
+                return result
+
+        source, interpolation, wmsgs = mesh, None, []
+
         # slice the mesh to break connectivity, but not for a point-cloud
         if slice_connectivity:
             if central_meridian:
+                # rotate a shallow copy, leaving the original mesh unmodified
+                mesh = mesh.copy(deep=False)
                 mesh.rotate_z(-central_meridian, inplace=True)
                 tgt_crs = set_central_meridian(tgt_crs, 0)
 
             if not cloud:
                 # the sliced_mesh is guaranteed to be a new instance,
                 # even if not bisected
-                sliced_mesh = slice_mesh(mesh, rtol=rtol, atol=atol)
+                with warnings.catch_warnings(record=key is not None) as records:
+                    if records is not None:
+                        warnings.simplefilter("always")
+                    sliced_mesh = slice_mesh(mesh, rtol=rtol, atol=atol)
+                # record the slice warnings for a cache hit to issue
+                for record in records or []:
+                    warnings.warn(record.message, stacklevel=2)
+                    wmsgs.append(record.message)
+                # locate any points inserted along the seam before projection
+                if key is not None:
+                    interpolation = _interpolation(sliced_mesh, mesh)
             else:
                 sliced_mesh = mesh.copy()
 
-            if central_meridian:
-                # undo rotation of original mesh
-                mesh.rotate_z(central_meridian, inplace=True)
-
             mesh = sliced_mesh
 
         # now perform the CRS transformation
@@ -145,19 +347,27 @@ def transform_mesh(
         else:
             xyz = mesh.points
 
-        transformed = transform_points(
-            src_crs=src_crs, tgt_crs=tgt_crs, xs=xyz[:, 0], ys=xyz[:, 1]
-        )
-        xs, ys = transformed[:, 0], transformed[:, 1]
-        zs = 0
+        if cloud:
+            # extract the zlevel encoded from the non-transformed points
+            zlevel = zlevel + xyz[:, 2]
 
         if not inplace and not slice_connectivity:
             mesh = mesh.copy(deep=True)
 
-        mesh.points[:, 0] = xs
-        mesh.points[:, 1] = ys
+        if dtype is not None and mesh.points.dtype != dtype:
+            mesh.points = mesh.points.astype(dtype)
 
-        if zlevel or cloud:
+        # transform directly into the mesh points, avoiding any intermediate copy
+        _ = transform_points(
+            src_crs=src_crs,
+            tgt_crs=tgt_crs,
+            xs=xyz[:, 0],
+            ys=xyz[:, 1],
+            out=mesh.points,
+        )
+        zs = 0
+
+        if cloud or zlevel:
             xmin, xmax, ymin, ymax, _, _ = mesh.bounds
             xdelta, ydelta = abs(xmax - xmin), abs(ymax - ymin)
             # TODO @bjlittle: Make this scale factor configurable at the API/module
@@ -165,11 +375,6 @@ def transform_mesh(
             #                 there isn't consistent scaling across all geometries
             #                 added to the render scene.
             delta = max(xdelta, ydelta) // 4
-
-            if cloud:
-                # extract the zlevel encoded from the non-transformed points
-                zlevel += xyz[:, 2]
-
             zs = zlevel * zscale * delta
 
         mesh.points[:, 2] = zs
@@ -177,6 +382,22 @@ def transform_mesh(
         # TODO @bjlittle: Check whether to clean other field_data metadata.
         to_wkt(mesh, original_tgt_crs)
 
+        if key is not None and interpolation is not None:
+            # serve the projected mesh as it would be served by a cache hit
+            mesh = _PROJECTION_CACHE.put(
+                key,
+                source,
+                mesh,
+                interpolation,
+                PROJECTION_CACHE_SIZE,
+                wmsgs=wmsgs,
+            )
+            to_wkt(mesh, original_tgt_crs)
+    elif dtype is not None and mesh.points.dtype != dtype:
+        if not inplace:
+            mesh = mesh.copy(deep=True)
+        mesh.points = mesh.points.astype(dtype)
+
     return mesh
 
 
@@ -243,6 +464,9 @@ def transform_points(
     ys: ArrayLike,
     zs: ArrayLike | None = None,
     trap: bool | None = True,
+    workers: int | None = None,
+    chunk_size: int | None = None,
+    out: ArrayLike | None = None,
 ) -> ArrayLike:
     """Transform the spatial points from the source to the target CRS.
 
@@ -272,6 +496,20 @@ def transform_points(
         Raise an exception if an error occurs during CRS transformation
         of the spatial points. Otherwise, ``inf`` will be returned for
         erroneous points.
+    workers : int, optional
+        The maximum number of threads used to transform chunks of the
+        spatial points concurrently. The underlying transformation releases
+        the GIL, so large numbers of points benefit from multiple workers.
+        Defaults to ``1`` i.e., the points are transformed serially.
+    chunk_size : int, optional
+        The maximum number of spatial points transformed in each chunk.
+        Defaults to :data:`TRANSFORM_CHUNK_SIZE`.
+    out : ArrayLike, optional
+        A preallocated floating point array with shape ``(N, 3)``, where ``N``
+        is the total number of spatial points, into which the transformed
+        points are written. For example, ``mesh.points`` may be provided to
+        transform the points of a mesh in-place. Otherwise, a new array is
+        allocated.
 
     Returns
     -------
@@ -293,8 +531,8 @@ def transform_points(
         zs = np.atleast_1d(zs)
 
     # sanity check the crs's
-    src_crs = pyproj.CRS.from_user_input(src_crs)
-    tgt_crs = pyproj.CRS.from_user_input(tgt_crs)
+    src_crs = get_crs(src_crs)
+    tgt_crs = get_crs(tgt_crs)
 
     # sanity check spatial arrays
     if (xndim := xs.ndim) > 2 or (yndim := ys.ndim) > 2:
@@ -304,10 +542,10 @@ def transform_points(
     shape = list(xs.shape)
 
     if xndim != 1:
-        xs = xs.flatten()
+        xs = xs.ravel()
 
     if yndim != 1:
-        ys = ys.flatten()
+        ys = ys.ravel()
 
     if xs.size != ys.size:
         emsg = (
@@ -322,7 +560,7 @@ def transform_points(
             raise ValueError(emsg)
 
         if zndim != 1:
-            zs = zs.flatten()
+            zs = zs.ravel()
 
         if zs.size != xs.size:
             emsg = (
@@ -331,57 +569,82 @@ def transform_points(
             )
             raise ValueError(emsg)
 
-    def combine(xs: ArrayLike, ys: ArrayLike, zs: ArrayLike | None = None) -> ArrayLike:
-        """Combine the provided points into a single array with shape (N, 3).
+    workers = _verify_positive("workers", 1 if workers is None else workers)
+    chunk_size = _verify_positive(
+        "chunk_size", TRANSFORM_CHUNK_SIZE if chunk_size is None else chunk_size
+    )
+
+    n_points = xs.size
+    transform_required = src_crs != tgt_crs
+
+    if out is None:
+        if transform_required:
+            dtype = np.float64
+        else:
+            dtype = np.result_type(xs, ys, *([] if zs is None else [zs]))
+        out = np.empty((n_points, 3), dtype=dtype)
+    elif out.shape != (n_points, 3):
+        emsg = (
+            f"Cannot transform points, 'out' requires shape ({n_points:,}, 3), "
+            f"got {out.shape}."
+        )
+        raise ValueError(emsg)
+
+    if transform_required:
+        transformer = get_transformer(src_crs, tgt_crs)
+
+    def task(start: int, stop: int) -> None:
+        """Transform a chunk of the spatial points into the `out` array.
 
         Parameters
         ----------
-        xs : ArrayLike
-            The x-coordinate points with shape (N,).
-        ys : ArrayLike
-            The y-coordinate points with shape (N,).
-        zs : ArrayLike, optional
-            The z-coordinate points with shape (N,).
-
-        Returns
-        -------
-        ArrayLike
-            The (N, 3) array combined from `xs`, `ys`, and `zs`.
+        start : int
+            The index of the first spatial point in the chunk.
+        stop : int
+            The index after the last spatial point in the chunk.
 
         Notes
         -----
-        .. versionadded:: 0.4.0
+        .. versionadded:: 0.6.0
 
         """
-        # ensure to promote unpacked scalars
-        xs = np.atleast_1d(xs)
-        ys = np.atleast_1d(ys)
-        zs = np.zeros_like(xs) if zs is None else np.atleast_1d(zs)
-
-        assert xs.shape == ys.shape == zs.shape, (
-            "Cannot combine points, non-uniform shapes."
-        )
-
-        return np.vstack([xs, ys, zs]).T
-
-    if src_crs == tgt_crs:
-        result = combine(xs, ys, zs)
+        cxs, cys = xs[start:stop], ys[start:stop]
+        czs = None if zs is None else zs[start:stop]
+
+        if transform_required:
+            if cxs.size == 1:
+                # unpack to avoid "conversion of an array with ndim > 0 to a
+                # scalar" deprecation (numpy 1.25)
+                cxs, cys = cxs[0], cys[0]
+                if czs is not None:
+                    czs = czs[0]
+            transformed = transformer.transform(cxs, cys, czs, errcheck=trap)
+
+            if czs is None:
+                cxs, cys = transformed
+            else:
+                cxs, cys, czs = transformed
+
+        out[start:stop, 0] = cxs
+        out[start:stop, 1] = cys
+        out[start:stop, 2] = 0 if czs is None else czs
+
+    chunks = [
+        (start, min(start + chunk_size, n_points))
+        for start in range(0, n_points, chunk_size)
+    ]
+
+    if workers > 1 and len(chunks) > 1:
+        with ThreadPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+            futures = [executor.submit(task, *chunk) for chunk in chunks]
+            # propagate any exception raised within a worker
+            for future in futures:
+                future.result()
     else:
-        transformer = pyproj.Transformer.from_crs(src_crs, tgt_crs, always_xy=True)
-        if xs.size == 1:
-            # unpack to avoid "conversion of an array with ndim > 0 to a scalar"
-            # deprecation (numpy 1.25)
-            xs, ys = xs[0], ys[0]
-            if zs is not None:
-                zs = zs[0]
-        transformed = transformer.transform(xs, ys, zs, errcheck=trap)
-
-        if zs is None:
-            (txs, tys), tzs = transformed, None
-        else:
-            txs, tys, tzs = transformed
+        for chunk in chunks:
+            task(*chunk)
 
-        result = combine(txs, tys, tzs)
+    result = out
 
     if xndim == 2:
         shape.append(3)
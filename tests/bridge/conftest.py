@@ -0,0 +1,40 @@
+# Copyright (c) 2021, GeoVista Contributors.
+#
+# This file is part of GeoVista and is distributed under the 3-Clause BSD license.
+# See the LICENSE file in the package root directory for licensing details.
+
+"""pytest fixture infra-structure for :mod:`geovista.bridge` unit-tests."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+# tiled geotiff shape and block shape
+TIFF_SHAPE: tuple[int, int] = (48, 80)
+TIFF_BLOCK: tuple[int, int] = (16, 32)
+
+
+@pytest.fixture
+def geotiff(tmp_path):
+    """Fixture generates a single band tiled GeoTIFF of 1/4 degree pixels."""
+    rio = pytest.importorskip("rasterio")
+    from rasterio.transform import from_origin
+
+    height, width = TIFF_SHAPE
+    profile = {
+        "driver": "GTiff",
+        "height": height,
+        "width": width,
+        "count": 1,
+        "dtype": "float32",
+        "crs": "EPSG:4326",
+        "transform": from_origin(-10.0, 10.0, 0.25, 0.25),
+        "tiled": True,
+        "blockysize": TIFF_BLOCK[0],
+        "blockxsize": TIFF_BLOCK[1],
+    }
+    fname = tmp_path / "geotiff.tif"
+    with rio.open(fname, mode="w", **profile) as dst:
+        dst.write(np.arange(height * width, dtype=np.float32).reshape(height, width), 1)
+    return fname
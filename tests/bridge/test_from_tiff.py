@@ -253,3 +253,51 @@ def test_extract(mocker, masked, rgb, sieve):
         assert mocked_sieve.call_count == 0
         assert mocked_extract.call_count == 0
         assert mocked_cast.call_count == 0
+
+
+@pytest.mark.parametrize(
+    ("bbox", "shape"),
+    [
+        ((-10.0, -2.0, 10.0, 10.0), (48, 80)),
+        ((-5.0, 0.0, 0.0, 5.0), (20, 20)),
+        ((-4.9, 0.1, -0.1, 4.9), (20, 20)),
+        ((-20.0, 5.0, -5.0, 20.0), (20, 20)),
+    ],
+)
+def test_bbox(geotiff, bbox, shape):
+    """Test only the pixels covering the bounding-box are meshed."""
+    full = Transform.from_tiff(geotiff)
+    result = Transform.from_tiff(geotiff, bbox=bbox)
+    height, width = shape
+    assert result.n_points == height * width
+    assert result.n_cells == (height - 1) * (width - 1)
+    # the windowed mesh is a subset of the full resolution mesh
+    lookup = dict(zip(full["point_data"], full.points, strict=True))
+    expected = np.array([lookup[value] for value in result["point_data"]])
+    np.testing.assert_array_equal(result.points, expected)
+
+
+@pytest.mark.parametrize("bbox", [(20.0, 0.0, 30.0, 10.0), (-5.0, 0.0, -4.9, 5.0)])
+def test_bbox_fail(geotiff, bbox):
+    """Test trap of a bounding-box with too few pixels."""
+    emsg = "requires at least 2x2 pixels of the GeoTIFF"
+    with pytest.raises(ValueError, match=emsg):
+        _ = Transform.from_tiff(geotiff, bbox=bbox)
+
+
+@pytest.mark.parametrize("decimate", [1, 2, 3, 4])
+def test_decimate(geotiff, decimate):
+    """Test the resolution of the mesh is reduced by the decimation factor."""
+    result = Transform.from_tiff(geotiff, decimate=decimate)
+    height, width = -(-48 // decimate), -(-80 // decimate)
+    assert result.n_points == height * width
+    full = Transform.from_tiff(geotiff)
+    np.testing.assert_allclose(result.bounds, full.bounds, atol=0.05)
+
+
+@pytest.mark.parametrize("decimate", [0, -1, 1.5])
+def test_decimate_fail(geotiff, decimate):
+    """Test trap of an invalid decimation factor."""
+    emsg = "Require a positive integer decimation factor"
+    with pytest.raises(ValueError, match=emsg):
+        _ = Transform.from_tiff(geotiff, decimate=decimate)
@@ -0,0 +1,76 @@
+# Copyright (c) 2021, GeoVista Contributors.
+#
+# This file is part of GeoVista and is distributed under the 3-Clause BSD license.
+# See the LICENSE file in the package root directory for licensing details.
+
+"""Unit-tests for :meth:`geovista.Transform.from_tiff_tiles`."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from geovista.bridge import Transform
+
+# skip tests if rasterio package unavailable
+pytest.importorskip("rasterio")
+
+
+def _cells(meshes) -> np.ndarray:
+    """Return the sorted cell data values of the meshes, via their first point."""
+    values = [mesh["point_data"][mesh.regular_faces[:, 0]] for mesh in meshes]
+    return np.sort(np.concatenate(values))
+
+
+def test_tiles(geotiff):
+    """Test the block meshes seamlessly cover the full mesh."""
+    full = Transform.from_tiff(geotiff)
+    tiles = list(Transform.from_tiff_tiles(geotiff))
+    # 3x3 blocks
+    assert len(tiles) == 9
+    assert sum(tile.n_cells for tile in tiles) == full.n_cells
+    np.testing.assert_array_equal(_cells(tiles), _cells([full]))
+
+
+@pytest.mark.parametrize("decimate", [None, 2])
+def test_tiles_bbox(geotiff, decimate):
+    """Test only the block meshes covering the bounding-box are yielded."""
+    bbox = (-5.0, 0.0, 0.0, 5.0)
+    full = Transform.from_tiff(geotiff, bbox=bbox)
+    tiles = list(Transform.from_tiff_tiles(geotiff, bbox=bbox, decimate=decimate))
+    assert len(tiles) == 4
+    if decimate is None:
+        np.testing.assert_array_equal(_cells(tiles), _cells([full]))
+    for tile in tiles:
+        assert np.all(np.isin(tile["point_data"], full["point_data"]))
+
+
+def test_tiles_decimate(geotiff):
+    """Test the resolution of the block meshes is reduced."""
+    full = Transform.from_tiff(geotiff)
+    tiles = list(Transform.from_tiff_tiles(geotiff, decimate=4))
+    assert len(tiles) == 9
+    assert sum(tile.n_cells for tile in tiles) < full.n_cells // 8
+
+
+@pytest.mark.parametrize(
+    ("decimate", "bbox"), [(4, None), (3, (-10.0, -2.0, 9.5, 10.0))]
+)
+def test_tiles_decimate_full(geotiff, decimate, bbox):
+    """Test the decimated block meshes seamlessly cover the decimated full mesh."""
+    full = Transform.from_tiff(geotiff, bbox=bbox, decimate=decimate)
+    tiles = list(Transform.from_tiff_tiles(geotiff, bbox=bbox, decimate=decimate))
+    assert sum(tile.n_cells for tile in tiles) == full.n_cells
+    np.testing.assert_array_equal(_cells(tiles), _cells([full]))
+    points = np.unique(np.vstack([tile.points for tile in tiles]), axis=0)
+    np.testing.assert_allclose(points, np.unique(full.points, axis=0), atol=1e-12)
+
+
+def test_tiles_lazy(mocker, geotiff):
+    """Test the blocks are read on demand."""
+    spy = mocker.spy(Transform, "_tiff_mesh")
+    tiles = Transform.from_tiff_tiles(geotiff)
+    assert spy.call_count == 0
+    _ = next(tiles)
+    assert spy.call_count == 1
+    tiles.close()
@@ -0,0 +1,67 @@
+# Copyright (c) 2021, GeoVista Contributors.
+#
+# This file is part of GeoVista and is distributed under the 3-Clause BSD license.
+# See the LICENSE file in the package root directory for licensing details.
+
+"""Unit-tests for :meth:`geovista.Transform.from_unstructured`."""
+
+from __future__ import annotations
+
+import numpy as np
+from numpy.testing import assert_array_equal
+import pytest
+
+from geovista.bridge import Transform
+
+
+@pytest.fixture
+def unstructured():
+    """Fixture provides the geometry and connectivity of a small triangle/quad mesh."""
+    lons = np.array([0.0, 10.0, 10.0, 0.0, 20.0, 20.0])
+    lats = np.array([0.0, 0.0, 10.0, 10.0, 0.0, 10.0])
+    connectivity = np.array([[0, 1, 2, 3], [1, 4, 5, 2]], dtype=np.uint32)
+    return lons, lats, connectivity
+
+
+@pytest.mark.parametrize("start_index", [0, 1])
+def test_connectivity(unstructured, start_index):
+    """Test the faces and start index of the connectivity are honoured."""
+    lons, lats, connectivity = unstructured
+    original = connectivity + start_index
+    result = Transform.from_unstructured(
+        lons, lats, connectivity=original, start_index=start_index
+    )
+    expected = np.array([4, 0, 1, 2, 3, 4, 1, 4, 5, 2])
+    assert_array_equal(result.faces, expected)
+    assert_array_equal(result._offset_array, [0, 4, 8])
+    # the caller connectivity must not be modified
+    assert_array_equal(original, connectivity + start_index)
+
+
+def test_connectivity_masked(unstructured):
+    """Test the faces of masked connectivity with mixed face geometries."""
+    lons, lats, connectivity = unstructured
+    connectivity = np.ma.masked_array(connectivity, mask=[[0, 0, 0, 1], [0, 0, 0, 0]])
+    result = Transform.from_unstructured(lons, lats, connectivity=connectivity)
+    expected = np.array([3, 0, 1, 2, 4, 1, 4, 5, 2])
+    assert_array_equal(result.faces, expected)
+    assert_array_equal(result._offset_array, [0, 3, 7])
+
+
+def test_connectivity_masked_invalid(unstructured):
+    """Test masked connectivity faces with too few vertices are removed."""
+    lons, lats, connectivity = unstructured
+    connectivity = np.ma.masked_array(connectivity, mask=[[0, 0, 0, 0], [0, 1, 1, 0]])
+    wmsg = "geovista masked connectivity defines 1 face with no vertices"
+    with pytest.warns(UserWarning, match=wmsg):
+        result = Transform.from_unstructured(lons, lats, connectivity=connectivity)
+    assert result.n_cells == 1
+    assert_array_equal(result.faces, [4, 0, 1, 2, 3])
+
+
+def test_connectivity_shape():
+    """Test the faces of connectivity defined by shape."""
+    lons = np.array([0.0, 10.0, 10.0, 20.0, 30.0, 30.0])
+    lats = np.array([0.0, 0.0, 10.0, 0.0, 0.0, 10.0])
+    result = Transform.from_unstructured(lons, lats, connectivity=(2, 3))
+    assert_array_equal(result.faces, [3, 0, 1, 2, 3, 3, 4, 5])
@@ -0,0 +1,135 @@
+# Copyright (c) 2021, GeoVista Contributors.
+#
+# This file is part of GeoVista and is distributed under the 3-Clause BSD license.
+# See the LICENSE file in the package root directory for licensing details.
+
+"""Unit-tests for :meth:`geovista.Transform.from_volume`."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+from numpy.testing import assert_allclose, assert_array_equal
+from pyproj import CRS
+import pytest
+
+from geovista.bridge import NAME_POINTS, Transform
+from geovista.common import GV_FIELD_RADIUS, GV_FIELD_ZSCALE, RADIUS, ZLEVEL_SCALE
+from geovista.crs import WGS84
+from geovista.transform import transform_points
+
+if TYPE_CHECKING:
+    import pyvista as pv
+
+
+@pytest.fixture
+def volume():
+    """Fixture provides the horizontal points, z-levels and data of a volume."""
+    lons, lats = np.meshgrid(np.linspace(-180, 150, num=12), np.linspace(-90, 90, 7))
+    zlevel = np.arange(5) * -10
+    data = np.arange(zlevel.size * lons.size).reshape(zlevel.size, *lons.shape)
+    return lons, lats, zlevel, data
+
+
+def _from_points(
+    lons: np.ndarray,
+    lats: np.ndarray,
+    zlevel: np.ndarray,
+    data: np.ndarray | None = None,
+    zscale: float | None = None,
+) -> pv.PolyData:
+    """Build the equivalent point-cloud of the broadcast volume."""
+    shape = (zlevel.shape[0], *lons.shape)
+    if zlevel.ndim == 1:
+        zlevel = zlevel.reshape(-1, *(1,) * lons.ndim)
+    return Transform.from_points(
+        np.broadcast_to(lons, shape),
+        np.broadcast_to(lats, shape),
+        data=data,
+        zlevel=np.broadcast_to(zlevel, shape),
+        zscale=zscale,
+    )
+
+
+@pytest.mark.parametrize("zscale", [None, 1e-2])
+def test_points(volume, zscale):
+    """Test the volume points are equivalent to the broadcast point-cloud."""
+    lons, lats, zlevel, data = volume
+    result = Transform.from_volume(lons, lats, zlevel, data=data, zscale=zscale)
+    expected = _from_points(lons, lats, zlevel, data=data, zscale=zscale)
+    assert result.n_points == result.n_cells == data.size
+    assert_allclose(result.points, expected.points, rtol=0, atol=1e-15)
+    assert_array_equal(result[NAME_POINTS], data.ravel())
+    assert np.isclose(result[GV_FIELD_RADIUS], RADIUS)
+    expected = ZLEVEL_SCALE if zscale is None else zscale
+    assert np.isclose(result[GV_FIELD_ZSCALE], expected)
+
+
+def test_points_zlevel_volume(volume):
+    """Test z-levels provided for each point of the volume."""
+    lons, lats, _, data = volume
+    zlevel = -data
+    result = Transform.from_volume(lons, lats, zlevel, zscale=1e-3)
+    expected = _from_points(lons, lats, zlevel, zscale=1e-3)
+    assert_allclose(result.points, expected.points, rtol=0, atol=1e-15)
+
+
+@pytest.mark.parametrize("decimate", [2, 3])
+def test_decimate(volume, decimate):
+    """Test the z-levels of the volume are decimated."""
+    lons, lats, zlevel, data = volume
+    result = Transform.from_volume(
+        lons, lats, zlevel, data=data, name="dummy", decimate=decimate
+    )
+    expected = _from_points(lons, lats, zlevel[::decimate])
+    assert_allclose(result.points, expected.points, rtol=0, atol=1e-15)
+    assert_array_equal(result["dummy"], data[::decimate].ravel())
+
+
+def test_dtype(volume):
+    """Test the precision of the mesh points."""
+    lons, lats, zlevel, _ = volume
+    result = Transform.from_volume(lons, lats, zlevel, dtype="float32")
+    assert result.points.dtype == np.float32
+
+
+@pytest.mark.parametrize("ndim", [1, 2])
+def test_crs(volume, ndim):
+    """Test the horizontal points of a volume are transformed from the CRS."""
+    lons, lats, zlevel, data = volume
+    # avoid the poles, which are undefined in mercator
+    lons, lats, data = lons[1:-1], lats[1:-1], data[:, 1:-1]
+    if ndim == 1:
+        lons, lats, data = lons.ravel(), lats.ravel(), data.reshape(zlevel.size, -1)
+    crs = CRS.from_user_input("EPSG:3857")
+    xy = transform_points(src_crs=WGS84, tgt_crs=crs, xs=lons, ys=lats)
+    xs, ys = xy[..., 0].reshape(lons.shape), xy[..., 1].reshape(lats.shape)
+    result = Transform.from_volume(xs, ys, zlevel, data=data, crs=crs)
+    expected = _from_points(lons, lats, zlevel, data=data)
+    assert_allclose(result.points, expected.points, rtol=0, atol=1e-12)
+    assert_array_equal(result[NAME_POINTS], data.ravel())
+
+
+def test_horizontal_fail(volume):
+    """Test trap of horizontal points with a different shape."""
+    lons, lats, zlevel, _ = volume
+    emsg = "Require 1-D or 2-D horizontal xs and ys with the same shape"
+    with pytest.raises(ValueError, match=emsg):
+        _ = Transform.from_volume(lons, lats[:-1], zlevel)
+
+
+def test_zlevel_fail(volume):
+    """Test trap of z-levels with an incompatible shape."""
+    lons, lats, _, _ = volume
+    emsg = r"Require 1-D z-levels or 3-D z-levels with trailing shape \(7, 12\)"
+    with pytest.raises(ValueError, match=emsg):
+        _ = Transform.from_volume(lons, lats, np.zeros((5, 12, 7)))
+
+
+def test_decimate_fail(volume):
+    """Test trap of an invalid z-level decimation factor."""
+    lons, lats, zlevel, _ = volume
+    emsg = "Require a positive integer decimation factor, got '0'"
+    with pytest.raises(ValueError, match=emsg):
+        _ = Transform.from_volume(lons, lats, zlevel, decimate=0)
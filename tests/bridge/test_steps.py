@@ -0,0 +1,66 @@
+# Copyright (c) 2021, GeoVista Contributors.
+#
+# This file is part of GeoVista and is distributed under the 3-Clause BSD license.
+# See the LICENSE file in the package root directory for licensing details.
+
+"""Unit-tests for :meth:`geovista.Transform.steps`."""
+
+from __future__ import annotations
+
+import numpy as np
+from numpy.testing import assert_array_equal
+import pytest
+
+from geovista.bridge import NAME_CELLS, NAME_POINTS, Transform
+from geovista.common import GV_FIELD_NAME
+
+
+@pytest.fixture
+def factory():
+    """Fixture provides a mesh factory for a 4x3 face rectilinear grid."""
+    lons = np.linspace(-180, 180, num=5)
+    lats = np.linspace(-90, 90, num=4)
+    return Transform(lons, lats)
+
+
+@pytest.mark.parametrize("prefetch", [False, True])
+@pytest.mark.parametrize("shared", [False, True])
+def test_cells(factory, shared, prefetch):
+    """Test each step of face data is attached to the mesh."""
+    n_steps = 5
+    data = np.arange(n_steps * 12).reshape(n_steps, 3, 4)
+    meshes = []
+    for step, mesh in enumerate(factory.steps(data, shared=shared, prefetch=prefetch)):
+        assert mesh[GV_FIELD_NAME] == NAME_CELLS
+        assert_array_equal(mesh[NAME_CELLS], data[step].ravel())
+        meshes.append(mesh)
+    assert len(meshes) == n_steps
+    expected = 1 if shared else n_steps
+    assert len({id(mesh) for mesh in meshes}) == expected
+
+
+@pytest.mark.parametrize("shared", [False, True])
+def test_points_masked(factory, shared):
+    """Test each step of masked node data is attached to the mesh."""
+    n_steps = 3
+    data = np.ma.arange(n_steps * 20, dtype=float).reshape(n_steps, 20)
+    data[1, 0] = np.ma.masked
+    name = "dummy"
+    for step, mesh in enumerate(factory.steps(data, name=name, shared=shared)):
+        assert mesh[GV_FIELD_NAME] == name
+        assert NAME_POINTS not in mesh.point_data
+        assert_array_equal(mesh[name], data[step].filled(np.nan))
+
+
+def test_no_steps(factory):
+    """Test no meshes are yielded for an empty time-series."""
+    data = np.empty((0, 12))
+    assert list(factory.steps(data, prefetch=True)) == []
+
+
+def test_incompatible_fail(factory):
+    """Test trap of a step with data incompatible with the mesh."""
+    data = np.empty((2, 5))
+    emsg = "Require mesh data with either '20' points or '12' cells, got '5' values"
+    with pytest.raises(ValueError, match=emsg):
+        _ = next(factory.steps(data, prefetch=True))
@@ -0,0 +1,217 @@
+# Copyright (c) 2021, GeoVista Contributors.
+#
+# This file is part of GeoVista and is distributed under the 3-Clause BSD license.
+# See the LICENSE file in the package root directory for licensing details.
+
+"""Unit-tests for the :mod:`geovista.cache` on-disk mesh cache."""
+
+from __future__ import annotations
+
+import os
+
+import numpy as np
+from numpy.testing import assert_array_equal
+import pytest
+
+from geovista import cache
+from geovista.bridge import Transform
+from geovista.cache import (
+    CACHE,
+    mesh_cache,
+    mesh_cache_clear,
+    mesh_cache_key,
+    mesh_cache_load,
+    mesh_cache_save,
+)
+from geovista.common import GV_FIELD_NAME, GV_FIELD_RADIUS
+from geovista.crs import GV_FIELD_CRS
+
+
+@pytest.fixture(autouse=True)
+def mesh_cache_dir(monkeypatch, tmp_path):
+    """Fixture isolates the mesh cache within a temporary directory."""
+    monkeypatch.setattr(CACHE, "path", tmp_path)
+    return tmp_path / cache.MESH_CACHE_DIR
+
+
+@pytest.fixture
+def inputs():
+    """Fixture provides the geometry and connectivity of a 3x2 face quad-mesh."""
+    lons, lats = np.meshgrid(np.linspace(-180, 180, 4), np.linspace(-90, 90, 3))
+    connectivity = np.array(
+        [[0, 1, 5, 4], [1, 2, 6, 5], [2, 3, 7, 6]],
+        dtype=np.int32,
+    )
+    connectivity = np.vstack([connectivity, connectivity + 4]) + 1
+    return lons.ravel(), lats.ravel(), connectivity
+
+
+def test_mesh_cache():
+    """Test the control of the mesh cache status variable."""
+    original = cache.GEOVISTA_MESH_CACHE
+    try:
+        _ = mesh_cache()
+        assert cache.GEOVISTA_MESH_CACHE is True
+        assert mesh_cache(enable=False) is True
+        assert cache.GEOVISTA_MESH_CACHE is False
+    finally:
+        _ = mesh_cache(enable=original)
+
+
+def test_key(inputs):
+    """Test the mesh cache key is sensitive to the content of the inputs."""
+    lons, lats, connectivity = inputs
+    key = mesh_cache_key(lons, lats, connectivity, None)
+    assert key == mesh_cache_key(lons.copy(), lats.copy(), connectivity, None)
+    assert key != mesh_cache_key(lons, lats, connectivity, 1)
+    assert key != mesh_cache_key(lons, lats, connectivity.astype(np.int64), None)
+    masked = np.ma.masked_array(connectivity, mask=False)
+    masked[0, 3] = np.ma.masked
+    assert key != mesh_cache_key(lons, lats, masked, None)
+    modified = lats.copy()
+    modified[0] += 1e-9
+    assert key != mesh_cache_key(lons, modified, connectivity, None)
+
+
+@pytest.mark.parametrize("arg", [[0, 1], (0, 1), {"a": 1}])
+def test_key_fail(inputs, arg):
+    """Test trap of a mesh cache key input that is not an array or a scalar."""
+    lons, lats, _ = inputs
+    emsg = "Require a mesh cache key input that is an array, a scalar or None"
+    with pytest.raises(TypeError, match=emsg):
+        _ = mesh_cache_key(lons, lats, arg)
+
+
+def test_from_unstructured_array_like(mesh_cache_dir, inputs):
+    """Test array-like connectivity is keyed by content rather than repr."""
+    lons, lats, _ = inputs
+    lons, lats = np.tile(lons, 100), np.tile(lats, 100)
+    connectivity = np.arange(lons.size).reshape(-1, 4)
+    # numpy abbreviates the repr of large arrays, hence the same repr
+    other = connectivity[::-1].copy()
+    assert repr(connectivity.tolist()) != repr(other.tolist())
+    kwargs = {"cache": True}
+    expected = Transform.from_unstructured(
+        lons, lats, connectivity=other.tolist(), **kwargs
+    )
+    result = Transform.from_unstructured(
+        lons, lats, connectivity=connectivity.tolist(), **kwargs
+    )
+    assert len(list(mesh_cache_dir.iterdir())) == 2
+    assert not np.array_equal(result.faces, expected.faces)
+
+
+def test_from_unstructured_shape(mesh_cache_dir, inputs):
+    """Test a connectivity shape is keyed separately from an array."""
+    lons, lats, _ = inputs
+    kwargs = {"cache": True}
+    _ = Transform.from_unstructured(lons, lats, connectivity=(3, 4), **kwargs)
+    _ = Transform.from_unstructured(lons, lats, connectivity=(4, 3), **kwargs)
+    assert len(list(mesh_cache_dir.iterdir())) == 2
+
+
+def test_round_trip(mesh_cache_dir, inputs):
+    """Test the mesh geometry, topology and field data are restored."""
+    lons, lats, connectivity = inputs
+    mesh = Transform.from_unstructured(lons, lats, connectivity=connectivity)
+    key = mesh_cache_key(lons, lats, connectivity)
+    entry = mesh_cache_save(key, mesh)
+    assert entry == mesh_cache_dir / key
+    result = mesh_cache_load(key)
+    assert isinstance(result.points, np.ndarray)
+    assert_array_equal(result.points, mesh.points)
+    assert_array_equal(result.faces, mesh.faces)
+    assert result.n_cells == mesh.n_cells
+    assert result.field_data[GV_FIELD_CRS] == mesh.field_data[GV_FIELD_CRS]
+    assert_array_equal(result[GV_FIELD_RADIUS], mesh[GV_FIELD_RADIUS])
+    # the cached geometry is copy-on-write
+    result.points[0] = 0
+    assert_array_equal(mesh_cache_load(key).points, mesh.points)
+
+
+def test_load_miss():
+    """Test no mesh is loaded for an unknown key."""
+    assert mesh_cache_load("unknown") is None
+
+
+@pytest.mark.parametrize("fname", ["field.npz", "points.npy"])
+def test_load_truncated(inputs, fname):
+    """Test no mesh is loaded for a truncated cache entry."""
+    lons, lats, connectivity = inputs
+    mesh = Transform.from_unstructured(lons, lats, connectivity=connectivity)
+    key = mesh_cache_key(lons, lats, connectivity)
+    entry = mesh_cache_save(key, mesh)
+    content = (entry / fname).read_bytes()
+    (entry / fname).write_bytes(content[: len(content) // 2])
+    assert mesh_cache_load(key) is None
+
+
+@pytest.mark.parametrize("cached", [False, True])
+def test_from_unstructured(mocker, mesh_cache_dir, inputs, cached):
+    """Test the bridge reuses the cached mesh and attaches the data."""
+    lons, lats, connectivity = inputs
+    kwargs = {"connectivity": connectivity, "cache": True, "radius": 2, "zlevel": 1}
+    if cached:
+        _ = Transform.from_unstructured(lons, lats, **kwargs)
+    spy = mocker.spy(Transform, "_create_mesh")
+    data = np.arange(6)
+    result = Transform.from_unstructured(lons, lats, data=data, **kwargs)
+    assert spy.call_count == int(not cached)
+    assert len(list(mesh_cache_dir.iterdir())) == 1
+    expected = Transform.from_unstructured(
+        lons,
+        lats,
+        data=data,
+        connectivity=connectivity,
+        radius=2,
+        zlevel=1,
+        cache=False,
+    )
+    assert_array_equal(result.points, expected.points)
+    assert_array_equal(result.faces, expected.faces)
+    assert_array_equal(result["cell_data"], data)
+    assert result[GV_FIELD_NAME] == "cell_data"
+
+
+def test_from_unstructured_disabled(mesh_cache_dir, inputs):
+    """Test the bridge ignores the mesh cache by default."""
+    lons, lats, connectivity = inputs
+    original = mesh_cache(enable=False)
+    try:
+        _ = Transform.from_unstructured(lons, lats, connectivity=connectivity)
+    finally:
+        _ = mesh_cache(enable=original)
+    assert not mesh_cache_dir.exists()
+
+
+def test_clear(mesh_cache_dir, inputs):
+    """Test invalidation of a single entry and of all entries."""
+    lons, lats, connectivity = inputs
+    mesh = Transform.from_unstructured(lons, lats, connectivity=connectivity)
+    keys = [mesh_cache_key(lons, lats, connectivity, i) for i in range(3)]
+    for key in keys:
+        _ = mesh_cache_save(key, mesh)
+    assert mesh_cache_clear(keys[0]) == 1
+    assert mesh_cache_clear(keys[0]) == 0
+    assert mesh_cache_load(keys[0]) is None
+    assert mesh_cache_clear() == 2
+    assert list(mesh_cache_dir.iterdir()) == []
+
+
+def test_evict_lru(monkeypatch, mesh_cache_dir, inputs):
+    """Test the least recently used entries are evicted beyond the size limit."""
+    lons, lats, connectivity = inputs
+    mesh = Transform.from_unstructured(lons, lats, connectivity=connectivity)
+    keys = [mesh_cache_key(lons, lats, connectivity, i) for i in range(3)]
+    entry = mesh_cache_save(keys[0], mesh)
+    nbytes = sum(fname.stat().st_size for fname in entry.iterdir())
+    monkeypatch.setattr(cache, "GEOVISTA_MESH_CACHE_SIZE", 2 * nbytes)
+    _ = mesh_cache_save(keys[1], mesh)
+    # ensure the first entry is the least recently used
+    os.utime(mesh_cache_dir / keys[0], (0, 0))
+    os.utime(mesh_cache_dir / keys[1], (1, 1))
+    assert mesh_cache_load(keys[0]) is not None
+    _ = mesh_cache_save(keys[2], mesh)
+    assert sorted(entry.name for entry in mesh_cache_dir.iterdir()) == sorted(
+        [keys[0], keys[2]]
+    )
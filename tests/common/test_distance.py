@@ -10,7 +10,8 @@ from __future__ import annotations
 import numpy as np
 import pytest
 
-from geovista.common import RADIUS, distance
+from geovista.bridge import Transform
+from geovista.common import GV_FIELD_RADIUS, GV_FIELD_RADIUS_MTIME, RADIUS, distance
 
 
 @pytest.mark.parametrize("origin", [np.empty((2, 2)), range(4)])
@@ -67,3 +68,44 @@ def test_point_distance__origin(lfric, origin):
     result = distance(mesh, origin=origin, mean=False)
     assert result.size == lfric.n_points
     assert np.isclose(np.sum(result), lfric.n_points * RADIUS)
+
+
+@pytest.fixture
+def mesh():
+    """Fixture provides a mesh with a radius recorded in its field data."""
+    return Transform.from_1d(np.linspace(-180, 180, 9), np.linspace(-90, 90, 7))
+
+
+def test_trusted_radius(mocker, mesh):
+    """Test the radius of the mesh is trusted from a sample of the points."""
+    spy = mocker.spy(np, "mean")
+    result = distance(mesh)
+    assert result == mesh[GV_FIELD_RADIUS][0]
+    assert spy.call_count == 0
+    assert GV_FIELD_RADIUS_MTIME not in mesh.field_data
+
+
+def test_trusted_radius_verified(mocker, mesh):
+    """Test the verified radius of the mesh is reused until the points change."""
+    points = mesh.points.copy()
+    # perturb the first and last points, which are always sampled
+    points[0] *= 1 + 1e-3
+    points[-1] *= 1 - 1e-3
+    mesh.points = points
+    spy = mocker.spy(np, "mean")
+    assert distance(mesh) == RADIUS
+    assert spy.call_count == 1
+    assert mesh[GV_FIELD_RADIUS_MTIME][0] == mesh.GetPoints().GetMTime()
+    assert distance(mesh) == RADIUS
+    assert spy.call_count == 1
+    mesh.points = points * 2
+    assert np.isclose(distance(mesh), 2 * RADIUS)
+    assert spy.call_count == 2
+
+
+def test_untrusted_radius(mesh):
+    """Test the radius of the mesh is not trusted if the points are resized."""
+    mesh.points = mesh.points * 2
+    assert np.isclose(distance(mesh), 2 * RADIUS)
+    assert mesh[GV_FIELD_RADIUS][0] == RADIUS
+    assert GV_FIELD_RADIUS_MTIME not in mesh.field_data
@@ -97,6 +97,46 @@ def test_polar_quad_mesh_unfold(sign, n_lons, closed_interval):
     assert np.isclose(np.sum(lonlats[:, 2]), 0)
 
 
+@pytest.mark.parametrize(
+    ("faces", "expected"),
+    [
+        ([0, 1, 2, 3], [30, 20, 20, 30]),
+        ([3, 0, 1, 2], [30, 20, 20, 30]),
+        ([2, 3, 0, 1], [30, 20, 20, 30]),
+        ([1, 2, 3, 0], [30, 20, 20, 30]),
+    ],
+)
+def test_polar_quad_cell_unfold_offsets(faces, expected):
+    """Test unfolding of the polar points for each offset within a quad cell."""
+    lons = np.array([0, 0, 20, 30])
+    lats = np.array([90, 90, 80, 80])
+    mesh = pv.PolyData(to_cartesian(lons, lats), faces=[4, *faces])
+    lonlats = from_cartesian(mesh)
+    np.testing.assert_allclose(lonlats[:, 0], expected)
+
+
+def test_polar_quad_cell_unfold_fail():
+    """Test trap of a quad cell with diagonally opposite polar points."""
+    lons = np.array([0, 20, 0, 30])
+    lats = np.array([90, 80, 90, 80])
+    mesh = pv.PolyData(to_cartesian(lons, lats), faces=[4, 0, 1, 2, 3])
+    emsg = "Failed to unfold a mesh polar quad-cell"
+    with pytest.raises(ValueError, match=emsg):
+        _ = from_cartesian(mesh)
+
+
+def test_polar_mixed_cells_unfold():
+    """Test only polar quad cells with two polar points are unfolded."""
+    lons = np.array([0, 0, 20, 30, 0, 40, 50, 0, 60])
+    lats = np.array([90, 90, 80, 80, -90, -80, -80, -90, -80])
+    # quad-cell, triangle-cell and a quad-cell with one polar point
+    faces = [4, 0, 1, 2, 3, 3, 4, 5, 6, 4, 7, 5, 6, 8]
+    mesh = pv.PolyData(to_cartesian(lons, lats), faces=faces, lines=[2, 0, 3])
+    lonlats = from_cartesian(mesh)
+    expected = [30, 20, 20, 30, 0, 40, 50, 0, 60]
+    np.testing.assert_allclose(lonlats[:, 0], expected)
+
+
 @pytest.mark.parametrize("closed_interval", [False, True])
 @pytest.mark.parametrize(
     ("lonlat", "pids"),
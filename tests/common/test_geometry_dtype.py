@@ -0,0 +1,39 @@
+# Copyright (c) 2021, GeoVista Contributors.
+#
+# This file is part of GeoVista and is distributed under the 3-Clause BSD license.
+# See the LICENSE file in the package root directory for licensing details.
+
+"""Unit-tests for :func:`geovista.common.geometry_dtype`."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from geovista import common
+from geovista.common import geometry_dtype
+
+
+def test_default():
+    """Test the default mesh geometry precision."""
+    assert geometry_dtype() == np.float64
+
+
+def test_package_default(monkeypatch):
+    """Test the package level mesh geometry precision."""
+    monkeypatch.setattr(common, "GEOMETRY_DTYPE", "float32")
+    assert geometry_dtype() == np.float32
+
+
+@pytest.mark.parametrize("dtype", ["float32", np.float32, "f4", np.dtype("float64")])
+def test_dtype(dtype):
+    """Test the requested mesh geometry precision."""
+    assert geometry_dtype(dtype) == np.dtype(dtype)
+
+
+@pytest.mark.parametrize("dtype", ["float16", int, "longdouble"])
+def test_dtype_fail(dtype):
+    """Test trap of an unsupported mesh geometry precision."""
+    emsg = "Require a mesh geometry dtype of either 'float32' or 'float64'"
+    with pytest.raises(ValueError, match=emsg):
+        _ = geometry_dtype(dtype)
@@ -0,0 +1,69 @@
+# Copyright (c) 2021, GeoVista Contributors.
+#
+# This file is part of GeoVista and is distributed under the 3-Clause BSD license.
+# See the LICENSE file in the package root directory for licensing details.
+
+"""Unit-tests for :func:`geovista.common.lonlat_cache`."""
+
+from __future__ import annotations
+
+import numpy as np
+from numpy.testing import assert_allclose
+import pytest
+
+from geovista import common
+from geovista.bridge import Transform
+from geovista.common import GV_LONLATS, _get_lonlats, from_cartesian, lonlat_cache
+
+
+@pytest.fixture
+def cache(enable_cache):
+    """Fixture enables the bridge to attach geographic coordinates."""
+    enable_cache(common, "GEOVISTA_LONLAT_CACHE")
+
+
+def test_enable(toggle):
+    """Test the lonlat cache status is updated."""
+    toggle(common, "GEOVISTA_LONLAT_CACHE", lonlat_cache)
+
+
+def test_disabled(monkeypatch):
+    """Test the bridge does not attach geographic coordinates by default."""
+    monkeypatch.setattr(common, "GEOVISTA_LONLAT_CACHE", False)
+    mesh = Transform.from_1d([-180, 0, 180], [-90, 0, 90])
+    assert GV_LONLATS not in mesh.point_data
+
+
+@pytest.mark.usefixtures("cache")
+@pytest.mark.parametrize("closed_interval", [False, True])
+def test_bridge(mocker, closed_interval):
+    """Test the bridge coordinates are reused without conversion."""
+    lons = np.linspace(-170, 190, num=37)
+    lats = np.linspace(-90, 90, num=19)
+    mesh = Transform.from_1d(lons, lats, data=np.arange(36 * 18))
+    assert mesh.active_scalars_name != GV_LONLATS
+    expected = from_cartesian(mesh.copy(deep=True), closed_interval=closed_interval)
+    spy = mocker.spy(common, "to_lonlats")
+    result = from_cartesian(mesh, closed_interval=closed_interval)
+    assert spy.call_count == 0
+    assert_allclose(result, expected, atol=1e-10)
+
+
+@pytest.mark.usefixtures("cache")
+def test_bridge_points():
+    """Test the bridge coordinates of a point-cloud are reused."""
+    lons = np.linspace(-180, 170, num=36)
+    lats = np.linspace(-85, 85, num=36)
+    mesh = Transform.from_points(lons, lats, zlevel=np.arange(36))
+    assert _get_lonlats(mesh) is not None
+    expected = from_cartesian(mesh.copy(deep=True))
+    assert_allclose(from_cartesian(mesh), expected, atol=1e-8)
+
+
+@pytest.mark.usefixtures("cache")
+def test_transform_call():
+    """Test the coordinates are shared with the meshes of a transform."""
+    factory = Transform([-180, 0, 180], [-90, 0, 90])
+    mesh = factory(np.arange(4))
+    assert _get_lonlats(mesh) is not None
+    assert mesh.active_scalars_name != GV_LONLATS
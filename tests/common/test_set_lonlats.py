@@ -0,0 +1,99 @@
+# Copyright (c) 2021, GeoVista Contributors.
+#
+# This file is part of GeoVista and is distributed under the 3-Clause BSD license.
+# See the LICENSE file in the package root directory for licensing details.
+
+"""Unit-tests for :func:`geovista.common.set_lonlats`."""
+
+from __future__ import annotations
+
+import numpy as np
+from numpy.testing import assert_allclose, assert_array_equal
+import pytest
+import pyvista as pv
+
+from geovista.bridge import Transform
+from geovista.common import (
+    GV_FIELD_LONLATS,
+    GV_LONLATS,
+    _get_lonlats,
+    from_cartesian,
+    set_lonlats,
+    to_cartesian,
+)
+
+
+@pytest.fixture
+def mesh():
+    """Fixture provides a global mesh and the geographic coordinates of its points."""
+    lons = np.linspace(-180, 180, num=13)
+    lats = np.linspace(-90, 90, num=7)
+    mesh = Transform.from_1d(lons, lats)
+    mlons, mlats = np.meshgrid(lons, lats)
+    return mesh, mlons, mlats
+
+
+def test_attach(mesh):
+    """Test the geographic coordinates are attached and reused."""
+    mesh, lons, lats = mesh
+    expected = from_cartesian(mesh)
+    set_lonlats(mesh, lons, lats)
+    assert mesh.point_data[GV_LONLATS].shape == (mesh.n_points, 3)
+    assert GV_FIELD_LONLATS in mesh.field_data
+    assert mesh.active_scalars_name is None
+    assert _get_lonlats(mesh) is not None
+    assert_allclose(from_cartesian(mesh), expected, atol=1e-10)
+
+
+def test_poles(mesh):
+    """Test the polar longitudes are unfolded as per from_cartesian."""
+    mesh, lons, lats = mesh
+    set_lonlats(mesh, lons, lats)
+    result = mesh.point_data[GV_LONLATS]
+    # the unfolded polar longitudes of each polar quad-cell
+    assert_allclose(result[:13, 0], result[13:26, 0])
+    assert_allclose(result[-13:, 0], result[-26:-13, 0])
+
+
+def test_zlevel():
+    """Test the zlevel of a point-cloud is reused."""
+    lons = np.linspace(-180, 170, num=36)
+    lats = np.zeros_like(lons)
+    zlevel = np.arange(lons.size)
+    mesh = Transform.from_points(lons, lats, zlevel=zlevel)
+    set_lonlats(mesh, lons, lats, zlevel=zlevel)
+    assert_array_equal(from_cartesian(mesh)[:, 2], zlevel)
+
+
+def test_invalidate(mesh):
+    """Test modification of the mesh points invalidates the coordinates."""
+    mesh, lons, lats = mesh
+    set_lonlats(mesh, lons, lats)
+    mesh.points = mesh.points * 2
+    assert _get_lonlats(mesh) is None
+
+
+def test_invalidate_copy(mesh):
+    """Test the coordinates of a deep copy of the mesh are invalid."""
+    mesh, lons, lats = mesh
+    set_lonlats(mesh, lons, lats)
+    assert _get_lonlats(mesh.copy(deep=False)) is not None
+    assert _get_lonlats(mesh.copy(deep=True)) is None
+
+
+def test_points_mismatch(mesh):
+    """Test stale coordinates are not reused after the mesh points change."""
+    mesh, lons, lats = mesh
+    set_lonlats(mesh, lons, lats)
+    xyz = to_cartesian(lons + 10, lats)
+    mesh.points = xyz
+    expected = from_cartesian(pv.PolyData(xyz))
+    assert_allclose(from_cartesian(mesh)[:, 1], expected[:, 1])
+
+
+def test_size_fail(mesh):
+    """Test trap of geographic coordinates incompatible with the mesh points."""
+    mesh, lons, lats = mesh
+    emsg = "Require geographic coordinates for '91' mesh points, got '90' longitudes"
+    with pytest.raises(ValueError, match=emsg):
+        set_lonlats(mesh, lons.ravel()[1:], lats.ravel()[1:])
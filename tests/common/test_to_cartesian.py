@@ -108,3 +108,33 @@ def test_zscale(lam_uk_sample, zlevel, zscale):
     actual = _distance(result)
     expected = RADIUS + RADIUS * zlevel * zscale
     assert np.isclose(actual, expected)
+
+
+@pytest.mark.parametrize("dtype", ["float32", "float64"])
+@pytest.mark.parametrize("stacked", [True, False])
+def test_dtype(lam_uk_sample, dtype, stacked):
+    """Test the precision of the cartesian points."""
+    lons, lats = lam_uk_sample
+    result = to_cartesian(lons, lats, stacked=stacked, dtype=dtype)
+    assert result.dtype == dtype
+    expected = to_cartesian(lons, lats, stacked=stacked)
+    assert expected.dtype == np.float64
+    np.testing.assert_allclose(result, expected, rtol=1e-6)
+
+
+def test_dtype_single_lonlat():
+    """Test the conversion of single precision points is at double precision."""
+    rng = np.random.default_rng(0)
+    lons = rng.uniform(-180, 180, 100).astype(np.float32)
+    lats = rng.uniform(-90, 90, 100).astype(np.float32)
+    result = to_cartesian(lons, lats)
+    expected = to_cartesian(lons.astype(np.float64), lats.astype(np.float64))
+    np.testing.assert_array_equal(result, expected)
+
+
+def test_dtype_fail(lam_uk_sample):
+    """Test trap of an unsupported precision."""
+    lons, lats = lam_uk_sample
+    emsg = "Require a mesh geometry dtype of either 'float32' or 'float64'"
+    with pytest.raises(ValueError, match=emsg):
+        _ = to_cartesian(lons, lats, dtype=int)
@@ -65,3 +65,12 @@ def test_radius(manydegrees):
     radii = np.ones(xyz.shape[0])
     lonlats = to_lonlats(xyz, radius=radii)
     np.testing.assert_array_almost_equal(lonlats, manydegrees.expected)
+
+
+@pytest.mark.parametrize("radius", [1.0, 1.3, 6371.0])
+def test_latitude_pole_single_precision(radius):
+    """Test single precision polar points are exactly at the poles."""
+    poles = np.array([[0.0, 0.0, radius], [0.0, 0.0, -radius]], dtype=np.float32)
+    # the radius of the mesh at double precision, as with geovista.common.distance
+    lonlat = to_lonlats(poles, radius=radius * (1 + 1e-8), stacked=False)
+    np.testing.assert_array_equal(lonlat[1], [90.0, -90.0])
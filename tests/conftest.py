@@ -8,6 +8,7 @@
 from __future__ import annotations
 
 from contextlib import suppress
+from typing import TYPE_CHECKING
 
 import numpy as np
 import pytest
@@ -23,6 +24,10 @@ from geovista.pantry.meshes import lam_uk as sample_lam_uk
 from geovista.pantry.meshes import lfric as sample_lfric
 from geovista.pantry.meshes import lfric_sst as sample_lfric_sst
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from types import ModuleType
+
 
 @pytest.fixture
 def plot_nodeid(request):
@@ -61,6 +66,23 @@ def coastlines(request):
     return geometry_coastlines(resolution=resolution)
 
 
+@pytest.fixture
+def enable_cache(monkeypatch):
+    """Fixture enables an empty cache, which is emptied again on teardown."""
+    clears = []
+
+    def enable(module: ModuleType, name: str, clear: Callable | None = None) -> None:
+        monkeypatch.setattr(module, name, True)
+        if clear is not None:
+            _ = clear()
+            clears.append(clear)
+
+    yield enable
+
+    for clear in clears:
+        _ = clear()
+
+
 @pytest.fixture
 def lam_polar():
     """Fixture generates a Polar Local Area Model mesh with indexed faces and points."""
@@ -123,6 +145,20 @@ def sphere():
     return pv.Sphere()
 
 
+@pytest.fixture(params=[None, True, False])
+def toggle(monkeypatch, request):
+    """Fixture checks a function toggling the status variable of a module."""
+    enable = request.param
+
+    def check(module: ModuleType, name: str, func: Callable) -> None:
+        monkeypatch.setattr(module, name, False)
+        assert func(enable) is False
+        expected = True if enable is None else enable
+        assert getattr(module, name) is expected
+
+    return check
+
+
 @pytest.fixture
 def wgs84_wkt():
     """Fixture for generating WG284 CRS WKT as a string."""
@@ -7,10 +7,20 @@
 
 from __future__ import annotations
 
+import numpy as np
+from numpy.testing import assert_array_equal
+import pytest
 import pyvista as pv
 
-from geovista.common import point_cloud
-from geovista.core import add_texture_coords
+from geovista import core
+from geovista.common import (
+    GV_FIELD_TEXTURE,
+    GV_REMESH_POINT_IDS,
+    from_cartesian,
+    point_cloud,
+)
+from geovista.core import add_texture_coords, slice_mesh
+from geovista.pantry.meshes import regular_grid
 
 
 def test_point_cloud_pass_thru(lam_uk):
@@ -20,3 +30,55 @@ def test_point_cloud_pass_thru(lam_uk):
     result = add_texture_coords(cloud)
     assert result is cloud
     assert result == cloud
+
+
+@pytest.fixture
+def mesh():
+    """Fixture provides a global mesh with cell data."""
+    mesh = regular_grid(resolution="r50")
+    mesh["data"] = np.arange(mesh.n_cells, dtype=float)
+    return mesh
+
+
+def test_texture_coords(mesh):
+    """Test the texture coordinates are the normalised lon/lat of the points."""
+    result = add_texture_coords(mesh, antimeridian=True)
+    assert result is not mesh
+    assert GV_REMESH_POINT_IDS in result.point_data
+    lonlat = from_cartesian(result, closed_interval=True)
+    expected = np.column_stack([(lonlat[:, 0] + 180) / 360, (lonlat[:, 1] + 90) / 180])
+    assert_array_equal(result.active_texture_coordinates, expected)
+
+
+def test_shallow(mesh):
+    """Test a sliced mesh is shallow copied with only the texture coordinates."""
+    sliced = slice_mesh(mesh)
+    result = add_texture_coords(sliced)
+    assert result is not sliced
+    assert sliced.active_texture_coordinates is None
+    assert GV_FIELD_TEXTURE not in sliced.field_data
+    assert np.shares_memory(result["data"], sliced["data"])
+    assert np.shares_memory(result.points, sliced.points)
+
+
+def test_inplace(mesh):
+    """Test the texture coordinates are attached in-place to a sliced mesh."""
+    sliced = slice_mesh(mesh)
+    result = add_texture_coords(sliced, inplace=True)
+    assert result is sliced
+    assert sliced.active_texture_coordinates is not None
+
+
+def test_reuse(mocker, mesh):
+    """Test the texture coordinates are reused for the same meridian."""
+    result = add_texture_coords(mesh)
+    expected = result.active_texture_coordinates
+    spy = mocker.spy(core, "from_cartesian")
+    again = add_texture_coords(result, inplace=True)
+    assert spy.call_count == 0
+    assert np.shares_memory(again.active_texture_coordinates, expected)
+    _ = add_texture_coords(result, meridian=90, inplace=True)
+    assert spy.call_count == 1
+    result.points = result.points * 2
+    _ = add_texture_coords(result, meridian=90, inplace=True)
+    assert spy.call_count == 2
@@ -0,0 +1,132 @@
+# Copyright (c) 2021, GeoVista Contributors.
+#
+# This file is part of GeoVista and is distributed under the 3-Clause BSD license.
+# See the LICENSE file in the package root directory for licensing details.
+
+"""Unit-tests for :func:`geovista.core.combine`."""
+
+from __future__ import annotations
+
+import numpy as np
+from numpy.testing import assert_array_equal
+import pytest
+import pyvista as pv
+
+from geovista.core import combine
+
+
+@pytest.fixture
+def quads():
+    """Fixture provides a mesh of two quad faces with point and cell data."""
+    points = np.array(
+        [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [2, 0, 0], [2, 1, 0]],
+        dtype=float,
+    )
+    mesh = pv.PolyData(points, faces=[4, 0, 1, 2, 3, 4, 1, 4, 5, 2])
+    mesh["pdata"] = np.arange(mesh.n_points)
+    mesh["cdata"] = np.arange(mesh.n_cells) + 10
+    return mesh
+
+
+@pytest.fixture
+def polyline():
+    """Fixture provides a mesh of two lines with point and cell data."""
+    points = np.array([[0, 0, 1], [1, 0, 1], [1, 1, 1], [0, 1, 1]], dtype=float)
+    mesh = pv.PolyData(points, lines=[3, 0, 1, 2, 2, 2, 3])
+    mesh["pdata"] = np.arange(mesh.n_points) + 100
+    mesh["cdata"] = np.arange(mesh.n_cells) + 110
+    return mesh
+
+
+@pytest.fixture
+def cloud():
+    """Fixture provides a point-cloud mesh with point and cell data."""
+    mesh = pv.PolyData(np.array([[0, 0, 2], [1, 1, 2], [2, 2, 2]], dtype=float))
+    mesh.point_data["pdata"] = np.arange(mesh.n_points) + 200
+    mesh.cell_data["cdata"] = np.arange(mesh.n_cells) + 210
+    return mesh
+
+
+def test_no_meshes_fail():
+    """Test trap of no meshes to combine."""
+    emsg = "Expected one or more meshes to combine"
+    with pytest.raises(ValueError, match=emsg):
+        _ = combine()
+
+
+def test_type_fail(quads):
+    """Test trap of a mesh that is not a polydata."""
+    emsg = "input mesh #2 has type 'UnstructuredGrid'"
+    with pytest.raises(TypeError, match=emsg):
+        _ = combine(quads, quads.cast_to_unstructured_grid())
+
+
+def test_single(quads):
+    """Test a single mesh is passed through."""
+    assert combine(quads) is quads
+
+
+def test_faces(quads):
+    """Test the faces of the meshes are offset by the points of previous meshes."""
+    result = combine(quads, quads, quads)
+    assert result.n_points == 3 * quads.n_points
+    assert_array_equal(result.points, np.vstack([quads.points] * 3))
+    offset = np.array([0, 1, 1, 1, 1, 0, 1, 1, 1, 1])
+    expected = np.hstack([quads.faces + offset * 6 * i for i in range(3)])
+    assert_array_equal(result.faces, expected)
+    assert_array_equal(result["pdata"], np.tile(quads["pdata"], 3))
+    assert_array_equal(result["cdata"], np.tile(quads["cdata"], 3))
+
+
+def test_lines(polyline):
+    """Test combining line meshes."""
+    result = combine(polyline, polyline)
+    assert result.n_lines == 4
+    assert_array_equal(result.lines, [3, 0, 1, 2, 2, 2, 3, 3, 4, 5, 6, 2, 6, 7])
+    assert_array_equal(result["cdata"], [110, 111, 110, 111])
+
+
+def test_points(cloud):
+    """Test combining point-cloud meshes."""
+    result = combine(cloud, cloud)
+    assert result.n_points == result.n_verts == 6
+    assert_array_equal(result.verts, [1, 0, 1, 1, 1, 2, 1, 3, 1, 4, 1, 5])
+    assert_array_equal(result["pdata"], [200, 201, 202, 200, 201, 202])
+
+
+def test_points_no_cells():
+    """Test combining meshes of points without any cells."""
+    mesh = pv.PolyData()
+    mesh.points = np.zeros((3, 3))
+    result = combine(mesh, mesh)
+    assert result.n_points == 6
+    assert result.n_cells == 0
+
+
+def test_mixed(quads, polyline, cloud):
+    """Test the cell data of mixed meshes follows the cell type order."""
+    result = combine(quads, polyline, cloud)
+    assert result.n_points == 13
+    assert (result.n_verts, result.n_lines, result.n_cells) == (3, 2, 7)
+    assert_array_equal(result.verts, [1, 10, 1, 11, 1, 12])
+    assert_array_equal(result.lines, [3, 6, 7, 8, 2, 8, 9])
+    assert_array_equal(result.faces, quads.faces)
+    assert_array_equal(result["pdata"], [*range(6), *range(100, 104), *range(200, 203)])
+    assert_array_equal(result["cdata"], [210, 211, 212, 110, 111, 10, 11])
+
+
+def test_data_common(quads, polyline):
+    """Test only the data common to all meshes is combined."""
+    quads["extra"] = np.ones(quads.n_points)
+    result = combine(quads, polyline)
+    assert "extra" not in result.point_data
+    result = combine(quads, polyline, data=False)
+    assert not result.point_data
+    assert not result.cell_data
+
+
+def test_active_scalars(quads):
+    """Test the common active scalars are preserved."""
+    quads.set_active_scalars("cdata", preference="cell")
+    result = combine(quads, quads)
+    assert result.active_scalars_name == "cdata"
@@ -10,7 +10,7 @@ from __future__ import annotations
 import operator
 
 import numpy as np
-from numpy.testing import assert_array_equal
+from numpy.testing import assert_allclose, assert_array_equal
 import pytest
 import pyvista as pv
 
@@ -21,6 +21,8 @@ from geovista.common import (
     RADIUS,
     ZLEVEL_SCALE,
     distance,
+    from_cartesian,
+    to_cartesian,
 )
 from geovista.core import resize
 
@@ -124,3 +126,46 @@ def test_resize_cloud__radius(lam_uk_cloud, radius):
     assert np.isclose(distance(result), radius)
     assert np.isclose(result[GV_FIELD_RADIUS], radius)
     assert np.isclose(result[GV_FIELD_ZSCALE], ZLEVEL_SCALE)
+
+
+@pytest.mark.parametrize("radius", [None, 2.0])
+def test_dtype(radius):
+    """Test the single precision of the mesh points is preserved."""
+    mesh = Transform.from_1d([-180, 0, 180], [-90, 0, 90], dtype="float32")
+    result = resize(mesh, radius=radius)
+    assert result.points.dtype == np.float32
+    expected = RADIUS if radius is None else radius
+    assert np.isclose(distance(result), expected)
+
+
+@pytest.mark.parametrize("dtype", ["float32", "float64"])
+@pytest.mark.parametrize("radius", [None, 2.0])
+def test_dtype_cast(dtype, radius):
+    """Test the precision of the mesh points is changed."""
+    mesh = Transform.from_1d([-180, 0, 180], [-90, 0, 90])
+    result = resize(mesh, radius=radius, dtype=dtype)
+    assert result.points.dtype == dtype
+    assert mesh.points.dtype == np.float64
+
+
+@pytest.mark.parametrize("zlevel", [0, 5])
+@pytest.mark.parametrize("radius", [0.5, 2.0])
+def test_radial_scale(radius, zlevel):
+    """Test the radial scaling of the mesh points matches their lon/lat."""
+    mesh = Transform.from_1d(np.linspace(-180, 180, 9), np.linspace(-90, 90, 7))
+    lonlat = from_cartesian(mesh)
+    result = resize(mesh, radius=radius, zlevel=zlevel)
+    expected = to_cartesian(
+        lonlat[:, 0], lonlat[:, 1], radius=radius, zlevel=zlevel, zscale=ZLEVEL_SCALE
+    )
+    assert_allclose(result.points, expected, atol=1e-12)
+    expected = radius + radius * zlevel * ZLEVEL_SCALE
+    assert np.isclose(result[GV_FIELD_RADIUS], expected)
+
+
+def test_radial_scale_irregular():
+    """Test the points of a non-spherical mesh are projected onto the sphere."""
+    mesh = Transform.from_1d(np.linspace(-180, 180, 9), np.linspace(-90, 90, 7))
+    mesh.points = mesh.points * np.linspace(0.9, 1.1, mesh.n_points)[:, np.newaxis]
+    result = resize(mesh, radius=2.0)
+    assert_allclose(distance(result, mean=False), 2.0)
@@ -0,0 +1,153 @@
+# Copyright (c) 2021, GeoVista Contributors.
+#
+# This file is part of GeoVista and is distributed under the 3-Clause BSD license.
+# See the LICENSE file in the package root directory for licensing details.
+
+"""Unit-tests for :func:`geovista.core.slice_cache`."""
+
+from __future__ import annotations
+
+import numpy as np
+from numpy.testing import assert_allclose, assert_array_equal
+import pytest
+
+from geovista import core
+from geovista.common import (
+    GV_CELL_IDS,
+    GV_POINT_IDS,
+    GV_REMESH_POINT_IDS,
+    TemplateCacheInfo,
+    _interpolation,
+)
+from geovista.core import (
+    MeridianSlice,
+    slice_cache,
+    slice_cache_clear,
+    slice_cache_info,
+    slice_cells,
+    slice_mesh,
+)
+from geovista.pantry.meshes import regular_grid
+
+
+@pytest.fixture
+def cache(enable_cache):
+    """Fixture enables an empty slice cache."""
+    enable_cache(core, "GEOVISTA_SLICE_CACHE", slice_cache_clear)
+
+
+@pytest.fixture
+def mesh():
+    """Fixture provides a global mesh sliced along the anti-meridian."""
+    return regular_grid(resolution="r50")
+
+
+def test_enable(toggle):
+    """Test the slice cache status is updated."""
+    toggle(core, "GEOVISTA_SLICE_CACHE", slice_cache)
+
+
+@pytest.mark.usefixtures("cache")
+def test_hit(mocker, mesh):
+    """Test the cached slice is reused with the current mesh data."""
+    mesh["data"] = np.arange(mesh.n_cells, dtype=float)
+    expected = slice_mesh(mesh)
+    assert slice_cache_info() == TemplateCacheInfo(0, 1, core.SLICE_CACHE_SIZE, 1)
+    spy = mocker.spy(MeridianSlice, "__init__")
+    mesh["data"] = mesh["data"][::-1]
+    result = slice_mesh(mesh)
+    assert spy.call_count == 0
+    assert slice_cache_info() == TemplateCacheInfo(1, 1, core.SLICE_CACHE_SIZE, 1)
+    assert result is not expected
+    assert_array_equal(result.points, expected.points)
+    assert_array_equal(result.faces, expected.faces)
+    for name in (GV_CELL_IDS, GV_POINT_IDS, GV_REMESH_POINT_IDS):
+        assert_array_equal(result[name], expected[name])
+    assert_array_equal(result["data"], mesh["data"][result[GV_CELL_IDS]])
+    assert result.active_scalars_name == "data"
+
+
+@pytest.mark.usefixtures("cache")
+def test_miss_meridian(mesh):
+    """Test a different meridian is not served from the slice cache."""
+    _ = slice_mesh(mesh)
+    _ = slice_cells(mesh, meridian=36)
+    info = slice_cache_info()
+    assert info.hits == 0
+    assert info.misses == info.currsize == 2
+
+
+@pytest.mark.usefixtures("cache")
+@pytest.mark.parametrize("dtype", [float, int])
+def test_bisected(mocker, monkeypatch, mesh, dtype):
+    """Test the data of the points inserted along the seam is interpolated."""
+    mesh["data"] = (np.arange(mesh.n_points) * 7 / 3).astype(dtype)
+    monkeypatch.setattr(core, "GEOVISTA_SLICE_CACHE", False)
+    expected = slice_cells(mesh, meridian=90)
+    assert expected.n_points > mesh.n_points
+    monkeypatch.setattr(core, "GEOVISTA_SLICE_CACHE", True)
+    miss = slice_cells(mesh, meridian=90)
+    spy = mocker.spy(MeridianSlice, "__init__")
+    result = slice_cells(mesh, meridian=90)
+    assert spy.call_count == 0
+    assert slice_cache_info() == TemplateCacheInfo(1, 1, core.SLICE_CACHE_SIZE, 1)
+    assert_array_equal(result.points, expected.points)
+    assert_array_equal(result["data"], miss["data"])
+    assert_allclose(result["data"], expected["data"], rtol=1e-6)
+    assert result["data"].dtype == expected["data"].dtype
+
+
+@pytest.mark.usefixtures("cache")
+def test_hit_warnings(mesh):
+    """Test the warnings of a cached slice are issued by a cache hit."""
+    key, sliced = ("dummy",), slice_mesh(mesh)
+    interpolation = _interpolation(sliced, mesh)
+    size = core.SLICE_CACHE_SIZE
+    wmsgs = ["dummy warning"]
+    _ = core._SLICE_CACHE.put(key, mesh, sliced, interpolation, size, wmsgs=wmsgs)
+    with pytest.warns(UserWarning, match="dummy warning"):
+        _ = core._SLICE_CACHE.get(key, mesh)
+
+
+@pytest.mark.usefixtures("cache")
+def test_miss_points(mesh):
+    """Test modifying the mesh points invalidates the slice cache."""
+    expected = slice_mesh(mesh)
+    mesh.points = mesh.points * 2
+    result = slice_mesh(mesh)
+    assert slice_cache_info().hits == 0
+    assert_array_equal(result.points, expected.points * 2)
+
+
+def test_disabled(monkeypatch, mesh):
+    """Test the slice cache is bypassed when disabled."""
+    monkeypatch.setattr(core, "GEOVISTA_SLICE_CACHE", False)
+    _ = slice_cache_clear()
+    _ = slice_mesh(mesh)
+    _ = slice_mesh(mesh)
+    assert slice_cache_info() == TemplateCacheInfo(0, 0, core.SLICE_CACHE_SIZE, 0)
+
+
+@pytest.mark.usefixtures("cache")
+def test_size(monkeypatch, mesh):
+    """Test the least recently used slice is evicted from the slice cache."""
+    monkeypatch.setattr(core, "SLICE_CACHE_SIZE", 1)
+    _ = slice_mesh(mesh)
+    _ = slice_cells(mesh, meridian=36)
+    assert slice_cache_info().currsize == 1
+    _ = slice_mesh(mesh)
+    assert slice_cache_info().hits == 0
+
+
+@pytest.mark.usefixtures("cache")
+def test_clear(mesh):
+    """Test invalidation of the slice cache entries of a mesh."""
+    other = mesh.copy(deep=True)
+    other.points = other.points * 2
+    _ = slice_mesh(mesh)
+    _ = slice_cells(mesh, meridian=36)
+    _ = slice_mesh(other)
+    assert slice_cache_clear(mesh) == 2
+    assert slice_cache_info().currsize == 1
+    assert slice_cache_clear() == 1
+    assert slice_cache_info() == TemplateCacheInfo(0, 0, core.SLICE_CACHE_SIZE, 0)
@@ -7,11 +7,15 @@
 
 from __future__ import annotations
 
+import re
+
+import numpy as np
 import pytest
 import pyvista as pv
 
 from geovista.common import point_cloud
-from geovista.core import slice_cells
+from geovista.core import MeridianSlice, slice_cells
+from geovista.pantry.meshes import regular_grid
 
 try:
     from pyvista import ImageData
@@ -34,3 +38,71 @@ def test_point_cloud_pass_thru(lam_uk):
     result = slice_cells(cloud)
     assert result is cloud
     assert result == cloud
+
+
+def _assert_same(result: pv.PolyData, expected: pv.PolyData) -> None:
+    """Assert that the sliced meshes share the same geometry and data."""
+    np.testing.assert_array_equal(result.points, expected.points)
+    np.testing.assert_array_equal(result.faces, expected.faces)
+    assert result.array_names == expected.array_names
+    for name in expected.array_names:
+        np.testing.assert_array_equal(result[name], expected[name])
+
+
+@pytest.mark.parametrize("meridian", [-180, 0, 5, 10, 137.3])
+@pytest.mark.parametrize("triangulate", [False, True])
+def test_method_regular_grid(meridian, triangulate):
+    """Test analytic and spline slice methods are equivalent for a regular grid."""
+    mesh = regular_grid(resolution="r50")
+    if triangulate:
+        mesh = mesh.triangulate()
+    result = slice_cells(mesh.copy(), meridian=meridian, method="analytic")
+    expected = slice_cells(mesh.copy(), meridian=meridian, method="spline")
+    _assert_same(result, expected)
+
+
+@pytest.mark.parametrize("lfric", ["c48", "c96"], indirect=True)
+def test_method_lfric(lfric):
+    """Test analytic and spline slice methods are equivalent for a cube-sphere."""
+    result = slice_cells(lfric.copy(), antimeridian=True, method="analytic")
+    expected = slice_cells(lfric.copy(), antimeridian=True, method="spline")
+    _assert_same(result, expected)
+
+
+def test_method_cell_ids():
+    """Test the analytic slice method cell classification."""
+    mesh = regular_grid(resolution="r50")
+    analytic = MeridianSlice(mesh.copy(), 10, method="analytic")
+    spline = MeridianSlice(mesh.copy(), 10, method="SPLINE")
+    assert analytic.slices == {}
+    assert analytic.west_ids == spline.west_ids
+    assert analytic.east_ids == spline.east_ids
+    assert analytic.split_ids == spline.split_ids
+
+
+def test_method_fail():
+    """Test trap of an unknown slice method."""
+    mesh = regular_grid(resolution="r50")
+    emsg = "Expected a slice method of 'analytic' or 'spline', got 'dummy'"
+    with pytest.raises(ValueError, match=emsg):
+        _ = slice_cells(mesh, method="dummy")
+
+
+@pytest.mark.parametrize(
+    ("meridian", "resolution", "expected", "n_cells"),
+    [
+        (5, (37, 23), "[18, 55, 795, 832, 833]", 1633),
+        (10, (64, 32), "[31, 95]", 3958),
+        (137.3, (20, 10), "[9, 29]", 350),
+    ],
+)
+def test_remove_wide_cells(meridian, resolution, expected, n_cells):
+    """Test the neighbour cells that span the meridian are removed."""
+    theta_resolution, phi_resolution = resolution
+    mesh = pv.Sphere(
+        radius=1, theta_resolution=theta_resolution, phi_resolution=phi_resolution
+    )
+    wmsg = re.escape(f"Removing the following mesh cell-ids {expected}.")
+    with pytest.warns(UserWarning, match=wmsg):
+        result = slice_cells(mesh, meridian=meridian)
+    assert result.n_cells == n_cells
@@ -131,9 +131,15 @@ def antimeridian_count(mesh: pv.PolyData) -> int:
         ),
         (np.array([[179, 0], [180, 0]]), np.array([[0, 1]]), Kind(split=0, detach=0)),
         (np.array([[180, 0], [181, 0]]), np.array([[0, 1]]), Kind(split=0, detach=1)),
+        (
+            np.array([[181, 0], [180, 1], [181, 2]]),
+            np.array([[0, 1], [1, 2]]),
+            Kind(split=0, detach=2),
+        ),
     ],
 )
-def test_slice_lines(lonlat, pids, kind):
+@pytest.mark.parametrize("method", ["analytic", "spline"])
+def test_slice_lines(lonlat, pids, kind, method):
     """Test line mesh slicing."""
     nlines = pids.shape[0]
     lines = np.full((nlines, 3), 2, dtype=int)
@@ -157,7 +163,7 @@ def test_slice_lines(lonlat, pids, kind):
         new_n_points += new
 
     prior = antimeridian_count(mesh)
-    result = slice_lines(mesh)
+    result = slice_lines(mesh, method=method)
     post = antimeridian_count(result)
 
     if new_n_points == 0:
@@ -171,6 +177,40 @@ def test_slice_lines(lonlat, pids, kind):
         assert (post - prior) == new_n_points
 
 
+def _segments(mesh: pv.PolyData) -> np.ndarray:
+    """Get the sorted cartesian end-points of each line segment of the mesh."""
+    pids = mesh.lines.reshape(-1, 3)[:, 1:]
+    xyz = np.round(mesh.points[pids].reshape(-1, 6), decimals=7)
+    return xyz[np.lexsort(xyz.T[::-1])]
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_slice_lines_method(seed):
+    """Test analytic and spline slice methods are equivalent for a random track."""
+    rng = np.random.default_rng(seed)
+    n_points = 500
+    lons = np.cumsum(rng.uniform(-20, 20, size=n_points))
+    lats = np.clip(np.cumsum(rng.uniform(-5, 5, size=n_points)), -85, 85)
+    lines = np.full((n_points - 1, 3), 2, dtype=int)
+    lines[:, 1] = np.arange(n_points - 1)
+    lines[:, 2] = np.arange(1, n_points)
+    mesh = pv.PolyData(to_cartesian(lons, lats), lines=lines)
+    to_wkt(mesh, WGS84)
+    result = slice_lines(mesh, method="analytic")
+    expected = slice_lines(mesh, method="spline")
+    assert result.n_points == expected.n_points
+    assert result.n_cells == expected.n_cells
+    np.testing.assert_array_equal(_segments(result), _segments(expected))
+
+
+def test_slice_lines_method_fail():
+    """Test trap of an unknown slice method."""
+    mesh = line([170, -170], 0)
+    emsg = "Expected a slice method of 'analytic' or 'spline', got 'dummy'"
+    with pytest.raises(ValueError, match=emsg):
+        _ = slice_lines(mesh, method="dummy")
+
+
 @pytest.mark.parametrize("coastlines", ["110m", "50m", "10m"], indirect=True)
 def test_field_data(coastlines):
     """Test expected metadata populated within field-data."""
@@ -0,0 +1,55 @@
+# Copyright (c) 2021, GeoVista Contributors.
+#
+# This file is part of GeoVista and is distributed under the 3-Clause BSD license.
+# See the LICENSE file in the package root directory for licensing details.
+
+"""Unit-tests for :func:`geovista.crs.get_crs`."""
+
+from __future__ import annotations
+
+from pyproj import CRS
+import pytest
+
+from geovista.crs import WGS84, crs_cache_clear, crs_cache_info, get_crs
+
+
+@pytest.fixture(autouse=True)
+def _clear() -> None:
+    """Fixture ensures each test starts with empty CRS caches."""
+    crs_cache_clear()
+
+
+@pytest.mark.parametrize(
+    "crs",
+    [4326, "epsg:4326", "EPSG:4326", WGS84.to_wkt()],
+)
+def test_cached(crs):
+    """Test hashable user input is cached."""
+    result = get_crs(crs)
+    assert result == WGS84
+    assert crs_cache_info().crs.misses == 1
+    assert get_crs(crs) is result
+    info = crs_cache_info().crs
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+
+def test_dict():
+    """Test a dict of PROJ parameters is cached independent of key order."""
+    result = get_crs({"proj": "eqc", "lon_0": 90})
+    assert get_crs({"lon_0": 90, "proj": "eqc"}) is result
+    info = crs_cache_info().crs
+    assert (info.hits, info.misses) == (1, 1)
+
+
+def test_unhashable():
+    """Test unhashable user input is not cached."""
+    crs = WGS84.to_json_dict()
+    assert get_crs(crs) == WGS84
+    assert crs_cache_info().crs.currsize == 0
+
+
+def test_crs():
+    """Test a CRS instance is returned as is."""
+    crs = CRS.from_user_input("+proj=robin")
+    assert get_crs(crs) is crs
+    assert crs_cache_info().crs.misses == 0
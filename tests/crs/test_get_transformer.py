@@ -0,0 +1,68 @@
+# Copyright (c) 2021, GeoVista Contributors.
+#
+# This file is part of GeoVista and is distributed under the 3-Clause BSD license.
+# See the LICENSE file in the package root directory for licensing details.
+
+"""Unit-tests for :func:`geovista.crs.get_transformer`."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+from pyproj import CRS, Transformer
+import pytest
+
+from geovista.crs import WGS84, crs_cache_clear, crs_cache_info, get_transformer
+from geovista.transform import transform_points
+
+
+@pytest.fixture(autouse=True)
+def _clear() -> None:
+    """Fixture ensures each test starts with empty CRS caches."""
+    crs_cache_clear()
+
+
+def test_cached(mocker):
+    """Test the transformer is created once per CRS pair."""
+    spy = mocker.spy(Transformer, "from_crs")
+    result = get_transformer(WGS84, "+proj=robin")
+    assert isinstance(result, Transformer)
+    # an equivalent but distinct CRS instance hits the cache
+    assert get_transformer(WGS84, CRS.from_user_input("+proj=robin")) is result
+    assert get_transformer("+proj=robin", WGS84) is not result
+    assert spy.call_count == 2
+    info = crs_cache_info().transformer
+    assert (info.hits, info.misses, info.currsize) == (1, 2, 2)
+
+
+def test_always_xy():
+    """Test the transformer has traditional GIS axis order."""
+    x, y = get_transformer("epsg:4326", "epsg:3857").transform(90, 0)
+    assert x > 1e7
+    assert abs(y) < 1e-6
+
+
+def test_transform_points(mocker):
+    """Test transform points reuses the cached transformer."""
+    spy = mocker.spy(Transformer, "from_crs")
+    for _ in range(3):
+        _ = transform_points(src_crs=WGS84, tgt_crs="+proj=moll", xs=0, ys=0)
+    assert spy.call_count == 1
+    info = crs_cache_info()
+    assert (info.transformer.hits, info.transformer.misses) == (2, 1)
+    assert (info.crs.hits, info.crs.misses) == (2, 1)
+
+
+def test_threads():
+    """Test the cache is safe to use from concurrent threads."""
+    tgt_crs = ["+proj=robin", "+proj=moll", "+proj=eqc"]
+
+    def task(index: int) -> Transformer:
+        return get_transformer(WGS84, tgt_crs[index % 3])
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(task, range(96)))
+
+    assert len({id(result) for result in results}) == 3
+    info = crs_cache_info().transformer
+    assert (info.hits, info.misses, info.currsize) == (93, 3, 3)
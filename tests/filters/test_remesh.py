@@ -0,0 +1,117 @@
+# Copyright (c) 2021, GeoVista Contributors.
+#
+# This file is part of GeoVista and is distributed under the 3-Clause BSD license.
+# See the LICENSE file in the package root directory for licensing details.
+
+"""Unit-tests for :func:`geovista.filters.remesh`."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+from numpy.testing import assert_allclose, assert_array_equal
+import pytest
+
+from geovista.bridge import Transform
+from geovista.common import (
+    GV_CELL_IDS,
+    GV_REMESH_POINT_IDS,
+    REMESH_JOIN,
+    REMESH_SEAM,
+)
+from geovista.filters import REMESH_SEAM_EAST, VTK_BOUNDARY_MASK, remesh
+from geovista.pantry.meshes import regular_grid
+
+if TYPE_CHECKING:
+    import pyvista as pv
+
+
+@pytest.fixture
+def mesh():
+    """Fixture provides a 2x2 face rectilinear grid with point and cell data."""
+    mesh = Transform.from_1d([-10, 5, 20], [0, 10, 20], data=np.arange(4))
+    mesh.point_data["pdata"] = np.arange(mesh.n_points) * 10.0
+    return mesh
+
+
+def _areas(mesh: pv.PolyData, n_cells: int) -> np.ndarray:
+    """Calculate the total area of the remeshed cells of each original cell."""
+    sizes = mesh.compute_cell_sizes(length=False, volume=False)
+    return np.bincount(mesh[GV_CELL_IDS], weights=sizes["Area"], minlength=n_cells)
+
+
+def _seam(mesh: pv.PolyData) -> np.ndarray:
+    """Get the sorted unique seam points of the remeshed surface."""
+    points = mesh.points[mesh[GV_REMESH_POINT_IDS] != REMESH_JOIN]
+    return np.unique(np.round(points, decimals=9), axis=0)
+
+
+def test_method_parity(mesh):
+    """Test the numpy remesh method is equivalent to the vtk remesh method."""
+    expected = remesh(mesh, 0, boundary=True, method="vtk")
+    result = remesh(mesh, 0, boundary=True, method="numpy")
+    for actual, other in zip(result, expected, strict=True):
+        assert actual.n_points == other.n_points
+        assert actual.n_cells == other.n_cells
+        assert sorted(actual.array_names) == sorted(other.array_names)
+        assert_array_equal(actual[GV_CELL_IDS], other[GV_CELL_IDS])
+        assert_allclose(_areas(actual, 4), _areas(other, 4))
+    assert_array_equal(result[0][VTK_BOUNDARY_MASK], expected[0][VTK_BOUNDARY_MASK])
+    assert_allclose(np.sort(result[0]["pdata"]), np.sort(expected[0]["pdata"]))
+    for actual, other in zip(result[1:], expected[1:], strict=True):
+        assert_allclose(_seam(actual), _seam(other))
+
+
+@pytest.mark.parametrize("meridian", [5, 137.3, -100.1])
+@pytest.mark.parametrize("triangulate", [False, True])
+def test_method_parity_regular_grid(meridian, triangulate):
+    """Test the numpy and vtk remesh methods on a regular grid."""
+    mesh = regular_grid(resolution="r50")
+    if triangulate:
+        mesh = mesh.triangulate()
+    expected = remesh(mesh, meridian, method="vtk")
+    result = remesh(mesh, meridian, method="numpy")
+    for actual, other in zip(result, expected, strict=True):
+        assert_allclose(
+            _areas(actual, mesh.n_cells),
+            _areas(other, mesh.n_cells),
+            rtol=1e-5,
+            atol=1e-9,
+        )
+    # the seam points are also seam points of the vtk method, apart from the
+    # poles, which the vtk method does not consistently detect as boundary points
+    for actual, other in zip(result[1:], expected[1:], strict=True):
+        actual_seam = _seam(actual)
+        actual_seam = actual_seam[np.abs(actual_seam[:, 2]) != 1]
+        delta = actual_seam[:, np.newaxis] - _seam(other)[np.newaxis]
+        assert np.all(np.linalg.norm(delta, axis=-1).min(axis=1) < 1e-6)
+
+
+def test_seam_markers(mesh):
+    """Test the numpy remesh method seam markers of the west and east meshes."""
+    _, west, east = remesh(mesh, 0, method="numpy")
+    for result, marker in ((west, REMESH_SEAM), (east, REMESH_SEAM_EAST)):
+        seam = result[GV_REMESH_POINT_IDS] != REMESH_JOIN
+        assert np.all(result[GV_REMESH_POINT_IDS][seam] == marker)
+        assert_allclose(result.points[seam][:, 1], 0, atol=1e-15)
+
+
+def test_no_intersection(mesh):
+    """Test the numpy remesh method with a meridian that does not bisect the mesh."""
+    result, west, east = remesh(mesh, 90, method="numpy")
+    assert result.n_cells == west.n_cells == east.n_cells == 0
+
+
+def test_method_fail(mesh):
+    """Test trap of an unknown remesh method."""
+    emsg = "Expected a remesh method of 'numpy' or 'vtk', got 'dummy'"
+    with pytest.raises(ValueError, match=emsg):
+        _ = remesh(mesh, 0, method="dummy")
+
+
+def test_check_fail(mesh):
+    """Test trap of a check with the numpy remesh method."""
+    emsg = "Cannot check the remeshed surface with the 'numpy' remesh method"
+    with pytest.raises(ValueError, match=emsg):
+        _ = remesh(mesh, 0, check=True, method="numpy")
@@ -10,6 +10,9 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, NamedTuple
 
 import pytest
+import pyvista as pv
+
+from geovista.pantry.meshes import regular_grid
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
@@ -45,6 +48,18 @@ class Vertex(NamedTuple):
     cids: Iterable[int]
 
 
+@pytest.fixture
+def mesh():
+    """Fixture provides a global mesh."""
+    return regular_grid(resolution="r50")
+
+
+@pytest.fixture
+def plane():
+    """Fixture provides a 4x3 grid of quad cells."""
+    return pv.Plane(i_resolution=4, j_resolution=3)
+
+
 @pytest.fixture(
     params=[
         Center(cid=0, pids=[0, 1, 2, 3]),
@@ -0,0 +1,131 @@
+# Copyright (c) 2021, GeoVista Contributors.
+#
+# This file is part of GeoVista and is distributed under the 3-Clause BSD license.
+# See the LICENSE file in the package root directory for licensing details.
+
+"""Unit-tests for :class:`geovista.search.Adjacency`."""
+
+from __future__ import annotations
+
+import numpy as np
+from numpy.testing import assert_array_equal
+import pytest
+import pyvista as pv
+
+from geovista.search import Adjacency
+
+
+@pytest.fixture
+def adjacency(plane):
+    """Fixture provides the adjacency of the grid."""
+    return Adjacency(plane)
+
+
+def test_serialization(adjacency):
+    """Test the representation serialization."""
+    assert repr(adjacency) == "Adjacency(n_points=20, n_cells=12)"
+    assert adjacency.n_points == 20
+    assert adjacency.n_cells == 12
+
+
+def test_cell_points(plane, adjacency):
+    """Test the points of cells."""
+    assert_array_equal(adjacency.cell_points(0), np.sort(plane.get_cell(0).point_ids))
+    expected = np.union1d(plane.get_cell(0).point_ids, plane.get_cell(5).point_ids)
+    assert_array_equal(adjacency.cell_points([5, 0]), expected)
+
+
+def test_point_cells(adjacency):
+    """Test the cells containing points."""
+    assert_array_equal(adjacency.point_cells(0), [0])
+    assert_array_equal(adjacency.point_cells(6), [0, 1, 4, 5])
+    assert_array_equal(adjacency.point_cells([0, 4]), [0, 3])
+
+
+def test_point_rows(adjacency):
+    """Test the batched cells containing each point."""
+    pids = np.array([6, 0, 6, 4])
+    offsets, cells = adjacency._point_rows(pids)
+    assert_array_equal(offsets, [0, 4, 5, 9, 10])
+    for idx, pid in enumerate(pids):
+        actual = cells[offsets[idx] : offsets[idx + 1]]
+        assert_array_equal(actual, adjacency.point_cells(pid))
+
+
+@pytest.mark.parametrize(
+    ("edge", "expected"),
+    [(False, [0, 1, 2, 4, 6, 8, 9, 10]), (True, [1, 4, 6, 9])],
+)
+def test_neighbours(adjacency, edge, expected):
+    """Test the vertex and edge neighbours of a cell."""
+    assert_array_equal(adjacency.neighbours(5, edge=edge), expected)
+
+
+def test_neighbours_cells(adjacency):
+    """Test the neighbours of many cells exclude the cells."""
+    assert_array_equal(adjacency.neighbours([0, 1], edge=True), [2, 4, 5])
+
+
+@pytest.mark.parametrize(
+    ("edge", "expected"),
+    [(False, [1, 2, 4, 5, 6, 8, 9, 10]), (True, [1, 2, 4, 5, 8])],
+)
+def test_rings(adjacency, edge, expected):
+    """Test the k-ring expansion of a neighbourhood."""
+    assert_array_equal(adjacency.neighbours(0, edge=edge, rings=2), expected)
+    expected = np.arange(1, 12)
+    assert_array_equal(adjacency.neighbours(0, edge=edge, rings=10), expected)
+
+
+def test_edge_lines():
+    """Test the edge neighbours of open line cells."""
+    points = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]], dtype=float)
+    mesh = pv.PolyData(points, lines=[2, 0, 1, 2, 1, 2, 2, 2, 3, 2, 1, 0])
+    adjacency = Adjacency(mesh)
+    assert_array_equal(adjacency.neighbours(0, edge=True), [3])
+    assert_array_equal(adjacency.neighbours(2, edge=True), [])
+
+
+def test_edge_strips():
+    """Test the edge neighbours of triangle strip cells."""
+    points = np.array(
+        [[0, 0, 0], [1, 0, 0], [0, 1, 0], [1, 1, 0], [-1, 1, 0], [2, 1, 0]]
+    )
+    mesh = pv.PolyData(points.astype(float), faces=[3, 0, 2, 4, 3, 1, 3, 5])
+    mesh.strips = [4, 0, 1, 2, 3]
+    adjacency = Adjacency(mesh)
+    assert_array_equal(adjacency.neighbours(0, edge=True), [2])
+    assert_array_equal(adjacency.neighbours(1, edge=True), [2])
+    assert_array_equal(adjacency.neighbours(2, edge=True), [0, 1])
+
+
+def test_edge_non_manifold():
+    """Test the edge neighbours of cells sharing a non-manifold edge."""
+    points = np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0], [0, -1, 0], [0, 0, 1]])
+    mesh = pv.PolyData(points.astype(float), faces=[3, 0, 1, 2, 3, 1, 0, 3, 3, 0, 1, 4])
+    adjacency = Adjacency(mesh)
+    for cid in range(3):
+        expected = sorted({0, 1, 2} - {cid})
+        assert_array_equal(adjacency.neighbours(cid, edge=True), expected)
+
+
+def test_rings_fail(adjacency):
+    """Test trap of an invalid number of neighbourhood rings."""
+    emsg = "Require a positive number of neighbourhood rings, got '0'"
+    with pytest.raises(ValueError, match=emsg):
+        _ = adjacency.neighbours(0, rings=0)
+
+
+@pytest.mark.parametrize("cid", [-1, 12])
+def test_cell_ids_fail(adjacency, cid):
+    """Test trap of cell-ids out of range."""
+    emsg = r"Require cell-ids in the range \[0, 12\)"
+    with pytest.raises(ValueError, match=emsg):
+        _ = adjacency.neighbours(cid)
+
+
+def test_point_ids_fail(adjacency):
+    """Test trap of point-ids out of range."""
+    emsg = r"Require point-ids in the range \[0, 20\), got \[0, 20\]"
+    with pytest.raises(ValueError, match=emsg):
+        _ = adjacency.point_cells([0, 20])
@@ -0,0 +1,81 @@
+# Copyright (c) 2021, GeoVista Contributors.
+#
+# This file is part of GeoVista and is distributed under the 3-Clause BSD license.
+# See the LICENSE file in the package root directory for licensing details.
+
+"""Unit-tests for :meth:`geovista.search.KDTree.query_ball`."""
+
+from __future__ import annotations
+
+import numpy as np
+from numpy.testing import assert_allclose, assert_array_equal
+import pytest
+
+from geovista.common import to_cartesian
+from geovista.search import EARTH_RADIUS, KDTree, SearchPreference
+
+PREFERENCES = SearchPreference.values()
+
+
+@pytest.fixture
+def poi():
+    """Fixture provides random points-of-interest."""
+    rng = np.random.default_rng(0)
+    return rng.uniform(-180, 180, 50), rng.uniform(-90, 90, 50)
+
+
+def _great_circle(kdtree: KDTree, lons: np.ndarray, lats: np.ndarray) -> np.ndarray:
+    """Calculate the brute-force great-circle distance to each kd-tree point."""
+    xyz = to_cartesian(lons, lats)
+    points = kdtree.points / np.linalg.norm(kdtree.points, axis=-1, keepdims=True)
+    return np.arccos(np.clip(xyz @ points.T, -1, 1)) * EARTH_RADIUS
+
+
+@pytest.mark.parametrize("distance", [0, 100e3, 1000e3, 5000e3])
+@pytest.mark.parametrize("preference", PREFERENCES)
+def test_brute_force(mesh, poi, preference, distance):
+    """Test equivalence with a brute-force great-circle search."""
+    kdtree = KDTree(mesh, preference=preference)
+    expected = _great_circle(kdtree, *poi)
+    distances, indices = kdtree.query_ball(*poi, distance)
+    assert len(distances) == len(indices) == expected.shape[0]
+    for actual, dist, row in zip(indices, distances, expected, strict=True):
+        assert set(actual.tolist()) == set(np.flatnonzero(row <= distance).tolist())
+        assert np.all(np.diff(dist) >= 0)
+
+
+@pytest.mark.parametrize("preference", PREFERENCES)
+def test_haversine(mesh, poi, preference):
+    """Test the great-circle distances of the neighbours within the ball."""
+    kdtree = KDTree(mesh, preference=preference)
+    expected = _great_circle(kdtree, *poi)
+    distances, indices = kdtree.query_ball(*poi, 1000e3, haversine=True)
+    for dist, index, row in zip(distances, indices, expected, strict=True):
+        assert np.all(np.diff(dist) >= 0)
+        assert_allclose(dist, row[index], rtol=1e-9, atol=1e-6)
+
+
+def test_global(mesh):
+    """Test a ball spanning the globe finds every kd-tree point."""
+    kdtree = KDTree(mesh)
+    _, indices = kdtree.query_ball([0, 45], [0, -30], np.pi * EARTH_RADIUS)
+    for actual in indices:
+        assert_array_equal(np.sort(actual), np.arange(kdtree.n_points))
+
+
+@pytest.mark.parametrize("k", [1, 3])
+def test_query_haversine(mesh, poi, k):
+    """Test the great-circle distances of the nearest neighbours."""
+    kdtree = KDTree(mesh)
+    expected = _great_circle(kdtree, *poi)
+    distances, indices = kdtree.query(*poi, k=k, haversine=True)
+    indices = indices.astype(int).reshape(-1, k)
+    actual = np.take_along_axis(expected, indices, axis=1)
+    assert_allclose(distances.reshape(-1, k), actual, rtol=1e-9, atol=1e-6)
+
+
+def test_distance_fail(mesh):
+    """Test trap of a negative great-circle distance."""
+    emsg = "Require a non-negative great-circle distance, got '-1'"
+    with pytest.raises(ValueError, match=emsg):
+        _ = KDTree(mesh).query_ball(0, 0, -1)
@@ -0,0 +1,123 @@
+# Copyright (c) 2021, GeoVista Contributors.
+#
+# This file is part of GeoVista and is distributed under the 3-Clause BSD license.
+# See the LICENSE file in the package root directory for licensing details.
+
+"""Unit-tests for :meth:`geovista.search.KDTree.save` and :meth:`~.KDTree.load`."""
+
+from __future__ import annotations
+
+import numpy as np
+from numpy.testing import assert_array_equal
+import pytest
+
+from geovista.pantry.meshes import regular_grid
+from geovista.search import KDTREE_FORMAT, KDTree, SearchPreference
+
+PREFERENCES = SearchPreference.values()
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+@pytest.mark.parametrize("preference", PREFERENCES)
+def test_roundtrip(tmp_path, mesh, preference, mmap):
+    """Test a persisted kd-tree is loaded with the same configuration and points."""
+    kdtree = KDTree(mesh, leaf_size=8, preference=preference)
+    fname = kdtree.save(tmp_path / "kdtree")
+    assert fname.is_dir()
+    result = KDTree.load(fname, mesh=mesh, mmap=mmap)
+    assert repr(result) == repr(kdtree)
+    assert result.fingerprint == kdtree.fingerprint
+    assert_array_equal(result.points, kdtree.points)
+    lons, lats = [-10.5, 0, 120.3], [-45.2, 0, 89]
+    for actual, expected in zip(
+        result.query(lons, lats, k=3), kdtree.query(lons, lats, k=3), strict=True
+    ):
+        assert_array_equal(actual, expected)
+
+
+def test_mmap(tmp_path, mesh):
+    """Test the persisted kd-tree points are memory-mapped read-only."""
+    fname = KDTree(mesh).save(tmp_path / "kdtree")
+    result = KDTree.load(fname)
+    assert not result._kdtree.data.flags.writeable
+    result = KDTree.load(fname, mmap=False)
+    assert result._kdtree.data.flags.writeable
+
+
+def test_replace(tmp_path, mesh):
+    """Test an existing persisted kd-tree is replaced."""
+    fname = KDTree(mesh).save(tmp_path / "kdtree")
+    kdtree = KDTree(mesh, preference=SearchPreference.CENTER)
+    assert kdtree.save(fname) == fname
+    result = KDTree.load(fname)
+    assert result.preference == SearchPreference.CENTER
+    assert result.n_points == mesh.n_cells
+    assert [path.name for path in tmp_path.iterdir()] == ["kdtree"]
+    names = sorted(path.name for path in fname.iterdir())
+    assert len(names) == 2
+    assert names[0] == "meta.npz"
+    assert names[1].startswith("points.")
+
+
+def test_replace_empty(tmp_path, mesh):
+    """Test an existing empty directory is used for the persisted kd-tree."""
+    fname = tmp_path / "kdtree"
+    fname.mkdir()
+    assert KDTree(mesh).save(fname) == fname
+    assert KDTree.load(fname).n_points == mesh.n_points
+
+
+def test_replace_fail(tmp_path, mesh):
+    """Test trap of replacing a directory that is not a persisted kd-tree."""
+    fname = tmp_path / "kdtree"
+    fname.mkdir()
+    (fname / "important.txt").write_text("keep")
+    emsg = "as it is not an empty directory or a persisted kd-tree"
+    with pytest.raises(ValueError, match=emsg):
+        _ = KDTree(mesh).save(fname)
+    assert [path.name for path in fname.iterdir()] == ["important.txt"]
+    with pytest.raises(ValueError, match=emsg):
+        _ = KDTree(mesh).save(fname / "important.txt")
+
+
+def test_fingerprint(mesh):
+    """Test the fingerprint depends on the mesh geometry and search preference."""
+    kdtree = KDTree(mesh)
+    assert KDTree(mesh.copy(deep=True)).fingerprint == kdtree.fingerprint
+    center = KDTree(mesh, preference=SearchPreference.CENTER)
+    assert center.fingerprint != kdtree.fingerprint
+    other = mesh.copy(deep=True)
+    other.points = other.points * 2
+    assert KDTree(other).fingerprint != kdtree.fingerprint
+
+
+@pytest.mark.parametrize("preference", PREFERENCES)
+def test_fingerprint_point(preference):
+    """Test the fingerprint depends on every point of the mesh geometry."""
+    mesh = regular_grid(resolution="r300")
+    kdtree = KDTree(mesh, preference=preference)
+    other = mesh.copy(deep=True)
+    points = other.points.copy()
+    points[5] *= 1.5
+    other.points = points
+    assert KDTree(other, preference=preference).fingerprint != kdtree.fingerprint
+
+
+def test_mesh_fail(tmp_path, mesh):
+    """Test trap of a mesh that does not match the persisted kd-tree."""
+    fname = KDTree(mesh).save(tmp_path / "kdtree")
+    emsg = "the mesh geometry does not match the geometry of the persisted kd-tree"
+    with pytest.raises(ValueError, match=emsg):
+        _ = KDTree.load(fname, mesh=regular_grid(resolution="r10"))
+
+
+def test_format_fail(tmp_path, mesh):
+    """Test trap of a persisted kd-tree with an unsupported format version."""
+    fname = KDTree(mesh).save(tmp_path / "kdtree")
+    with np.load(fname / "meta.npz") as meta:
+        content = dict(meta)
+    content["format"] = KDTREE_FORMAT + 1
+    np.savez(fname / "meta.npz", **content)
+    emsg = f"expected format version {KDTREE_FORMAT}, got {KDTREE_FORMAT + 1}"
+    with pytest.raises(ValueError, match=emsg):
+        _ = KDTree.load(fname)
@@ -0,0 +1,54 @@
+# Copyright (c) 2021, GeoVista Contributors.
+#
+# This file is part of GeoVista and is distributed under the 3-Clause BSD license.
+# See the LICENSE file in the package root directory for licensing details.
+
+"""Unit-tests for :func:`geovista.search.cell_adjacency`."""
+
+from __future__ import annotations
+
+import pytest
+import pyvista as pv
+
+from geovista import search
+from geovista.search import adjacency_cache_clear, cell_adjacency
+
+
+@pytest.fixture(autouse=True)
+def cache():
+    """Fixture provides an empty adjacency cache."""
+    _ = adjacency_cache_clear()
+    yield
+    _ = adjacency_cache_clear()
+
+
+def test_hit(plane):
+    """Test the adjacency of the mesh is reused."""
+    expected = cell_adjacency(plane)
+    plane.points = plane.points * 2
+    assert cell_adjacency(plane) is expected
+
+
+def test_miss_topology(plane):
+    """Test modifying the mesh topology invalidates the cached adjacency."""
+    expected = cell_adjacency(plane)
+    plane.faces = plane.faces
+    result = cell_adjacency(plane)
+    assert result is not expected
+    assert result.n_cells == expected.n_cells
+
+
+def test_size(monkeypatch, plane):
+    """Test the least recently used adjacency is evicted from the cache."""
+    monkeypatch.setattr(search, "ADJACENCY_CACHE_SIZE", 1)
+    expected = cell_adjacency(plane)
+    _ = cell_adjacency(pv.Plane())
+    assert cell_adjacency(plane) is not expected
+
+
+def test_clear(plane):
+    """Test clearing the adjacency cache."""
+    _ = cell_adjacency(plane)
+    _ = cell_adjacency(pv.Plane())
+    assert adjacency_cache_clear() == 2
+    assert adjacency_cache_clear() == 0
@@ -0,0 +1,133 @@
+# Copyright (c) 2021, GeoVista Contributors.
+#
+# This file is part of GeoVista and is distributed under the 3-Clause BSD license.
+# See the LICENSE file in the package root directory for licensing details.
+
+"""Unit-tests for :func:`geovista.search.find_containing_cells`."""
+
+from __future__ import annotations
+
+import numpy as np
+from numpy.testing import assert_array_equal
+import pytest
+import pyvista as pv
+
+from geovista.bridge import Transform
+from geovista.common import from_cartesian, to_cartesian
+from geovista.search import KDTree, find_containing_cells
+
+
+@pytest.fixture
+def lam():
+    """Fixture provides a limited area mesh straddling the anti-meridian."""
+    return Transform.from_1d(np.linspace(170, 190, 11), np.linspace(40, 60, 11))
+
+
+def _contains(mesh: pv.PolyData, lons: np.ndarray, lats: np.ndarray) -> np.ndarray:
+    """Determine the brute-force containment of each point by each cell."""
+    poi = to_cartesian(lons, lats)
+    faces = mesh.regular_faces
+    points = mesh.points[faces].astype(np.float64)
+    result = np.zeros((poi.shape[0], mesh.n_cells), dtype=bool)
+    # the cone of each fan triangle of each cell, about the origin
+    for idx in range(1, faces.shape[1] - 1):
+        cones = np.stack([points[:, 0], points[:, idx], points[:, idx + 1]], axis=-1)
+        valid = np.abs(np.linalg.det(cones)) > 1e-15
+        inverse = np.linalg.inv(cones[valid])
+        weights = np.einsum("cij,pj->pci", inverse, poi)
+        result[:, valid] |= np.all(weights >= -1e-9, axis=-1)
+    return result
+
+
+@pytest.mark.parametrize("fixture", ["mesh", "lam"])
+def test_brute_force(request, fixture):
+    """Test equivalence with a brute-force search of every cell."""
+    mesh = request.getfixturevalue(fixture)
+    rng = np.random.default_rng(0)
+    lons, lats = rng.uniform(160, 200, 100), rng.uniform(30, 70, 100)
+    if fixture == "mesh":
+        lons, lats = rng.uniform(-180, 180, 100), rng.uniform(-90, 90, 100)
+    expected = _contains(mesh, lons, lats)
+    result = find_containing_cells(mesh, lons, lats)
+    assert_array_equal(result == -1, ~np.any(expected, axis=1))
+    located = np.flatnonzero(result >= 0)
+    assert np.all(expected[located, result[located]])
+
+
+def test_cell_centers(mesh):
+    """Test the cell containing each cell center."""
+    lons, lats = from_cartesian(mesh.cell_centers()).T[:2]
+    result = find_containing_cells(mesh, lons, lats)
+    assert_array_equal(result, np.arange(mesh.n_cells))
+
+
+@pytest.mark.parametrize("lat", [-90, 90])
+def test_poles(mesh, lat):
+    """Test each pole is located within a cell with a polar vertex."""
+    (result,) = find_containing_cells(mesh, 0, lat)
+    assert result >= 0
+    lats = from_cartesian(mesh.extract_cells(result))[:, 1]
+    assert np.any(np.isclose(lats, lat))
+
+
+def test_anti_meridian(lam):
+    """Test points either side of the anti-meridian are within the domain."""
+    result = find_containing_cells(lam, [179.5, -179.5, 180], [50.5, 50.5, 50.5])
+    assert np.all(result >= 0)
+    assert len(set(result.tolist())) == 2
+
+
+def test_outside(lam):
+    """Test points beyond the limited area domain are not located."""
+    result = find_containing_cells(lam, [0, 175, 150, -170], [50, 80, 50, 0])
+    assert_array_equal(result, -1)
+
+
+def test_kdtree(tmp_path, mesh):
+    """Test a persisted kd-tree of the cell centers is used."""
+    fname = KDTree(mesh, preference="center").save(tmp_path / "kdtree")
+    lons, lats = [-10.5, 0.5, 120.3], [-45.2, 0.5, 89]
+    result = find_containing_cells(mesh, lons, lats, kdtree=KDTree.load(fname))
+    assert_array_equal(result, find_containing_cells(mesh, lons, lats))
+
+
+def test_candidates(mesh):
+    """Test the candidate cells are expanded to locate each point."""
+    rng = np.random.default_rng(0)
+    lons, lats = rng.uniform(-180, 180, 100), rng.uniform(-90, 90, 100)
+    expected = find_containing_cells(mesh, lons, lats)
+    result = find_containing_cells(mesh, lons, lats, candidates=1)
+    assert_array_equal(result, expected)
+
+
+def test_kdtree_fail(mesh):
+    """Test trap of a kd-tree that is not of the mesh cell centers."""
+    emsg = "Require a kd-tree of the cell centers of the mesh"
+    with pytest.raises(ValueError, match=emsg):
+        _ = find_containing_cells(mesh, 0, 0, kdtree=KDTree(mesh))
+
+
+def test_candidates_fail(mesh):
+    """Test trap of an invalid number of candidate cells."""
+    emsg = "Require a positive number of candidate cells, got '0'"
+    with pytest.raises(ValueError, match=emsg):
+        _ = find_containing_cells(mesh, 0, 0, candidates=0)
+
+
+def test_shape_fail(mesh):
+    """Test trap of points with a different number of longitudes and latitudes."""
+    emsg = (
+        "Require the same number of longitude and latitude points-of-interest, "
+        "got 2 and 3"
+    )
+    with pytest.raises(ValueError, match=emsg):
+        _ = find_containing_cells(mesh, [0, 1], [0, 1, 2])
+
+
+def test_no_cells_fail():
+    """Test trap of a mesh with no cells."""
+    mesh = pv.PolyData()
+    mesh.points = np.zeros((3, 3))
+    emsg = "Cannot find the containing cells of a mesh with no cells"
+    with pytest.raises(ValueError, match=emsg):
+        _ = find_containing_cells(mesh, 0, 0)
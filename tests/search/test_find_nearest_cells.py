@@ -0,0 +1,133 @@
+# Copyright (c) 2021, GeoVista Contributors.
+#
+# This file is part of GeoVista and is distributed under the 3-Clause BSD license.
+# See the LICENSE file in the package root directory for licensing details.
+
+"""Unit-tests for :func:`geovista.search.find_nearest_cells`."""
+
+from __future__ import annotations
+
+import numpy as np
+from numpy.testing import assert_array_equal
+from pyproj import CRS
+import pytest
+import pyvista as pv
+
+from geovista.common import from_cartesian, to_cartesian
+from geovista.crs import to_wkt
+from geovista.pantry.meshes import regular_grid
+from geovista.search import find_nearest_cell, find_nearest_cells
+
+
+@pytest.fixture
+def planar():
+    """Fixture provides a projected planar mesh."""
+    mesh = pv.Plane(i_size=100, j_size=50, i_resolution=10, j_resolution=5)
+    to_wkt(mesh, CRS.from_proj4("+proj=merc"))
+    return mesh
+
+
+@pytest.mark.parametrize("triangulate", [False, True])
+def test_find_nearest_cell(mesh, triangulate):
+    """Test equivalence with finding the nearest cell of each point-of-interest."""
+    if triangulate:
+        mesh = mesh.triangulate()
+    rng = np.random.default_rng(0)
+    lons, lats = rng.uniform(-180, 180, 100), rng.uniform(-75, 75, 100)
+    expected = [
+        find_nearest_cell(mesh, lon, lat) for lon, lat in zip(lons, lats, strict=True)
+    ]
+    assert find_nearest_cells(mesh, lons, lats) == expected
+
+
+@pytest.mark.parametrize("candidates", [1, None])
+def test_brute_force(mesh, candidates):
+    """Test equivalence with a search of every cell near the poles."""
+    mesh = mesh.triangulate()
+    rng = np.random.default_rng(0)
+    lons = rng.uniform(-180, 180, 20)
+    lats = rng.uniform(80, 90, 20) * rng.choice([-1, 1], 20)
+    expected = find_nearest_cells(mesh, lons, lats, candidates=mesh.n_cells)
+    result = find_nearest_cells(mesh, lons, lats, candidates=candidates)
+    assert result == expected
+
+
+def test_non_planar():
+    """Test the distance to a non-planar cell differs from the vtk cell locator."""
+    mesh = regular_grid(resolution="r100")
+    lon, lat = 61.4248, -14.4044
+    (result,) = find_nearest_cells(mesh, lon, lat, single=True)
+    assert result == 6250
+    # the vtk cell locator measures to the bilinear surface of the quad
+    # extrapolated just beyond its edge shared with the closest cell
+    assert find_nearest_cell(mesh, lon, lat) == [6400]
+    poi = to_cartesian(lon, lat)[0]
+    distances = []
+    for cid in [6250, 6400]:
+        cell = mesh.extract_cells(cid).extract_surface().triangulate()
+        _, closest = cell.find_closest_cell(poi, return_closest_point=True)
+        distances.append(np.sum((closest - poi) ** 2))
+    assert distances[0] < distances[1]
+
+
+def test_cell_centers(mesh):
+    """Test only a single cell is found when given a cell center."""
+    lons, lats = from_cartesian(mesh.cell_centers()).T[:2]
+    result = find_nearest_cells(mesh, lons, lats, single=True)
+    assert_array_equal(result, np.arange(mesh.n_cells))
+
+
+def test_vertex(mesh):
+    """Test the cells sharing a vertex coincident with a point-of-interest."""
+    lonlat = from_cartesian(mesh)
+    pids = [100, 200, 300]
+    result = find_nearest_cells(mesh, [0, *lonlat[pids, 0]], [0.5, *lonlat[pids, 1]])
+    assert result[0] == find_nearest_cell(mesh, 0, 0.5)
+    for actual, pid in zip(result[1:], pids, strict=True):
+        assert len(actual) == 4
+        assert actual == find_nearest_cell(mesh, *lonlat[pid, :2])
+
+
+def test_single_fail(mesh):
+    """Test trap of a point-of-interest coincident with a shared vertex."""
+    lon, lat = from_cartesian(mesh)[100, :2]
+    emsg = "Expected to find 1 cell per point-of-interest but found 4"
+    with pytest.raises(ValueError, match=emsg):
+        _ = find_nearest_cells(mesh, [0, lon], [0.5, lat], single=True)
+
+
+def test_projected(planar):
+    """Test the points-of-interest of a projected mesh are not geographic."""
+    xs, ys, _ = planar.cell_centers().points.T
+    result = find_nearest_cells(planar, xs, ys, zs=0, single=True)
+    assert_array_equal(result, np.arange(planar.n_cells))
+
+
+def test_candidates(planar):
+    """Test a single candidate cell per point-of-interest."""
+    xs, ys, _ = planar.cell_centers().points.T
+    result = find_nearest_cells(planar, xs, ys, candidates=1, single=True)
+    assert_array_equal(result, np.arange(planar.n_cells))
+
+
+def test_candidates_fail(mesh):
+    """Test trap of an invalid number of candidate cells."""
+    emsg = "Require a positive number of candidate cells, got '0'"
+    with pytest.raises(ValueError, match=emsg):
+        _ = find_nearest_cells(mesh, 0, 0, candidates=0)
+
+
+def test_shape_fail(mesh):
+    """Test trap of points-of-interest with a different number of x and y values."""
+    emsg = "Require the same number of x and y points-of-interest, got 2 and 3"
+    with pytest.raises(ValueError, match=emsg):
+        _ = find_nearest_cells(mesh, [0, 1], [0, 1, 2])
+
+
+def test_no_cells_fail():
+    """Test trap of a mesh with no cells."""
+    mesh = pv.PolyData()
+    mesh.points = np.zeros((3, 3))
+    emsg = "Cannot find the nearest cells of a mesh with no cells"
+    with pytest.raises(ValueError, match=emsg):
+        _ = find_nearest_cells(mesh, 0, 0)
@@ -0,0 +1,201 @@
+# Copyright (c) 2021, GeoVista Contributors.
+#
+# This file is part of GeoVista and is distributed under the 3-Clause BSD license.
+# See the LICENSE file in the package root directory for licensing details.
+
+"""Unit-tests for :func:`geovista.transform.projection_cache`."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+import warnings
+
+import numpy as np
+from numpy.testing import assert_allclose, assert_array_equal
+import pytest
+
+from geovista import common, core, transform
+from geovista.bridge import Transform
+from geovista.common import TemplateCacheInfo
+from geovista.transform import (
+    projection_cache,
+    projection_cache_clear,
+    projection_cache_info,
+    transform_mesh,
+)
+
+if TYPE_CHECKING:
+    import pyvista as pv
+
+
+@pytest.fixture
+def cache(enable_cache):
+    """Fixture enables an empty projection cache."""
+    enable_cache(transform, "GEOVISTA_PROJECTION_CACHE", projection_cache_clear)
+
+
+@pytest.fixture
+def mesh():
+    """Fixture provides a global mesh with cell edges along the anti-meridian."""
+    lons = np.linspace(-180, 180, num=13)
+    lats = np.linspace(-90, 90, num=7)
+    return Transform.from_1d(lons, lats, data=np.arange(72), name="data")
+
+
+@pytest.fixture
+def bisected():
+    """Fixture provides a global mesh bisected by the anti-meridian."""
+    lons = np.linspace(-170, 190, num=13)
+    lats = np.linspace(-90, 90, num=7)
+    mesh = Transform.from_1d(lons, lats)
+    mesh.point_data["data"] = np.arange(mesh.n_points, dtype=float)
+    return mesh
+
+
+def test_enable(toggle):
+    """Test the projection cache status is updated."""
+    toggle(transform, "GEOVISTA_PROJECTION_CACHE", projection_cache)
+
+
+@pytest.mark.usefixtures("cache")
+@pytest.mark.parametrize("tgt_crs", ["+proj=robin", "+proj=moll +lon_0=90"])
+def test_hit(mocker, mesh, tgt_crs):
+    """Test the cached projection is reused with the current mesh data."""
+    expected = transform_mesh(mesh, tgt_crs)
+    spy = mocker.spy(core, "slice_mesh")
+    mesh["data"] = np.arange(72)[::-1]
+    result = transform_mesh(mesh, tgt_crs)
+    assert spy.call_count == 0
+    assert result is not expected
+    assert_array_equal(result.points, expected.points)
+    assert_array_equal(result.faces, expected.faces)
+    assert_array_equal(result["data"], 71 - expected["data"])
+    assert result.active_scalars_name == "data"
+    assert sorted(result.field_data.keys()) == sorted(expected.field_data.keys())
+
+
+@pytest.mark.usefixtures("cache")
+@pytest.mark.parametrize("tgt_crs", ["+proj=robin", "+proj=robin +lon_0=45"])
+def test_bisected(monkeypatch, mocker, bisected, tgt_crs):
+    """Test the data of the points inserted along the seam is interpolated."""
+    monkeypatch.setattr(transform, "GEOVISTA_PROJECTION_CACHE", False)
+    expected = transform_mesh(bisected, tgt_crs)
+    assert expected.n_points > bisected.n_points
+    monkeypatch.setattr(transform, "GEOVISTA_PROJECTION_CACHE", True)
+    miss = transform_mesh(bisected, tgt_crs)
+    spy = mocker.spy(core, "slice_mesh")
+    result = transform_mesh(bisected, tgt_crs)
+    assert spy.call_count == 0
+    assert_array_equal(result.points, expected.points)
+    assert_array_equal(result["data"], miss["data"])
+    assert_allclose(result["data"], expected["data"], rtol=1e-6)
+    size = transform.PROJECTION_CACHE_SIZE
+    assert projection_cache_info() == TemplateCacheInfo(1, 1, size, 1)
+
+
+@pytest.mark.usefixtures("cache")
+def test_hit_warnings(mocker, mesh):
+    """Test the warnings of slicing the mesh are issued by a cache hit."""
+    tgt_crs = "+proj=robin"
+    original = core.slice_mesh
+
+    def slice_mesh(mesh: pv.PolyData, **kwargs: float | None) -> pv.PolyData:
+        warnings.warn("dummy warning", stacklevel=2)
+        return original(mesh, **kwargs)
+
+    mocker.patch.object(core, "slice_mesh", side_effect=slice_mesh)
+    for _ in range(2):
+        with pytest.warns(UserWarning, match="dummy warning"):
+            _ = transform_mesh(mesh, tgt_crs)
+    assert projection_cache_info().hits == 1
+
+
+@pytest.mark.usefixtures("cache")
+def test_central_meridian(mocker, mesh):
+    """Test the mesh is not modified when projected to a central meridian."""
+    fingerprint = common._fingerprint(mesh)
+    points = mesh.points.copy()
+    for tgt_crs in ["+proj=robin +lon_0=90", "+proj=robin +lon_0=-90"]:
+        _ = transform_mesh(mesh, tgt_crs)
+    assert common._fingerprint(mesh) == fingerprint
+    assert_array_equal(mesh.points, points)
+    spy = mocker.spy(core, "slice_mesh")
+    for tgt_crs in ["+proj=robin +lon_0=90", "+proj=robin +lon_0=-90"]:
+        _ = transform_mesh(mesh, tgt_crs)
+    assert spy.call_count == 0
+    assert projection_cache_clear(mesh) == 2
+
+
+@pytest.mark.usefixtures("cache")
+def test_hit_modified(mesh):
+    """Test the cached projection is not modified through a cache hit."""
+    tgt_crs = "+proj=robin"
+    expected = transform_mesh(mesh, tgt_crs).points.copy()
+    result = transform_mesh(mesh, tgt_crs)
+    result.points[:] = 0
+    result = transform_mesh(mesh, tgt_crs)
+    assert_array_equal(result.points, expected)
+
+
+def test_disabled(monkeypatch, mocker, mesh):
+    """Test the projection cache is not used when disabled."""
+    monkeypatch.setattr(transform, "GEOVISTA_PROJECTION_CACHE", False)
+    spy = mocker.spy(core, "slice_mesh")
+    for _ in range(2):
+        _ = transform_mesh(mesh, "+proj=robin")
+    assert spy.call_count == 2
+    assert projection_cache_clear() == 0
+
+
+@pytest.mark.usefixtures("cache")
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"zlevel": 1}, {"zscale": 2.0}, {"dtype": "float32"}, {"slice_connectivity": 0}],
+)
+def test_settings(mocker, mesh, kwargs):
+    """Test the transform settings are part of the cache key."""
+    tgt_crs = "+proj=robin"
+    _ = transform_mesh(mesh, tgt_crs)
+    spy = mocker.spy(core, "slice_mesh")
+    _ = transform_mesh(mesh, tgt_crs, **kwargs)
+    assert spy.call_count == (0 if "slice_connectivity" in kwargs else 1)
+    assert projection_cache_clear() == 2 - (kwargs.get("slice_connectivity") == 0)
+
+
+@pytest.mark.usefixtures("cache")
+def test_invalidate_points(mocker, mesh):
+    """Test modification of the mesh points invalidates the cached projection."""
+    tgt_crs = "+proj=robin"
+    _ = transform_mesh(mesh, tgt_crs)
+    mesh.points = mesh.points * 2
+    spy = mocker.spy(core, "slice_mesh")
+    _ = transform_mesh(mesh, tgt_crs)
+    assert spy.call_count == 1
+
+
+@pytest.mark.usefixtures("cache")
+def test_clear_mesh(mocker, mesh):
+    """Test explicit invalidation of the cached projections of a mesh."""
+    other = mesh.copy(deep=True)
+    for tgt_crs in ["+proj=robin", "+proj=eqc"]:
+        _ = transform_mesh(mesh, tgt_crs)
+    _ = transform_mesh(other, "+proj=robin")
+    assert projection_cache_clear(mesh) == 2
+    spy = mocker.spy(core, "slice_mesh")
+    _ = transform_mesh(other, "+proj=robin")
+    assert spy.call_count == 0
+    assert projection_cache_clear() == 1
+    size = transform.PROJECTION_CACHE_SIZE
+    assert projection_cache_info() == TemplateCacheInfo(0, 0, size, 0)
+
+
+@pytest.mark.usefixtures("cache")
+def test_bounded(monkeypatch, mesh):
+    """Test the least recently used projection is evicted from the cache."""
+    monkeypatch.setattr(transform, "PROJECTION_CACHE_SIZE", 2)
+    for tgt_crs in ["+proj=robin", "+proj=eqc", "+proj=robin", "+proj=moll"]:
+        _ = transform_mesh(mesh, tgt_crs)
+    wkts = [key[2] for key in transform._PROJECTION_CACHE]
+    assert len(wkts) == 2
+    assert "Robinson" in wkts[0]
+    assert "Mollweide" in wkts[1]
@@ -0,0 +1,61 @@
+# Copyright (c) 2021, GeoVista Contributors.
+#
+# This file is part of GeoVista and is distributed under the 3-Clause BSD license.
+# See the LICENSE file in the package root directory for licensing details.
+
+"""Unit-tests for :func:`geovista.transform.transform_mesh`."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from geovista.bridge import Transform
+from geovista.core import slice_mesh
+from geovista.crs import WGS84
+from geovista.transform import transform_mesh
+
+
+@pytest.fixture
+def meshes():
+    """Fixture provides a global mesh at single and double precision."""
+    lons = np.linspace(-180, 180, num=73)
+    lats = np.linspace(-90, 90, num=37)
+    data = np.arange(72 * 36)
+    mesh64 = Transform.from_1d(lons, lats, data=data, zlevel=3)
+    mesh32 = Transform.from_1d(lons, lats, data=data, zlevel=3, dtype="float32")
+    return mesh32, mesh64
+
+
+def test_slice(meshes):
+    """Test single precision meshes slice identically within tolerance."""
+    mesh32, mesh64 = meshes
+    result32, result64 = slice_mesh(mesh32), slice_mesh(mesh64)
+    assert result32.points.dtype == np.float32
+    assert result32.n_points == result64.n_points
+    assert result32.n_cells == result64.n_cells
+    np.testing.assert_array_equal(result32.faces, result64.faces)
+    np.testing.assert_allclose(result32.points, result64.points, atol=1e-6)
+
+
+@pytest.mark.parametrize("tgt_crs", ["+proj=robin", "+proj=eqc +lon_0=90"])
+def test_project(meshes, tgt_crs):
+    """Test single precision meshes project identically within tolerance."""
+    mesh32, mesh64 = meshes
+    result32 = transform_mesh(mesh32, tgt_crs)
+    result64 = transform_mesh(mesh64, tgt_crs)
+    assert result32.points.dtype == np.float32
+    assert result32.n_points == result64.n_points
+    np.testing.assert_array_equal(result32.faces, result64.faces)
+    scale = np.abs(result64.points).max()
+    np.testing.assert_allclose(result32.points, result64.points, atol=scale * 1e-6)
+    np.testing.assert_array_equal(result32["cell_data"], result64["cell_data"])
+
+
+@pytest.mark.parametrize("tgt_crs", ["+proj=robin", WGS84])
+def test_dtype(meshes, tgt_crs):
+    """Test the precision of the transformed mesh points is changed."""
+    _, mesh64 = meshes
+    result = transform_mesh(mesh64, tgt_crs, dtype="float32")
+    assert result.points.dtype == np.float32
+    assert mesh64.points.dtype == np.float64
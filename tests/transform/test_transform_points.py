@@ -9,10 +9,10 @@ from __future__ import annotations
 
 import numpy as np
 from pyproj import Transformer
-from pyproj.exceptions import CRSError
+from pyproj.exceptions import CRSError, ProjError
 import pytest
 
-from geovista.crs import WGS84
+from geovista.crs import WGS84, crs_cache_clear
 from geovista.transform import transform_points
 
 
@@ -95,6 +95,8 @@ def test_transform(mocker, zoffset, reshape, roundtrip):
     else:
         shape = (size,)
     shape = (*shape, 3)
+    # ensure the transformers are not already cached
+    crs_cache_clear()
     spy_from_crs = mocker.spy(Transformer, "from_crs")
     spy_transform = mocker.spy(Transformer, "transform")
     if roundtrip:
@@ -120,3 +122,96 @@ def test_transform(mocker, zoffset, reshape, roundtrip):
     assert spy_from_crs.call_count == call_count
     assert spy_transform.call_count == call_count
     assert result.shape == shape
+
+
+@pytest.mark.parametrize("name", ["workers", "chunk_size"])
+@pytest.mark.parametrize("value", [0, -1, 1.5, True])
+def test_chunking_fail(name, value):
+    """Test trap of invalid workers and chunk size."""
+    data = np.arange(10, dtype=float)
+    emsg = f"Cannot transform points, '{name}' requires a positive integer"
+    with pytest.raises(ValueError, match=emsg):
+        _ = transform_points(
+            src_crs=WGS84, tgt_crs="+proj=eqc", xs=data, ys=data, **{name: value}
+        )
+
+
+@pytest.mark.parametrize("zs", [None, 100.0])
+@pytest.mark.parametrize("workers", [1, 4])
+@pytest.mark.parametrize("chunk_size", [1, 3, 10, 100])
+def test_chunked(zs, workers, chunk_size):
+    """Test chunked and threaded transformation matches serial transformation."""
+    xs = np.linspace(-180, 180, num=(size := 10))
+    ys = np.linspace(-90, 90, num=size)
+    if zs is not None:
+        zs = np.full(size, zs)
+    expected = transform_points(
+        src_crs=WGS84, tgt_crs="+proj=robin", xs=xs, ys=ys, zs=zs
+    )
+    result = transform_points(
+        src_crs=WGS84,
+        tgt_crs="+proj=robin",
+        xs=xs,
+        ys=ys,
+        zs=zs,
+        workers=workers,
+        chunk_size=chunk_size,
+    )
+    np.testing.assert_array_equal(result, expected)
+
+
+def test_chunked_trap():
+    """Test an erroneous point in a worker chunk is raised."""
+    xs = np.arange(size := 10, dtype=float)
+    ys = np.zeros(size)
+    ys[-1] = 100
+    with pytest.raises(ProjError):
+        _ = transform_points(
+            src_crs=WGS84, tgt_crs="+proj=robin", xs=xs, ys=ys, workers=2, chunk_size=2
+        )
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+@pytest.mark.parametrize("reshape", [False, True])
+def test_out(dtype, reshape):
+    """Test transformation into a preallocated array."""
+    xs = np.linspace(-180, 180, num=(size := 10))
+    ys = np.linspace(-90, 90, num=size)
+    expected = transform_points(src_crs=WGS84, tgt_crs="+proj=eqc", xs=xs, ys=ys)
+    if reshape:
+        xs, ys = xs.reshape(2, 5), ys.reshape(2, 5)
+    out = np.full((size, 3), np.nan, dtype=dtype)
+    result = transform_points(
+        src_crs=WGS84, tgt_crs="+proj=eqc", xs=xs, ys=ys, out=out, chunk_size=3
+    )
+    assert np.shares_memory(result, out)
+    assert result.shape == ((2, 5, 3) if reshape else (size, 3))
+    np.testing.assert_allclose(out, expected.astype(dtype))
+
+
+def test_out_inplace():
+    """Test transformation of points in-place."""
+    xs = np.linspace(-180, 180, num=(size := 10))
+    ys = np.linspace(-90, 90, num=size)
+    points = np.vstack([xs, ys, np.ones(size)]).T
+    expected = transform_points(src_crs=WGS84, tgt_crs="+proj=eqc", xs=xs, ys=ys)
+    result = transform_points(
+        src_crs=WGS84,
+        tgt_crs="+proj=eqc",
+        xs=points[:, 0],
+        ys=points[:, 1],
+        out=points,
+        workers=2,
+        chunk_size=4,
+    )
+    assert result is points
+    np.testing.assert_array_equal(points, expected)
+
+
+def test_out_shape_fail():
+    """Test trap of a preallocated array with an incompatible shape."""
+    data = np.arange(10, dtype=float)
+    out = np.empty((5, 3))
+    emsg = r"Cannot transform points, 'out' requires shape \(10, 3\), got \(5, 3\)"
+    with pytest.raises(ValueError, match=emsg):
+        _ = transform_points(src_crs=WGS84, tgt_crs=WGS84, xs=data, ys=data, out=out)